@@ -0,0 +1,187 @@
+import argparse
+import ctypes as ct
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import oqs
+
+from algorithms.kem.base import KemBenchmark
+from algorithms.signature.base import SignatureBenchmark
+from analysis.perftest import collect_samples
+from analysis.profiling import PROFILE_DIR, harness_overhead, profile_benchmark
+
+
+class EntryPoint:
+    def __init__(self, name, wrapper, native=None, inputs=(), outputs=()):
+        self.name = name
+        self.wrapper = wrapper
+        self.native = native
+        # rozmiary buforów, które wrapper kopiuje na wejściu (bytes -> ctypes) i na wyjściu (ctypes -> bytes)
+        self.inputs = inputs
+        self.outputs = outputs
+
+    def copy_baseline(self):
+        sources = [bytes(size) for size in self.inputs]
+
+        def copy():
+            for data in sources:
+                ct.create_string_buffer(data, len(data))
+            for size in self.outputs:
+                bytes(ct.create_string_buffer(size))
+        return copy
+
+
+def kem_entry_points(variant):
+    native = oqs.native()
+    keygen_kem = oqs.KeyEncapsulation(variant)
+    kem = oqs.KeyEncapsulation(variant)
+    public_key = kem.generate_keypair()
+    ciphertext, _ = kem.encap_secret(public_key)
+
+    handle = kem._kem
+    public_key_buffer = ct.create_string_buffer(public_key, kem.length_public_key)
+    secret_key_buffer = ct.create_string_buffer(kem.length_secret_key)
+    ciphertext_buffer = ct.create_string_buffer(ciphertext, kem.length_ciphertext)
+    ciphertext_out = ct.create_string_buffer(kem.length_ciphertext)
+    shared_secret = ct.create_string_buffer(kem.length_shared_secret)
+    scratch_public_key = ct.create_string_buffer(kem.length_public_key)
+
+    return [
+        EntryPoint('generate_keypair', keygen_kem.generate_keypair,
+                   lambda: native.OQS_KEM_keypair(handle, scratch_public_key, secret_key_buffer),
+                   outputs=(kem.length_public_key,)),
+        EntryPoint('export_secret_key', kem.export_secret_key, outputs=(kem.length_secret_key,)),
+        EntryPoint('encap_secret', lambda: kem.encap_secret(public_key),
+                   lambda: native.OQS_KEM_encaps(handle, ciphertext_out, shared_secret, public_key_buffer),
+                   inputs=(kem.length_public_key,), outputs=(kem.length_ciphertext, kem.length_shared_secret)),
+        EntryPoint('decap_secret', lambda: kem.decap_secret(ciphertext),
+                   lambda: native.OQS_KEM_decaps(handle, shared_secret, ciphertext_buffer, kem.secret_key),
+                   inputs=(kem.length_ciphertext,), outputs=(kem.length_shared_secret,)),
+    ]
+
+
+def sig_entry_points(variant, message):
+    native = oqs.native()
+    keygen_signer = oqs.Signature(variant)
+    signer = oqs.Signature(variant)
+    public_key = signer.generate_keypair()
+    signature = signer.sign(message)
+
+    handle = signer._sig
+    public_key_buffer = ct.create_string_buffer(public_key, signer.length_public_key)
+    scratch_public_key = ct.create_string_buffer(signer.length_public_key)
+    scratch_secret_key = ct.create_string_buffer(signer.length_secret_key)
+    message_buffer = ct.create_string_buffer(message, len(message))
+    signature_buffer = ct.create_string_buffer(signature, len(signature))
+    signature_out = ct.create_string_buffer(signer.length_signature)
+    signature_length = ct.c_size_t(signer.length_signature)
+
+    def native_sign():
+        signature_length.value = signer.length_signature
+        return native.OQS_SIG_sign(handle, signature_out, ct.byref(signature_length),
+                                   message_buffer, ct.c_size_t(len(message)), signer.secret_key)
+
+    return [
+        EntryPoint('generate_keypair', keygen_signer.generate_keypair,
+                   lambda: native.OQS_SIG_keypair(handle, scratch_public_key, scratch_secret_key),
+                   outputs=(signer.length_public_key,)),
+        EntryPoint('export_secret_key', signer.export_secret_key, outputs=(signer.length_secret_key,)),
+        EntryPoint('sign', lambda: signer.sign(message), native_sign,
+                   inputs=(len(message),), outputs=(signer.length_signature,)),
+        EntryPoint('verify', lambda: signer.verify(message, signature, public_key),
+                   lambda: native.OQS_SIG_verify(handle, message_buffer, ct.c_size_t(len(message)),
+                                                 signature_buffer, ct.c_size_t(len(signature)), public_key_buffer),
+                   inputs=(len(message), len(signature), signer.length_public_key)),
+    ]
+
+
+def ffi_baseline():
+    # najtańsze możliwe wywołanie liboqs przez ctypes - koszt samego przejścia Python -> C
+    native = oqs.native()
+    buffer = ct.create_string_buffer(1)
+    return lambda: native.OQS_MEM_cleanse(buffer, ct.c_size_t(0))
+
+
+def median_call_ms(operation, samples):
+    # bardzo krótkie wywołania (np. samo przejście przez FFI) mierzone w grupach - patrz collect_samples
+    values, _ = collect_samples(operation, samples=samples)
+    return float(np.median(values))
+
+
+def attribute_overhead(entry_points, iterations=1000, measure=None):
+    measure = measure or (lambda operation: median_call_ms(operation, iterations))
+    harness = harness_overhead(iterations)
+    ffi = measure(ffi_baseline())
+    attribution = {'harness': harness, 'ffi_ms': ffi, 'entry_points': {}}
+
+    for entry in entry_points:
+        wrapper = measure(entry.wrapper)
+        copy = measure(entry.copy_baseline())
+        native = 0.0
+        if entry.native is not None:
+            native = max(measure(entry.native) - ffi, 0.0)
+        total = wrapper + harness['per_iteration_ms']
+        attribution['entry_points'][entry.name] = {
+            'wrapper_ms': wrapper,
+            'native_ms': native,
+            'binding_ms': max(wrapper - native, 0.0),
+            'copy_ms': copy,
+            'harness_ms': harness['per_iteration_ms'],
+            'native_share': native / total if total else 0.0,
+            'binding_share': max(wrapper - native, 0.0) / total if total else 0.0,
+            'harness_share': harness['per_iteration_ms'] / total if total else 0.0
+        }
+    return attribution
+
+
+def create_benchmark(variant, message_length=1024):
+    if variant in oqs.get_enabled_kem_mechanisms():
+        return KemBenchmark(variant)
+    if variant in oqs.get_enabled_sig_mechanisms():
+        return SignatureBenchmark(variant, message_length=message_length)
+    raise ValueError(f"Nieobsługiwany algorytm: {variant}")
+
+
+def binding_report(variant, iterations=1000, message_length=1024):
+    benchmark = create_benchmark(variant, message_length)
+    if isinstance(benchmark, KemBenchmark):
+        entry_points = kem_entry_points(variant)
+    else:
+        entry_points = sig_entry_points(variant, benchmark.message)
+    result = attribute_overhead(entry_points, iterations)
+    result['variant'] = variant
+    result['iterations'] = iterations
+    return benchmark, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Podział czasu operacji na harness Pythona, narzut liboqs-python i kod natywny")
+    parser.add_argument("variants", nargs="+", help="np. Kyber512 Dilithium2")
+    parser.add_argument("--iterations", type=int, default=1000, help="liczba wywołań na punkt wejścia")
+    parser.add_argument("--profile", choices=['cprofile', 'sampling'], help="dodatkowo profiluj pełny przebieg benchmarku")
+    parser.add_argument("--profile-iterations", type=int, default=1000, help="liczba iteracji profilowanego przebiegu")
+    parser.add_argument("--out", default=PROFILE_DIR, help="katalog wyjściowy")
+    args = parser.parse_args()
+
+    Path(args.out).mkdir(parents=True, exist_ok=True)
+    for variant in args.variants:
+        benchmark, result = binding_report(variant, args.iterations)
+        print(f"{variant} (FFI: {result['ffi_ms'] * 1000:.2f} µs, harness: {result['harness']['per_iteration_ms'] * 1000:.2f} µs)")
+        for name, entry in result['entry_points'].items():
+            print(f"  {name:18} wrapper {entry['wrapper_ms'] * 1000:9.2f} µs | natywnie {entry['native_ms'] * 1000:9.2f} µs"
+                  f" | binding {entry['binding_ms'] * 1000:8.2f} µs (kopie {entry['copy_ms'] * 1000:.2f} µs)"
+                  f" | natywnie {entry['native_share'] * 100:5.1f}%")
+
+        if args.profile:
+            _, path = profile_benchmark(benchmark, args.profile_iterations, mode=args.profile, out_dir=args.out)
+            result['profile'] = path
+            print(f"  profil: {path}")
+
+        with open(os.path.join(args.out, f"binding_{variant}.json"), "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
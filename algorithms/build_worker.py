@@ -0,0 +1,63 @@
+import json
+import os
+import sys
+
+import oqs
+
+from algorithms.kem.base import KemBenchmark
+from algorithms.signature.base import SignatureBenchmark
+from analysis.builds import build_fingerprint
+
+
+def loaded_libraries():
+    # które pliki liboqs faktycznie zostały zmapowane do procesu
+    try:
+        with open("/proc/self/maps") as f:
+            return {os.path.realpath(line.split()[-1]) for line in f if "liboqs" in line and "/" in line}
+    except OSError:
+        return None
+
+
+def run_plan(plan):
+    results = {'kem': [], 'sig': [], 'missing': []}
+    enabled_kems = set(oqs.get_enabled_kem_mechanisms())
+    enabled_sigs = set(oqs.get_enabled_sig_mechanisms())
+
+    for variant in plan['kem']:
+        if variant not in enabled_kems:
+            results['missing'].append(variant)
+            continue
+        benchmark = KemBenchmark(variant)
+        results['kem'].append(benchmark.summarize(benchmark.measure(plan['iterations'])))
+
+    message = bytes.fromhex(plan['message'])
+    for variant in plan['sig']:
+        if variant not in enabled_sigs:
+            results['missing'].append(variant)
+            continue
+        benchmark = SignatureBenchmark(variant, message=message)
+        results['sig'].append(benchmark.summarize(benchmark.measure(plan['sig_iterations'])))
+    return results
+
+
+def main():
+    plan_path, out_path = sys.argv[1:3]
+    with open(plan_path) as f:
+        plan = json.load(f)
+
+    loaded = loaded_libraries()
+    if loaded is not None and os.path.realpath(plan['library']) not in loaded:
+        raise SystemExit(f"Załadowano inną bibliotekę liboqs niż {plan['library']}: {', '.join(sorted(loaded))}")
+
+    fingerprint = build_fingerprint(plan['library'], oqs_version=oqs.oqs_version())
+    results = run_plan(plan)
+    for result in results['kem'] + results['sig']:
+        result['build'] = fingerprint['id']
+        result['build_label'] = plan['label']
+
+    with open(out_path, "w") as f:
+        json.dump(dict(results, label=plan['label'], fingerprint=fingerprint), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
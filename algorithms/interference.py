@@ -0,0 +1,170 @@
+import argparse
+import json
+import multiprocessing
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from queue import Empty
+
+from algorithms.session import benchmark_from_spec, spec_for_variant
+from analysis.interference import allocate_processes, check_operations, interleave, parse_mix, slowdown_rows
+from analysis.stats import SampleStats
+from analysis.topology import PLACEMENTS, CpuTopology
+from report import markdown_table
+
+INTERFERENCE_DIR = "results/interference"
+WARMUP = 20
+BATCH = 4096
+# czas na przygotowanie procesu (generowanie kluczy, rozgrzewka) ponad czas pomiaru
+SETUP_TIMEOUT = 120.0
+
+
+def variant_operations(variant):
+    spec = spec_for_variant(variant, message=b"")
+    return benchmark_from_spec(spec).OPERATIONS
+
+
+def interference_worker(index, spec, operation, cpu, duration, barrier, queue):
+    try:
+        if cpu is not None and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, {cpu})
+        run = benchmark_from_spec(spec).operation_callables()[operation]
+        for _ in range(WARMUP):
+            run()
+    except Exception as e:
+        # pozostałe procesy czekają na barierze - bez abort() czekałyby w nieskończoność
+        barrier.abort()
+        queue.put((index, {'error': f"{spec['variant']} {operation}: {e!r}"}))
+        return
+
+    stats = SampleStats()
+    samples = []
+    # wszystkie procesy startują razem - inaczej część pomiaru odbywałaby się bez konkurencji
+    try:
+        barrier.wait()
+    except threading.BrokenBarrierError:
+        queue.put((index, {'error': "przerwano - inny proces grupy nie wystartował"}))
+        return
+    start = time.perf_counter()
+    deadline = start + duration
+    while True:
+        begin = time.perf_counter()
+        run()
+        end = time.perf_counter()
+        samples.append((end - begin) * 1000)
+        if end >= deadline:
+            break
+        if len(samples) >= BATCH:
+            stats.add_batch(samples)
+            samples = []
+    stats.add_batch(samples)
+    queue.put((index, {'operation': operation, 'cpu': cpu, 'stats': stats.to_dict(),
+                       'count': stats.count, 'elapsed': end - start}))
+
+
+def run_group(assignments, duration):
+    # assignments: [(spec, operacja, cpu)] - jeden przypięty proces na pozycję
+    barrier = multiprocessing.Barrier(len(assignments))
+    queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=interference_worker,
+                                args=(index, spec, operation, cpu, duration, barrier, queue))
+        for index, (spec, operation, cpu) in enumerate(assignments)
+    ]
+    for process in processes:
+        process.start()
+    results = {}
+    deadline = time.monotonic() + duration + SETUP_TIMEOUT
+    try:
+        while len(results) < len(processes):
+            try:
+                index, result = queue.get(timeout=1.0)
+                results[index] = result
+                continue
+            except Empty:
+                pass
+            # proces zakończony błędem bez wyniku (np. segfault w bibliotece natywnej)
+            dead = [index for index, process in enumerate(processes)
+                    if index not in results and process.exitcode not in (None, 0)]
+            if dead:
+                raise RuntimeError(f"Proces {dead[0]} zakończył się kodem {processes[dead[0]].exitcode}")
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Brak wyników po {duration + SETUP_TIMEOUT:.0f} s")
+        errors = [result['error'] for result in results.values() if 'error' in result]
+        if errors:
+            raise RuntimeError("Pomiar interferencji przerwany: " + "; ".join(errors))
+    finally:
+        barrier.abort()
+        for process in processes:
+            if process.is_alive() and len(results) < len(processes):
+                process.terminate()
+            process.join()
+    return [results[index] for index in range(len(assignments))]
+
+
+def run_interference(mix, processes, placement='smt', duration=5.0, topology=None, message_length=1024):
+    check_operations(mix, variant_operations)
+    topology = topology or CpuTopology()
+    message = os.urandom(message_length)
+    specs = {variant: spec_for_variant(variant, message=message) for variant, _, _ in mix}
+    keys = [f"{variant} {operation}" for variant, operation, _ in mix]
+    counts = allocate_processes(mix, processes)
+    cpus = topology.placement(processes, placement)
+
+    # odniesienie: każda operacja sama, na tym samym CPU, na którym zaczyna się mieszanka
+    solo = {}
+    for key, (variant, operation, _) in zip(keys, mix):
+        solo[key] = run_group([(specs[variant], operation, cpus[0])], duration)
+
+    order = interleave(list(zip(keys, mix)), counts)
+    assignments = [(specs[variant], operation, cpu) for (key, (variant, operation, _)), cpu in zip(order, cpus)]
+    mixed = {key: [] for key in keys}
+    for (key, _), worker in zip(order, run_group(assignments, duration)):
+        mixed[key].append(worker)
+
+    header, rows = slowdown_rows(solo, mixed)
+    return {
+        'mix': [{'variant': variant, 'operation': operation, 'weight': weight, 'processes': count}
+                for (variant, operation, weight), count in zip(mix, counts)],
+        'placement': placement,
+        'cpus': cpus,
+        'duration': duration,
+        'solo': solo,
+        'mixed': mixed,
+        'slowdown': {'header': header, 'rows': rows}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Interferencja równoległych operacji PQC na przypiętych procesach")
+    parser.add_argument("--mix", default="Kyber768:decap=50,Dilithium3:verify=30,Falcon-512:sign=20",
+                        help="mieszanka wariant:operacja=waga, rozdzielona przecinkami")
+    parser.add_argument("--processes", type=int, default=2, help="liczba równoległych procesów")
+    parser.add_argument("--placement", choices=PLACEMENTS, default='smt',
+                        help="smt: wątki jednego rdzenia, l3: rdzenie dzielące L3, spread: rozproszone")
+    parser.add_argument("--duration", type=float, default=5.0, help="czas pomiaru w sekundach (solo i mieszanka)")
+    parser.add_argument("--out", help="katalog wyjściowy")
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix, variant_operations)
+    except ValueError as e:
+        parser.error(str(e))
+    result = run_interference(mix, args.processes, args.placement, args.duration)
+    print(f"Rozmieszczenie {result['placement']}, CPU: {', '.join(map(str, result['cpus']))}")
+    if len(set(result['cpus'])) < len(result['cpus']):
+        print("Uwaga: więcej procesów niż CPU w tym rozmieszczeniu - część procesów dzieli ten sam wątek")
+    print(markdown_table(result['slowdown']['header'], result['slowdown']['rows']))
+
+    out_dir = args.out or os.path.join(INTERFERENCE_DIR, datetime.now().strftime("%Y%m%d-%H%M%S"))
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    path = os.path.join(out_dir, f"interference_{args.placement}_{args.processes}.json")
+    with open(path, "w") as f:
+        json.dump(result, f, indent=2)
+    print(f"Wyniki: {path}")
+
+
+if __name__ == "__main__":
+    main()
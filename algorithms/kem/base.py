@@ -0,0 +1,106 @@
+import time
+from oqs import KeyEncapsulation
+
+from analysis.energy import primary_domain
+from analysis.stats import RunningStats, SampleStats
+
+
+class KemBenchmark:
+    OPERATIONS = ('keygen', 'encap', 'decap')
+    SIZES = ('secret_key', 'public_key', 'ciphertext')
+    PROGRESS_INTERVAL = 0.05
+
+    def __init__(self, variant):
+        self.variant = variant
+
+    def create_kem(self):
+        return KeyEncapsulation(self.variant)
+
+    def new_metrics(self):
+        metrics = {op: SampleStats() for op in self.OPERATIONS}
+        metrics.update({size: RunningStats() for size in self.SIZES})
+        return metrics
+
+    def measure(self, iterations, metrics=None, progress=None):
+        if metrics is None:
+            metrics = self.new_metrics()
+        kem = self.create_kem()
+        next_progress = 0.0
+
+        for i in range(iterations):
+            start = time.perf_counter()
+            public_key = kem.generate_keypair()
+            secret_key = kem.export_secret_key()
+            metrics['keygen'].add((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            ciphertext, shared_secret = kem.encap_secret(public_key)
+            metrics['encap'].add((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            _ = kem.decap_secret(ciphertext)
+            metrics['decap'].add((time.perf_counter() - start) * 1000)
+
+            metrics['secret_key'].add(len(secret_key))
+            metrics['public_key'].add(len(public_key))
+            metrics['ciphertext'].add(len(ciphertext))
+
+            # postęp raportowany co PROGRESS_INTERVAL, poza mierzonymi odcinkami
+            if progress is not None:
+                now = time.perf_counter()
+                if now >= next_progress or i == iterations - 1:
+                    progress(metrics, i + 1)
+                    next_progress = now + self.PROGRESS_INTERVAL
+
+        return metrics
+
+    def summarize(self, metrics):
+        return {
+            'variant': self.variant,
+            'time_avg': {op: metrics[op].mean for op in self.OPERATIONS},
+            'time_stats': {op: metrics[op].summary() for op in self.OPERATIONS},
+            'size_avg': {size: metrics[size].mean for size in self.SIZES}
+        }
+
+    def merge_metrics(self, metrics, other):
+        for key in self.OPERATIONS + self.SIZES:
+            metrics[key].merge(other[key])
+        return metrics
+
+    def metrics_to_dict(self, metrics):
+        return {key: metrics[key].to_dict() for key in self.OPERATIONS + self.SIZES}
+
+    def metrics_from_dict(self, data):
+        metrics = {op: SampleStats.from_dict(data[op]) for op in self.OPERATIONS}
+        metrics.update({size: RunningStats.from_dict(data[size]) for size in self.SIZES})
+        return metrics
+
+    def spec(self):
+        return {'kind': 'kem', 'variant': self.variant}
+
+    def operation_callables(self):
+        # osobny obiekt do keygen, żeby nie podmieniać klucza prywatnego używanego przy dekapsulacji
+        keygen_kem = self.create_kem()
+        kem = self.create_kem()
+        public_key = kem.generate_keypair()
+        ciphertext, _ = kem.encap_secret(public_key)
+        return {
+            'keygen': keygen_kem.generate_keypair,
+            'encap': lambda: kem.encap_secret(public_key),
+            'decap': lambda: kem.decap_secret(ciphertext)
+        }
+
+    def measure_energy(self, meter):
+        operations = self.operation_callables()
+        return {op: meter.measure(operations[op]) for op in self.OPERATIONS}
+
+    def add_energy(self, result, domains):
+        result['energy_avg'] = {op: primary_domain(domains[op]) for op in self.OPERATIONS}
+        result['energy_domains'] = domains
+        return result
+
+    def run_benchmark(self, iterations=100, progress=None, energy_meter=None):
+        result = self.summarize(self.measure(iterations, progress=progress))
+        if energy_meter is not None and energy_meter.available():
+            self.add_energy(result, self.measure_energy(energy_meter))
+        return result
@@ -0,0 +1,79 @@
+from cryptography.hazmat.primitives.asymmetric import ec, x25519
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+from algorithms.kem.base import KemBenchmark
+
+
+class X25519Kem:
+    # ECDH jako KEM (ephemeral-static): szyfrogram to efemeryczny klucz publiczny nadawcy
+    def __init__(self):
+        self.private_key = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def generate_keypair(self):
+        self.private_key = x25519.X25519PrivateKey.generate()
+        return self.private_key.public_key().public_bytes_raw()
+
+    def export_secret_key(self):
+        return self.private_key.private_bytes_raw()
+
+    def encap_secret(self, public_key):
+        ephemeral = x25519.X25519PrivateKey.generate()
+        shared_secret = ephemeral.exchange(x25519.X25519PublicKey.from_public_bytes(public_key))
+        return ephemeral.public_key().public_bytes_raw(), shared_secret
+
+    def decap_secret(self, ciphertext):
+        return self.private_key.exchange(x25519.X25519PublicKey.from_public_bytes(ciphertext))
+
+
+class EcdhKem:
+    def __init__(self, curve):
+        self.curve = curve
+        self.private_key = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def encode(self, public_key):
+        return public_key.public_bytes(Encoding.X962, PublicFormat.UncompressedPoint)
+
+    def generate_keypair(self):
+        self.private_key = ec.generate_private_key(self.curve)
+        return self.encode(self.private_key.public_key())
+
+    def export_secret_key(self):
+        return self.private_key.private_numbers().private_value.to_bytes((self.curve.key_size + 7) // 8, 'big')
+
+    def encap_secret(self, public_key):
+        ephemeral = ec.generate_private_key(self.curve)
+        peer = ec.EllipticCurvePublicKey.from_encoded_point(self.curve, public_key)
+        return self.encode(ephemeral.public_key()), ephemeral.exchange(ec.ECDH(), peer)
+
+    def decap_secret(self, ciphertext):
+        peer = ec.EllipticCurvePublicKey.from_encoded_point(self.curve, ciphertext)
+        return self.private_key.exchange(ec.ECDH(), peer)
+
+
+CLASSICAL_KEMS = {
+    "X25519": X25519Kem,
+    "ECDH-P256": lambda: EcdhKem(ec.SECP256R1()),
+    "ECDH-P384": lambda: EcdhKem(ec.SECP384R1())
+}
+
+
+class ClassicalKemBenchmark(KemBenchmark):
+    def __init__(self, variant="X25519"):
+        if variant not in CLASSICAL_KEMS:
+            raise ValueError(f"Nieobsługiwany klasyczny KEM: {variant}")
+        super().__init__(variant)
+
+    def create_kem(self):
+        return CLASSICAL_KEMS[self.variant]()
@@ -0,0 +1,53 @@
+import hashlib
+
+from oqs import KeyEncapsulation
+
+from algorithms.kem.base import KemBenchmark
+from algorithms.kem.classical import CLASSICAL_KEMS
+
+
+class HybridKem:
+    # klucze i szyfrogramy sklejone (klasyczny || PQ), wspólny sekret z SHA3-256 po obu sekretach i szyfrogramie
+    def __init__(self, classical, post_quantum):
+        self.classical = CLASSICAL_KEMS[classical]()
+        self.post_quantum = KeyEncapsulation(post_quantum)
+        self.split = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.post_quantum.free()
+
+    def generate_keypair(self):
+        classical_public = self.classical.generate_keypair()
+        self.split = len(classical_public)
+        return classical_public + self.post_quantum.generate_keypair()
+
+    def export_secret_key(self):
+        return self.classical.export_secret_key() + self.post_quantum.export_secret_key()
+
+    def combine(self, classical_secret, post_quantum_secret, ciphertext):
+        return hashlib.sha3_256(classical_secret + post_quantum_secret + ciphertext).digest()
+
+    def encap_secret(self, public_key):
+        classical_ciphertext, classical_secret = self.classical.encap_secret(public_key[:self.split])
+        post_quantum_ciphertext, post_quantum_secret = self.post_quantum.encap_secret(public_key[self.split:])
+        ciphertext = classical_ciphertext + post_quantum_ciphertext
+        return ciphertext, self.combine(classical_secret, post_quantum_secret, ciphertext)
+
+    def decap_secret(self, ciphertext):
+        classical_secret = self.classical.decap_secret(ciphertext[:self.split])
+        post_quantum_secret = self.post_quantum.decap_secret(ciphertext[self.split:])
+        return self.combine(classical_secret, post_quantum_secret, ciphertext)
+
+
+class HybridKemBenchmark(KemBenchmark):
+    def __init__(self, variant="X25519+Kyber768"):
+        self.classical, self.post_quantum = variant.split("+", 1)
+        if self.classical not in CLASSICAL_KEMS:
+            raise ValueError(f"Nieobsługiwany klasyczny KEM: {self.classical}")
+        super().__init__(variant)
+
+    def create_kem(self):
+        return HybridKem(self.classical, self.post_quantum)
@@ -0,0 +1,46 @@
+import os
+from oqs import KeyEncapsulation, Signature
+
+
+class KemDecapTarget:
+    operation_name = 'decap'
+
+    def __init__(self, variant):
+        self.variant = variant
+        self.kem = KeyEncapsulation(variant)
+        public_key = self.kem.generate_keypair()
+        self.valid_ciphertext, _ = self.kem.encap_secret(public_key)
+        self.ciphertext_length = len(self.valid_ciphertext)
+
+    def prepare_inputs(self, classes):
+        # klasa 0: poprawny szyfrogram, klasa 1: losowe bajty tej samej długości
+        return [self.valid_ciphertext if cls == 0 else os.urandom(self.ciphertext_length) for cls in classes]
+
+    def operation(self, ciphertext):
+        self.kem.decap_secret(ciphertext)
+
+
+class SignTarget:
+    operation_name = 'sign'
+
+    def __init__(self, variant, message_length=1024):
+        self.variant = variant
+        self.signer = Signature(variant)
+        self.signer.generate_keypair()
+        self.message_length = message_length
+        self.fixed_message = os.urandom(message_length)
+
+    def prepare_inputs(self, classes):
+        # klasa 0: stała wiadomość, klasa 1: losowa wiadomość tej samej długości
+        return [self.fixed_message if cls == 0 else os.urandom(self.message_length) for cls in classes]
+
+    def operation(self, message):
+        self.signer.sign(message)
+
+
+def create_target(variant, message_length=1024):
+    if variant.startswith("Kyber") or variant.startswith("BIKE"):
+        return KemDecapTarget(variant)
+    if variant.startswith("Dilithium") or variant.startswith("Falcon"):
+        return SignTarget(variant, message_length=message_length)
+    raise ValueError(f"Nieobsługiwany algorytm: {variant}")
@@ -0,0 +1,155 @@
+import ctypes as ct
+import hashlib
+import time
+from contextlib import contextmanager
+
+import oqs
+from oqs import rand
+
+from analysis.stats import SampleStats
+
+RNG_SOURCES = ('system', 'OpenSSL', 'deterministic')
+DEFAULT_SEED = b"pqc-benchmark"
+
+RANDOMBYTES_CALLBACK = ct.CFUNCTYPE(None, ct.POINTER(ct.c_uint8), ct.c_size_t)
+
+
+class DeterministicRandom:
+    # SHAKE-256 w trybie licznikowym: ten sam seed daje te same klucze, szyfrogramy i podpisy
+    def __init__(self, seed=DEFAULT_SEED):
+        self.seed = seed
+        self.counter = 0
+        self.calls = 0
+        self.bytes = 0
+        self.time = 0.0
+        self.callback = RANDOMBYTES_CALLBACK(self.fill)
+
+    def fill(self, buffer, length):
+        start = time.perf_counter()
+        data = hashlib.shake_256(self.seed + self.counter.to_bytes(8, 'little')).digest(length)
+        ct.memmove(buffer, data, length)
+        self.counter += 1
+        self.calls += 1
+        self.bytes += length
+        self.time += time.perf_counter() - start
+
+    def snapshot(self):
+        return self.calls, self.bytes, self.time
+
+    def install(self):
+        oqs.native().OQS_randombytes_custom_algorithm(self.callback)
+
+
+@contextmanager
+def rng_source(name, seed=DEFAULT_SEED):
+    source = None
+    if name == 'deterministic':
+        source = DeterministicRandom(seed)
+        source.install()
+    else:
+        rand.randombytes_switch_algorithm(name)
+    try:
+        yield source
+    finally:
+        rand.randombytes_switch_algorithm('system')
+
+
+def randombytes_cost(length, repeats=10000):
+    # koszt jednego wywołania OQS_randombytes aktualnie wybranego źródła, w ms
+    buffer = ct.create_string_buffer(max(length, 1))
+    native = oqs.native()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        native.OQS_randombytes(buffer, ct.c_size_t(length))
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def output_digest(value, digest):
+    if isinstance(value, tuple):
+        for item in value:
+            output_digest(item, digest)
+    elif isinstance(value, (bytes, bytearray)):
+        digest.update(value)
+    else:
+        digest.update(repr(value).encode())
+
+
+def measure_with_source(benchmark, name, iterations, seed=DEFAULT_SEED):
+    results = {}
+    with rng_source(name, seed) as source:
+        operations = benchmark.operation_callables()
+        for op in benchmark.OPERATIONS:
+            operation = operations[op]
+            stats = SampleStats()
+            digest = hashlib.sha256()
+            before = source.snapshot() if source else None
+
+            for _ in range(iterations):
+                start = time.perf_counter()
+                value = operation()
+                stats.add((time.perf_counter() - start) * 1000)
+                output_digest(value, digest)
+
+            summary = stats.summary()
+            if source is not None:
+                calls, size, callback_time = (after - prior for after, prior in zip(source.snapshot(), before))
+                summary['rng_calls_per_op'] = calls / iterations
+                summary['rng_bytes_per_op'] = size / iterations
+                summary['rng_callback_ms'] = callback_time * 1000 / iterations
+                summary['output_digest'] = digest.hexdigest()
+            results[op] = summary
+    return results
+
+
+def direct_randombytes_cost(name, length):
+    with rng_source(name):
+        return randombytes_cost(length)
+
+
+def rng_overhead(per_source, operations, direct_cost):
+    # wszędzie średnie: czas w callbacku to średnia na operację, więc odejmujemy go od średniego czasu operacji
+    deterministic = per_source['deterministic']
+    overhead = {}
+    for op in operations:
+        det = deterministic[op]
+        # czas samej arytmetyki: przebieg deterministyczny minus czas spędzony w callbacku RNG
+        arithmetic = det['mean'] - det['rng_callback_ms']
+        calls = det['rng_calls_per_op']
+        bytes_per_call = det['rng_bytes_per_op'] / calls if calls else 0
+        overhead[op] = {'arithmetic_ms': arithmetic, 'rng_calls_per_op': calls,
+                        'rng_bytes_per_op': det['rng_bytes_per_op']}
+        for name, stats in per_source.items():
+            if name == 'deterministic':
+                continue
+            mean = stats[op]['mean']
+            overhead[op][name] = {
+                'measured_ms': mean - arithmetic,
+                'direct_ms': direct_cost(name, int(bytes_per_call)) * calls if calls else 0.0,
+                'share': (mean - arithmetic) / mean if mean else 0.0
+            }
+    return overhead
+
+
+def run_rng_comparison(benchmark, iterations=1000, sources=RNG_SOURCES, seed=DEFAULT_SEED):
+    variant = getattr(benchmark, 'variant', None) or benchmark.algorithm_name
+    per_source = {}
+    skipped = {}
+    for name in sources:
+        try:
+            per_source[name] = measure_with_source(benchmark, name, iterations, seed)
+        except RuntimeError as e:
+            # np. liboqs zbudowany bez OpenSSL
+            skipped[name] = str(e)
+
+    overhead = {}
+    if 'deterministic' in per_source:
+        overhead = rng_overhead(per_source, benchmark.OPERATIONS, direct_randombytes_cost)
+
+    return {
+        'variant': variant,
+        'iterations': iterations,
+        'seed': seed.hex(),
+        'sources': per_source,
+        'skipped': skipped,
+        'rng_overhead': overhead
+    }
@@ -0,0 +1,57 @@
+import os
+
+import oqs
+
+from algorithms.kem.base import KemBenchmark
+from algorithms.kem.classical import CLASSICAL_KEMS, ClassicalKemBenchmark
+from algorithms.kem.hybrid import HybridKemBenchmark
+from algorithms.signature.base import SignatureBenchmark
+from algorithms.signature.classical import CLASSICAL_SIGNATURES, ClassicalSignatureBenchmark
+from algorithms.signature.hybrid import HybridSignatureBenchmark
+from analysis.session import SESSION_DIR, BenchmarkSession
+
+# liczba iteracji w jednej jednostce pracy - tyle najwyżej tracimy po awarii
+UNIT_ITERATIONS = {'kem': 200, 'sig': 50}
+
+
+def benchmark_from_spec(spec):
+    variant = spec['variant']
+    if spec['kind'] == 'kem':
+        if variant in CLASSICAL_KEMS:
+            return ClassicalKemBenchmark(variant)
+        if "+" in variant:
+            return HybridKemBenchmark(variant)
+        return KemBenchmark(variant)
+    if spec['kind'] == 'sig':
+        message = bytes.fromhex(spec['message'])
+        if variant in CLASSICAL_SIGNATURES:
+            return ClassicalSignatureBenchmark(variant, message=message)
+        if "+" in variant:
+            return HybridSignatureBenchmark(variant, message=message)
+        return SignatureBenchmark(variant, message=message)
+    raise ValueError(f"Nieznany rodzaj benchmarku: {spec['kind']}")
+
+
+def spec_for_variant(variant, message=None, message_length=1024):
+    # rodzaj benchmarku po nazwie wariantu; hybrydy rozpoznajemy po części klasycznej
+    name = variant.split("+", 1)[0]
+    if name in CLASSICAL_KEMS or name in oqs.get_enabled_kem_mechanisms():
+        return {'kind': 'kem', 'variant': variant}
+    if name in CLASSICAL_SIGNATURES or name in oqs.get_enabled_sig_mechanisms():
+        message = message if message is not None else os.urandom(message_length)
+        return {'kind': 'sig', 'variant': variant, 'message': message.hex()}
+    raise ValueError(f"Nieobsługiwany algorytm: {variant}")
+
+
+def new_session(kind, benchmarks, iterations, unit_iterations=None, message_size=None, session_dir=SESSION_DIR,
+                workers=1):
+    return BenchmarkSession.create(kind, [benchmark.spec() for benchmark in benchmarks], iterations,
+                                   benchmark_from_spec, unit_iterations or UNIT_ITERATIONS[kind],
+                                   message_size=message_size, session_dir=session_dir, workers=workers)
+
+
+def latest_unfinished(kind, session_dir=SESSION_DIR):
+    paths = BenchmarkSession.unfinished(kind, session_dir)
+    if not paths:
+        return None
+    return BenchmarkSession.load(paths[-1], benchmark_from_spec)
@@ -0,0 +1,127 @@
+import oqs
+import time
+import random
+import string
+
+from analysis.energy import primary_domain
+from analysis.stats import SampleStats
+
+
+class SignatureBenchmark:
+    OPERATIONS = ('keygen', 'sign', 'verify')
+    PROGRESS_INTERVAL = 0.05
+
+    def __init__(self, variant, message_length=1024, message=None):
+        self.algorithm_name = variant
+        if message is None:
+            self.message = self.generate_random_message(message_length)
+        else:
+            if isinstance(message, str):
+                message = message.encode()
+            self.message = message
+
+    def generate_random_message(self, length):
+        return ''.join(random.choices(string.ascii_letters + string.digits, k=length)).encode()
+
+    def create_signer(self):
+        return oqs.Signature(self.algorithm_name)
+
+    def new_metrics(self):
+        metrics = {op: SampleStats() for op in self.OPERATIONS}
+        metrics['sizes'] = {}
+        return metrics
+
+    def measure(self, iterations, metrics=None, progress=None):
+        if metrics is None:
+            metrics = self.new_metrics()
+        next_progress = 0.0
+
+        with self.create_signer() as signer:
+            start = time.perf_counter()
+            public_key = signer.generate_keypair()
+            metrics['keygen'].add((time.perf_counter() - start) * 1000)
+
+            private_key = signer.export_secret_key()
+
+            # weryfikacja zaraz po podpisie - nie trzymamy wszystkich podpisów w pamięci
+            for i in range(iterations):
+                start = time.perf_counter()
+                signature = signer.sign(self.message)
+                metrics['sign'].add((time.perf_counter() - start) * 1000)
+
+                start = time.perf_counter()
+                valid = signer.verify(self.message, signature, public_key)
+                metrics['verify'].add((time.perf_counter() - start) * 1000)
+
+                if progress is not None:
+                    now = time.perf_counter()
+                    if now >= next_progress or i == iterations - 1:
+                        progress(metrics, i + 1)
+                        next_progress = now + self.PROGRESS_INTERVAL
+
+            metrics['sizes'] = {
+                'public_key_size': len(public_key),
+                'private_key_size': len(private_key),
+                'signature_size': len(signature),
+                'message_size': len(self.message)
+            }
+        return metrics
+
+    def summarize(self, metrics):
+        result = {
+            'algorithm': self.algorithm_name,
+            'keygen_time_ms': metrics['keygen'].mean,
+            'avg_sign_time_ms': metrics['sign'].mean,
+            'avg_verify_time_ms': metrics['verify'].mean,
+            'time_stats': {op: metrics[op].summary() for op in self.OPERATIONS}
+        }
+        result.update(metrics['sizes'])
+        return result
+
+    def merge_metrics(self, metrics, other):
+        for op in self.OPERATIONS:
+            metrics[op].merge(other[op])
+        metrics['sizes'] = metrics['sizes'] or dict(other['sizes'])
+        return metrics
+
+    def metrics_to_dict(self, metrics):
+        data = {op: metrics[op].to_dict() for op in self.OPERATIONS}
+        data['sizes'] = dict(metrics['sizes'])
+        return data
+
+    def metrics_from_dict(self, data):
+        metrics = {op: SampleStats.from_dict(data[op]) for op in self.OPERATIONS}
+        metrics['sizes'] = dict(data['sizes'])
+        return metrics
+
+    def spec(self):
+        return {'kind': 'sig', 'variant': self.algorithm_name, 'message': self.message.hex()}
+
+    def operation_callables(self):
+        # osobny obiekt do keygen, żeby nie podmieniać klucza prywatnego używanego przy podpisie
+        keygen_signer = self.create_signer()
+        signer = self.create_signer()
+        public_key = signer.generate_keypair()
+        signature = signer.sign(self.message)
+        return {
+            'keygen': keygen_signer.generate_keypair,
+            'sign': lambda: signer.sign(self.message),
+            'verify': lambda: signer.verify(self.message, signature, public_key)
+        }
+
+    def measure_energy(self, meter):
+        operations = self.operation_callables()
+        return {op: meter.measure(operations[op]) for op in self.OPERATIONS}
+
+    def add_energy(self, result, domains):
+        for op in self.OPERATIONS:
+            result[f'{op}_energy_uj'] = primary_domain(domains[op])
+        result['energy_domains'] = domains
+        return result
+
+    def run_benchmark(self, iterations=10, progress=None, energy_meter=None):
+        print(self.message)
+        result = self.summarize(self.measure(iterations, progress=progress))
+        if energy_meter is not None and energy_meter.available():
+            self.add_energy(result, self.measure_energy(energy_meter))
+        return [result]
@@ -0,0 +1,155 @@
+from abc import ABC, abstractmethod
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, padding, rsa
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+from algorithms.signature.base import SignatureBenchmark
+
+
+class ClassicalSigner(ABC):
+    # klucze w surowej postaci (bez DER), jak w liboqs i klasycznych KEM - rozmiary są porównywalne
+    def __init__(self):
+        self.private_key = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    @abstractmethod
+    def generate_private_key(self):
+        pass
+
+    @abstractmethod
+    def encode_public_key(self, public_key):
+        pass
+
+    @abstractmethod
+    def decode_public_key(self, data):
+        pass
+
+    @abstractmethod
+    def encode_private_key(self, private_key):
+        pass
+
+    @abstractmethod
+    def sign(self, message):
+        pass
+
+    @abstractmethod
+    def verify_with(self, public_key, message, signature):
+        pass
+
+    def generate_keypair(self):
+        self.private_key = self.generate_private_key()
+        return self.encode_public_key(self.private_key.public_key())
+
+    def export_secret_key(self):
+        return self.encode_private_key(self.private_key)
+
+    def verify(self, message, signature, public_key):
+        # klucz publiczny wczytywany przy każdej weryfikacji - tak jak w liboqs-python
+        try:
+            self.verify_with(self.decode_public_key(public_key), message, signature)
+        except InvalidSignature:
+            return False
+        return True
+
+
+class Ed25519Signer(ClassicalSigner):
+    def generate_private_key(self):
+        return ed25519.Ed25519PrivateKey.generate()
+
+    def encode_public_key(self, public_key):
+        return public_key.public_bytes_raw()
+
+    def decode_public_key(self, data):
+        return ed25519.Ed25519PublicKey.from_public_bytes(data)
+
+    def encode_private_key(self, private_key):
+        return private_key.private_bytes_raw()
+
+    def sign(self, message):
+        return self.private_key.sign(message)
+
+    def verify_with(self, public_key, message, signature):
+        public_key.verify(signature, message)
+
+
+class EcdsaSigner(ClassicalSigner):
+    def __init__(self, curve, algorithm):
+        super().__init__()
+        self.curve = curve
+        self.algorithm = algorithm
+
+    def generate_private_key(self):
+        return ec.generate_private_key(self.curve)
+
+    def encode_public_key(self, public_key):
+        # nieskompresowany punkt X9.62, skalar prywatny o stałej długości - jak w EcdhKem
+        return public_key.public_bytes(Encoding.X962, PublicFormat.UncompressedPoint)
+
+    def decode_public_key(self, data):
+        return ec.EllipticCurvePublicKey.from_encoded_point(self.curve, data)
+
+    def encode_private_key(self, private_key):
+        return private_key.private_numbers().private_value.to_bytes((self.curve.key_size + 7) // 8, 'big')
+
+    def sign(self, message):
+        return self.private_key.sign(message, ec.ECDSA(self.algorithm))
+
+    def verify_with(self, public_key, message, signature):
+        public_key.verify(signature, message, ec.ECDSA(self.algorithm))
+
+
+class RsaPssSigner(ClassicalSigner):
+    PUBLIC_EXPONENT = 65537
+
+    def __init__(self, key_size):
+        super().__init__()
+        self.key_size = key_size
+        self.padding = padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.DIGEST_LENGTH)
+
+    def generate_private_key(self):
+        return rsa.generate_private_key(public_exponent=self.PUBLIC_EXPONENT, key_size=self.key_size)
+
+    def encode_public_key(self, public_key):
+        # sam moduł n - wykładnik publiczny jest stały
+        return public_key.public_numbers().n.to_bytes(self.key_size // 8, 'big')
+
+    def decode_public_key(self, data):
+        return rsa.RSAPublicNumbers(self.PUBLIC_EXPONENT, int.from_bytes(data, 'big')).public_key()
+
+    def encode_private_key(self, private_key):
+        # czynniki p i q (po key_size / 2 bitów) - z nich i e wynika cała reszta klucza
+        numbers = private_key.private_numbers()
+        half = self.key_size // 16
+        return numbers.p.to_bytes(half, 'big') + numbers.q.to_bytes(half, 'big')
+
+    def sign(self, message):
+        return self.private_key.sign(message, self.padding, hashes.SHA256())
+
+    def verify_with(self, public_key, message, signature):
+        public_key.verify(signature, message, self.padding, hashes.SHA256())
+
+
+CLASSICAL_SIGNATURES = {
+    "Ed25519": Ed25519Signer,
+    "ECDSA-P256": lambda: EcdsaSigner(ec.SECP256R1(), hashes.SHA256()),
+    "ECDSA-P384": lambda: EcdsaSigner(ec.SECP384R1(), hashes.SHA384()),
+    "RSA-2048": lambda: RsaPssSigner(2048),
+    "RSA-3072": lambda: RsaPssSigner(3072)
+}
+
+
+class ClassicalSignatureBenchmark(SignatureBenchmark):
+    def __init__(self, variant="Ed25519", message_length=1024, message=None):
+        if variant not in CLASSICAL_SIGNATURES:
+            raise ValueError(f"Nieobsługiwany klasyczny algorytm podpisu: {variant}")
+        super().__init__(variant, message_length=message_length, message=message)
+
+    def create_signer(self):
+        return CLASSICAL_SIGNATURES[self.algorithm_name]()
@@ -0,0 +1,48 @@
+import oqs
+
+from algorithms.signature.base import SignatureBenchmark
+from algorithms.signature.classical import CLASSICAL_SIGNATURES
+
+
+class HybridSigner:
+    # podpis złożony: oba podpisy sklejone, weryfikacja wymaga poprawności obu
+    def __init__(self, classical, post_quantum):
+        self.classical = CLASSICAL_SIGNATURES[classical]()
+        self.post_quantum = oqs.Signature(post_quantum)
+        self.key_split = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.post_quantum.free()
+
+    def generate_keypair(self):
+        classical_public = self.classical.generate_keypair()
+        self.key_split = len(classical_public)
+        return classical_public + self.post_quantum.generate_keypair()
+
+    def export_secret_key(self):
+        return self.classical.export_secret_key() + self.post_quantum.export_secret_key()
+
+    def sign(self, message):
+        classical_signature = self.classical.sign(message)
+        # długość podpisu klasycznego (2 bajty) na początku - podpisy ECDSA mają zmienną długość
+        return len(classical_signature).to_bytes(2, 'big') + classical_signature + self.post_quantum.sign(message)
+
+    def verify(self, message, signature, public_key):
+        split = int.from_bytes(signature[:2], 'big') + 2
+        classical_valid = self.classical.verify(message, signature[2:split], public_key[:self.key_split])
+        post_quantum_valid = self.post_quantum.verify(message, signature[split:], public_key[self.key_split:])
+        return classical_valid and post_quantum_valid
+
+
+class HybridSignatureBenchmark(SignatureBenchmark):
+    def __init__(self, variant="Ed25519+Dilithium2", message_length=1024, message=None):
+        self.classical, self.post_quantum = variant.split("+", 1)
+        if self.classical not in CLASSICAL_SIGNATURES:
+            raise ValueError(f"Nieobsługiwany klasyczny algorytm podpisu: {self.classical}")
+        super().__init__(variant, message_length=message_length, message=message)
+
+    def create_signer(self):
+        return HybridSigner(self.classical, self.post_quantum)
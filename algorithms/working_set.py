@@ -0,0 +1,227 @@
+import argparse
+import ctypes as ct
+import gc
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import oqs
+
+from analysis.stats import SampleStats
+from analysis.topology import cache_sizes
+from analysis.working_set import (access_order, aligned_buffer, buffer_address, pack_records, record_layout, sweep_rows,
+                                  sweep_sizes)
+from report import csv_text, markdown_table
+
+WORKING_SET_DIR = "results/working_set"
+DEFAULT_TARGETS = ("Kyber768:decap", "BIKE-L1:decap", "Dilithium3:sign", "Falcon-512:sign")
+DEFAULT_OPERATION = {'kem': 'decap', 'sig': 'sign'}
+# unikalne pary kluczy generujemy tylko do tej liczby - dalsze rekordy to kopie w osobnych liniach cache
+DEFAULT_POOL = 1024
+DEFAULT_CALLS = 2000
+MAX_BUFFER_MB = 1024
+
+
+def parse_target(text):
+    variant, _, operation = text.partition(":")
+    if variant in oqs.get_enabled_kem_mechanisms():
+        kind = 'kem'
+    elif variant in oqs.get_enabled_sig_mechanisms():
+        kind = 'sig'
+    else:
+        raise ValueError(f"Nieobsługiwany wariant (tylko algorytmy liboqs): {variant}")
+    return kind, variant, operation or DEFAULT_OPERATION[kind]
+
+
+class KemKeyStore:
+    def __init__(self, variant, operation, pool_size):
+        self.variant = variant
+        self.operation = operation
+        self.kem = oqs.KeyEncapsulation(variant)
+        self.pool = []
+        for _ in range(pool_size):
+            public_key = self.kem.generate_keypair()
+            secret_key = self.kem.export_secret_key()
+            ciphertext, shared_secret = self.kem.encap_secret(public_key)
+            self.pool.append({'public_key': public_key, 'secret_key': secret_key,
+                              'ciphertext': ciphertext, 'shared_secret': shared_secret})
+        lengths = {'public_key': self.kem.length_public_key, 'secret_key': self.kem.length_secret_key,
+                   'ciphertext': self.kem.length_ciphertext}
+        self.offsets, self.record_size = record_layout(operation, lengths)
+        self.ciphertext_out = ct.create_string_buffer(self.kem.length_ciphertext)
+        self.shared_secret = ct.create_string_buffer(self.kem.length_shared_secret)
+
+    def operation_at(self, base):
+        native = oqs.native()
+        handle = self.kem._kem
+        if self.operation == 'encap':
+            public_key = self.offsets['public_key']
+            return lambda address: native.OQS_KEM_encaps(handle, self.ciphertext_out, self.shared_secret,
+                                                         ct.c_void_p(address + public_key))
+        secret_key, ciphertext = self.offsets['secret_key'], self.offsets['ciphertext']
+        return lambda address: native.OQS_KEM_decaps(handle, self.shared_secret, ct.c_void_p(address + ciphertext),
+                                                     ct.c_void_p(address + secret_key))
+
+    def check(self, index):
+        # poprawność układu bufora: dekapsulacja z rekordu musi dać ten sam sekret co enkapsulacja
+        if self.operation == 'decap':
+            expected = self.pool[index % len(self.pool)]['shared_secret']
+            if self.shared_secret.raw[:len(expected)] != expected:
+                raise RuntimeError(f"{self.variant}: dekapsulacja z bufora kluczy dała inny sekret")
+
+
+class SignatureKeyStore:
+    def __init__(self, variant, operation, pool_size, message):
+        self.variant = variant
+        self.operation = operation
+        self.message = message
+        self.signer = oqs.Signature(variant)
+        self.pool = []
+        for _ in range(pool_size):
+            public_key = self.signer.generate_keypair()
+            self.pool.append({'public_key': public_key, 'secret_key': self.signer.export_secret_key(),
+                              'signature': self.signer.sign(message)})
+        lengths = {'public_key': self.signer.length_public_key, 'secret_key': self.signer.length_secret_key,
+                   'signature': self.signer.length_signature}
+        self.offsets, self.record_size = record_layout(operation, lengths)
+        # Falcon ma podpisy zmiennej długości - długość podpisu w rekordzie zależy od klucza z puli
+        self.signature_lengths = [len(entry['signature']) for entry in self.pool]
+        self.message_buffer = ct.create_string_buffer(message, len(message))
+        self.signature_out = ct.create_string_buffer(self.signer.length_signature)
+        self.signature_length = ct.c_size_t(self.signer.length_signature)
+
+    def operation_at(self, base):
+        native = oqs.native()
+        handle = self.signer._sig
+        message_length = ct.c_size_t(len(self.message))
+        if self.operation == 'sign':
+            secret_key = self.offsets['secret_key']
+
+            def sign(address):
+                self.signature_length.value = self.signer.length_signature
+                return native.OQS_SIG_sign(handle, self.signature_out, ct.byref(self.signature_length),
+                                           self.message_buffer, message_length, ct.c_void_p(address + secret_key))
+            return sign
+
+        public_key, signature = self.offsets['public_key'], self.offsets['signature']
+
+        def verify(address):
+            index = (address - base) // self.record_size % len(self.pool)
+            return native.OQS_SIG_verify(handle, self.message_buffer, message_length,
+                                         ct.c_void_p(address + signature), ct.c_size_t(self.signature_lengths[index]),
+                                         ct.c_void_p(address + public_key))
+        return verify
+
+    def check(self, index):
+        pass
+
+
+def measure_point(store, count, calls, seed=0):
+    buffer, start = aligned_buffer(count * store.record_size)
+    pack_records(store.pool, store.offsets, store.record_size, count, buffer, start)
+    # pierwszy rekord od granicy linii cache - inaczej każdy rekord zahaczałby o dodatkową linię
+    base = buffer_address(buffer) + start
+    operation = store.operation_at(base)
+
+    # rozgrzewka to jeden przebieg po kluczach (najwyżej tyle, ile wywołań pomiaru); pomiar kontynuuje
+    # tę samą permutację, więc przy dużym N mierzone klucze nie były wcześniej dotykane
+    warmup = min(count, calls)
+    order = access_order(count, warmup + calls, seed)
+    addresses = (order * store.record_size + base).tolist()
+    for address in addresses[:warmup]:
+        if operation(address) != 0:
+            raise RuntimeError(f"{store.variant} {store.operation}: liboqs zwróciło błąd dla klucza z bufora")
+    store.check(int(order[warmup - 1]))
+
+    samples = np.empty(calls)
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for i, address in enumerate(addresses[warmup:]):
+            start = time.perf_counter()
+            operation(address)
+            samples[i] = (time.perf_counter() - start) * 1000
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    stats = SampleStats()
+    stats.add_batch(samples)
+    return {'keys': count, 'working_set_bytes': count * store.record_size, 'record_size': store.record_size,
+            'p50_ms': stats.quantile(0.5), 'p99_ms': stats.quantile(0.99), 'mean_ms': stats.mean}
+
+
+def run_sweep(target, sizes, calls=DEFAULT_CALLS, pool_size=DEFAULT_POOL, max_bytes=MAX_BUFFER_MB << 20,
+              message=None, progress=None):
+    kind, variant, operation_name = parse_target(target)
+    pool_size = min(pool_size, max(sizes))
+    if kind == 'kem':
+        store = KemKeyStore(variant, operation_name, pool_size)
+    else:
+        store = SignatureKeyStore(variant, operation_name, pool_size, message or os.urandom(1024))
+
+    result = {'variant': variant, 'operation': operation_name, 'record_size': store.record_size,
+              'pool': pool_size, 'calls': calls, 'points': [], 'skipped': []}
+    for count in sizes:
+        if count * store.record_size > max_bytes:
+            result['skipped'].append(count)
+            continue
+        point = measure_point(store, count, calls)
+        result['points'].append(point)
+        if progress is not None:
+            progress(variant, operation_name, point)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Opóźnienie operacji w funkcji liczby rotowanych kluczy")
+    parser.add_argument("targets", nargs="*", default=list(DEFAULT_TARGETS),
+                        help="wariant[:operacja], operacje: encap/decap dla KEM, sign/verify dla podpisów")
+    parser.add_argument("--max-keys", type=int, default=100000, help="największa liczba kluczy w buforze")
+    parser.add_argument("--per-decade", type=int, default=2, help="punkty pomiarowe na dekadę")
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS, help="mierzone wywołania w każdym punkcie")
+    parser.add_argument("--pool", type=int, default=DEFAULT_POOL, help="liczba faktycznie wygenerowanych par kluczy")
+    parser.add_argument("--max-mb", type=int, default=MAX_BUFFER_MB, help="limit rozmiaru bufora kluczy w MB")
+    parser.add_argument("--out", help="katalog wyjściowy")
+    args = parser.parse_args()
+
+    sizes = sweep_sizes(args.max_keys, args.per_decade)
+    caches = cache_sizes()
+    print("Pamięci podręczne CPU0: " + (", ".join(f"{name} {size >> 10} KB" for name, size in caches.items()) or "-"))
+
+    def progress(variant, operation, point):
+        print(f"{variant} {operation}: {point['keys']} kluczy ({point['working_set_bytes'] >> 10} KB) "
+              f"p50 {point['p50_ms']:.4f} ms, p99 {point['p99_ms']:.4f} ms")
+
+    message = os.urandom(1024)
+    results = [run_sweep(target, sizes, args.calls, args.pool, args.max_mb << 20, message, progress)
+               for target in args.targets]
+    for result in results:
+        if result['skipped']:
+            print(f"{result['variant']} {result['operation']}: pominięto N = {', '.join(map(str, result['skipped']))} "
+                  f"(bufor powyżej {args.max_mb} MB)")
+
+    out_dir = args.out or os.path.join(WORKING_SET_DIR, datetime.now().strftime("%Y%m%d-%H%M%S"))
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    header, rows = sweep_rows(results)
+    with open(os.path.join(out_dir, "working_set.json"), "w") as f:
+        json.dump({'caches': caches, 'sizes': sizes, 'results': results}, f, indent=2)
+    with open(os.path.join(out_dir, "working_set.csv"), "w") as f:
+        f.write(csv_text(header, rows))
+    with open(os.path.join(out_dir, "working_set.md"), "w") as f:
+        f.write(markdown_table(header, rows))
+
+    import matplotlib.pyplot as plt
+    import visualization
+    plt.switch_backend('Agg')
+    fig = visualization.plot_working_set(results, caches)
+    fig.savefig(os.path.join(out_dir, "working_set.png"), dpi=110)
+    plt.close(fig)
+    print(f"Wyniki: {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import hashlib
+import os
+import re
+
+CPUINFO_PATH = "/proc/cpuinfo"
+# rozszerzenia, z których korzystają zoptymalizowane implementacje w liboqs
+CPU_FEATURES = ('aes', 'avx', 'avx2', 'avx512f', 'avx512bw', 'avx512vl', 'bmi1', 'bmi2', 'adx', 'pclmulqdq',
+                'popcnt', 'sha_ni', 'sse2', 'sse3', 'ssse3', 'sse4_1', 'vaes', 'vpclmulqdq', 'asimd', 'sha3')
+CONFIG_PATTERN = re.compile(r'^#define\s+(OQS_\w+)(?:\s+(.*))?$')
+CONFIG_KEYS = re.compile(r'^OQS_(VERSION_TEXT|COMPILE_\w+|USE_\w+_INSTRUCTIONS|OPT_TARGET|DIST_BUILD|USE_OPENSSL|'
+                         r'LIBJADE_BUILD|EMBEDDED_BUILD|SPEED_USE_ARM_PMU)$')
+COMPILER_PATTERN = re.compile(rb'(GCC: \([^)]*\) [\w.\-]+|(?:Ubuntu |Debian |Apple )?clang version [\w.\-]+)')
+
+
+def build_label(library_path):
+    # /opt/liboqs-avx2/lib/liboqs.so -> liboqs-avx2
+    directory = os.path.dirname(os.path.abspath(library_path))
+    if os.path.basename(directory) in ('lib', 'lib64', 'bin'):
+        directory = os.path.dirname(directory)
+    return os.path.basename(directory)
+
+
+def parse_build_arg(value):
+    if '=' in value:
+        label, path = value.split('=', 1)
+        return label, path
+    return build_label(value), value
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cpu_flags(path=CPUINFO_PATH):
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.startswith(("flags", "Features")):
+                    present = set(line.split(":", 1)[1].split())
+                    return sorted(flag for flag in CPU_FEATURES if flag in present)
+    except OSError:
+        pass
+    return []
+
+
+def find_oqsconfig(library_path):
+    # instalacja: <prefix>/lib/liboqs.so + <prefix>/include/oqs; katalog build ma ten sam układ
+    directory = os.path.dirname(os.path.realpath(library_path))
+    for base in (directory, os.path.dirname(directory), os.path.dirname(os.path.dirname(directory))):
+        path = os.path.join(base, "include", "oqs", "oqsconfig.h")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def parse_oqsconfig(text):
+    options = {}
+    for line in text.splitlines():
+        match = CONFIG_PATTERN.match(line.strip())
+        if match and CONFIG_KEYS.match(match.group(1)):
+            value = (match.group(2) or "1").strip()
+            options[match.group(1)] = value.strip('"')
+    return options
+
+
+def compiler_ident(library_path):
+    # sekcja .comment pliku ELF zawiera identyfikator kompilatora
+    with open(library_path, "rb") as f:
+        found = COMPILER_PATTERN.findall(f.read())
+    return sorted(set(match.decode(errors="replace") for match in found))
+
+
+def build_fingerprint(library_path, oqs_version=None):
+    config_path = find_oqsconfig(library_path)
+    options = {}
+    if config_path is not None:
+        with open(config_path) as f:
+            options = parse_oqsconfig(f.read())
+    fingerprint = {
+        'library': os.path.realpath(library_path),
+        'sha256': file_sha256(library_path),
+        'oqs_version': oqs_version or options.get('OQS_VERSION_TEXT'),
+        'compiler': compiler_ident(library_path),
+        'compile_options': options,
+        'cpu_flags': cpu_flags()
+    }
+    fingerprint['id'] = fingerprint['sha256'][:12]
+    return fingerprint
+
+
+def speedup_table(builds, baseline=None):
+    # builds: [(label, {variant: {operation: p50_ms}})], zwraca wiersze tabeli przyspieszeń względem bazowej budowy
+    labels = [label for label, _ in builds]
+    baseline = baseline or labels[0]
+    if baseline not in labels:
+        raise ValueError(f"Brak wyników budowy odniesienia {baseline} (dostępne: {', '.join(labels)})")
+    timings = dict(builds)
+    base = timings[baseline]
+    header = ['variant', 'operation', f'{baseline}_ms']
+    for label in labels:
+        if label != baseline:
+            header += [f'{label}_ms', f'{label}_speedup']
+
+    rows = []
+    for variant, operations in base.items():
+        for operation, base_time in operations.items():
+            row = [variant, operation, base_time]
+            for label in labels:
+                if label == baseline:
+                    continue
+                value = timings[label].get(variant, {}).get(operation)
+                row += [value, base_time / value if value else None]
+            rows.append(row)
+    return header, rows
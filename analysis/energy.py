@@ -0,0 +1,116 @@
+import os
+import re
+import time
+
+POWERCAP_ROOT = "/sys/class/powercap"
+ZONE_PATTERN = re.compile(r"^intel-rapl:\d+(:\d+)?$")
+
+
+class RaplDomain:
+    def __init__(self, label, path, max_range):
+        self.label = label
+        self.path = path
+        self.max_range = max_range
+
+    def read(self):
+        with open(os.path.join(self.path, "energy_uj")) as f:
+            return int(f.read())
+
+
+class RaplReader:
+    def __init__(self, root=POWERCAP_ROOT):
+        self.root = root
+        self.domains = self.discover()
+
+    def discover(self):
+        if not os.path.isdir(self.root):
+            return []
+
+        domains = []
+        names = {}
+        for entry in sorted(os.listdir(self.root)):
+            if not ZONE_PATTERN.match(entry):
+                continue
+            path = os.path.join(self.root, entry)
+            try:
+                with open(os.path.join(path, "name")) as f:
+                    name = f.read().strip()
+                with open(os.path.join(path, "max_energy_range_uj")) as f:
+                    max_range = int(f.read())
+                # od 2020 (CVE-2020-8694) energy_uj bywa czytelny tylko dla roota
+                with open(os.path.join(path, "energy_uj")) as f:
+                    int(f.read())
+            except (OSError, ValueError):
+                continue
+
+            names[entry] = name
+            parent = entry.rsplit(":", 1)[0]
+            label = f"{names[parent]}/{name}" if entry.count(":") == 2 and parent in names else name
+            domains.append(RaplDomain(label, path, max_range))
+        return domains
+
+    def available(self):
+        return bool(self.domains)
+
+    def read(self):
+        return {domain.label: domain.read() for domain in self.domains}
+
+    def delta(self, before, after):
+        result = {}
+        for domain in self.domains:
+            diff = after[domain.label] - before[domain.label]
+            if diff < 0:
+                # licznik przekręcił się przez max_energy_range_uj
+                diff += domain.max_range + 1
+            result[domain.label] = diff
+        return result
+
+
+class EnergyMeter:
+    def __init__(self, reader=None, burst_seconds=1.0, clock=time.perf_counter, sleep=time.sleep):
+        self.reader = reader if reader is not None else RaplReader()
+        self.burst_seconds = burst_seconds
+        self.clock = clock
+        self.sleep = sleep
+        self.idle_power = None
+
+    def available(self):
+        return self.reader.available()
+
+    def calibrate_idle(self):
+        before = self.reader.read()
+        start = self.clock()
+        self.sleep(self.burst_seconds)
+        elapsed = self.clock() - start
+        energy = self.reader.delta(before, self.reader.read())
+        # moc spoczynkowa w µJ/s dla każdej domeny
+        self.idle_power = {label: value / elapsed for label, value in energy.items()}
+        return self.idle_power
+
+    def measure(self, operation):
+        if self.idle_power is None:
+            self.calibrate_idle()
+
+        operation()
+        count = 0
+        before = self.reader.read()
+        start = self.clock()
+        deadline = start + self.burst_seconds
+        while self.clock() < deadline:
+            operation()
+            count += 1
+        elapsed = self.clock() - start
+        energy = self.reader.delta(before, self.reader.read())
+
+        return {
+            label: max(value - self.idle_power[label] * elapsed, 0.0) / count
+            for label, value in energy.items()
+        }
+
+
+def primary_domain(per_domain):
+    # do wykresów i tabel bierzemy sumę energii pakietów (gniazd), a gdy ich brak - pierwszą domenę
+    packages = [value for label, value in per_domain.items() if label.startswith("package") and "/" not in label]
+    if packages:
+        return sum(packages)
+    return next(iter(per_domain.values()), None)
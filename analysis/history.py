@@ -0,0 +1,256 @@
+import json
+import os
+import platform
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+
+HISTORY_PATH = "results/history.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    host TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    iterations INTEGER,
+    message_size INTEGER,
+    workers INTEGER
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    variant TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    mean_ms REAL,
+    p50_ms REAL,
+    p99_ms REAL,
+    p999_ms REAL,
+    std_ms REAL,
+    samples INTEGER,
+    energy_uj REAL
+);
+CREATE TABLE IF NOT EXISTS sizes (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    variant TEXT NOT NULL,
+    name TEXT NOT NULL,
+    bytes REAL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    variant TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_created ON runs(created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_host ON runs(host);
+CREATE INDEX IF NOT EXISTS idx_measurements_run ON measurements(run_id);
+CREATE INDEX IF NOT EXISTS idx_measurements_variant_op ON measurements(variant, operation);
+CREATE INDEX IF NOT EXISTS idx_sizes_run ON sizes(run_id);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id);
+"""
+
+VIEW = """
+DROP VIEW IF EXISTS measurement_rows;
+CREATE VIEW measurement_rows AS
+    SELECT m.id, r.id AS run_id, r.kind, r.host, r.created_at, r.iterations, r.message_size, r.workers,
+           m.variant, m.operation, m.mean_ms, m.p50_ms, m.p99_ms, m.p999_ms, m.std_ms, m.samples, m.energy_uj
+    FROM measurements m JOIN runs r ON r.id = m.run_id;
+"""
+
+# kolumny dodane po pierwszej wersji schematu - starsze bazy są uzupełniane przy otwarciu
+MIGRATIONS = {
+    'measurements': [('energy_uj', 'REAL')],
+    # liczba równoległych procesów pomiaru; NULL (starsze przebiegi) i 1 oznaczają pomiar sekwencyjny
+    'runs': [('workers', 'INTEGER')]
+}
+
+COLUMNS = ['run_id', 'created_at', 'host', 'variant', 'operation',
+           'mean_ms', 'p50_ms', 'p99_ms', 'p999_ms', 'std_ms', 'samples', 'energy_uj']
+
+KEM_SIZE_NAMES = {'public_key': 'public_key', 'secret_key': 'secret_key', 'ciphertext': 'ciphertext'}
+SIGNATURE_SIZE_NAMES = {'public_key_size': 'public_key', 'private_key_size': 'secret_key',
+                        'signature_size': 'signature'}
+SIGNATURE_MEANS = {'keygen': 'keygen_time_ms', 'sign': 'avg_sign_time_ms', 'verify': 'avg_verify_time_ms'}
+
+
+def result_variant(result):
+    return result.get('variant') or result.get('algorithm')
+
+
+def measurement_rows(kind, result):
+    # wyniki starszych formatów nie mają time_stats - wtedy zapisujemy tylko średnią
+    stats = result.get('time_stats', {})
+    if kind == 'kem':
+        means = result['time_avg']
+        energy = result.get('energy_avg') or {}
+    else:
+        means = {op: result[key] for op, key in SIGNATURE_MEANS.items() if key in result}
+        energy = {op: result.get(f'{op}_energy_uj') for op in SIGNATURE_MEANS}
+
+    rows = []
+    for operation, mean in means.items():
+        op_stats = stats.get(operation, {})
+        rows.append((operation, mean, op_stats.get('p50'), op_stats.get('p99'), op_stats.get('p999'),
+                     op_stats.get('std'), op_stats.get('count'), energy.get(operation)))
+    return rows
+
+
+def size_rows(kind, result):
+    if kind == 'kem':
+        sizes = result['size_avg']
+        return [(name, sizes[key]) for key, name in KEM_SIZE_NAMES.items() if key in sizes]
+    return [(name, result[key]) for key, name in SIGNATURE_SIZE_NAMES.items() if key in result]
+
+
+class ResultsHistory:
+    def __init__(self, path=HISTORY_PATH):
+        self.path = path
+        if path != ":memory:":
+            Path(os.path.dirname(path) or ".").mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+        self.migrate()
+        self.connection.executescript(VIEW)
+
+    def migrate(self):
+        for table, columns in MIGRATIONS.items():
+            existing = {row[1] for row in self.connection.execute(f"PRAGMA table_info({table})")}
+            for column, column_type in columns:
+                if column not in existing:
+                    self.connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def record_run(self, kind, results, iterations=None, message_size=None, host=None, created_at=None, workers=1):
+        host = host or platform.node()
+        created_at = created_at or datetime.now(timezone.utc).isoformat(timespec='seconds')
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (kind, host, created_at, iterations, message_size, workers) VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, host, created_at, iterations, message_size, workers)
+            )
+            run_id = cursor.lastrowid
+            for result in results:
+                variant = result_variant(result)
+                self.connection.executemany(
+                    "INSERT INTO measurements (run_id, variant, operation, mean_ms, p50_ms, p99_ms, p999_ms, "
+                    "std_ms, samples, energy_uj) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(run_id, variant) + row for row in measurement_rows(kind, result)]
+                )
+                self.connection.executemany(
+                    "INSERT INTO sizes (run_id, variant, name, bytes) VALUES (?, ?, ?, ?)",
+                    [(run_id, variant) + row for row in size_rows(kind, result)]
+                )
+                self.connection.execute(
+                    "INSERT INTO results (run_id, variant, payload) VALUES (?, ?, ?)",
+                    (run_id, variant, json.dumps(result))
+                )
+        return run_id
+
+    def import_legacy_results(self, kem_path="results/kem/kem_results.json",
+                              sig_path="results/sig/signature_results.json"):
+        if self.connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]:
+            return
+        for path, kind in ((kem_path, 'kem'), (sig_path, 'sig')):
+            if not os.path.exists(path):
+                continue
+            with open(path) as f:
+                data = json.load(f)
+            created_at = datetime.fromtimestamp(os.path.getmtime(path), timezone.utc).isoformat(timespec='seconds')
+            if kind == 'kem':
+                self.record_run(kind, data, created_at=created_at)
+            else:
+                self.record_run(kind, data['results'], iterations=data.get('iterations'),
+                                message_size=data.get('message_size'), created_at=created_at)
+
+    def latest_run_id(self, kind):
+        row = self.connection.execute(
+            "SELECT id FROM runs WHERE kind = ? ORDER BY created_at DESC, id DESC LIMIT 1", (kind,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def run_info(self, run_id):
+        row = self.connection.execute(
+            "SELECT id, kind, host, created_at, iterations, message_size, workers FROM runs WHERE id = ?", (run_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Brak przebiegu o id {run_id}")
+        return dict(zip(('id', 'kind', 'host', 'created_at', 'iterations', 'message_size', 'workers'), row))
+
+    def run_results(self, run_id):
+        rows = self.connection.execute(
+            "SELECT payload FROM results WHERE run_id = ? ORDER BY rowid", (run_id,)
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def build_where(self, filters):
+        clauses = []
+        params = []
+        for column in ('kind', 'variant', 'operation', 'host'):
+            value = filters.get(column)
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if filters.get('date_from'):
+            clauses.append("created_at >= ?")
+            params.append(filters['date_from'])
+        if filters.get('date_to'):
+            # data bez godziny obejmuje cały dzień
+            if len(filters['date_to']) == 10:
+                clauses.append("substr(created_at, 1, 10) <= ?")
+            else:
+                clauses.append("created_at <= ?")
+            params.append(filters['date_to'])
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        return where, params
+
+    def count_measurements(self, filters=None):
+        where, params = self.build_where(filters or {})
+        return self.connection.execute(f"SELECT COUNT(*) FROM measurement_rows{where}", params).fetchone()[0]
+
+    def query_measurements(self, filters=None, order_by='created_at', descending=True, limit=200, offset=0):
+        if order_by not in COLUMNS:
+            raise ValueError(f"Nieznana kolumna: {order_by}")
+        where, params = self.build_where(filters or {})
+        direction = "DESC" if descending else "ASC"
+        query = (f"SELECT {', '.join(COLUMNS)} FROM measurement_rows{where} "
+                 f"ORDER BY {order_by} {direction}, id {direction} LIMIT ? OFFSET ?")
+        return self.connection.execute(query, params + [limit, offset]).fetchall()
+
+    def distinct_values(self, column, kind=None):
+        if column not in ('variant', 'operation', 'host'):
+            raise ValueError(f"Nieznana kolumna: {column}")
+        where, params = self.build_where({'kind': kind})
+        rows = self.connection.execute(
+            f"SELECT DISTINCT {column} FROM measurement_rows{where} ORDER BY {column}", params
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def median_series(self, filters=None, limit_per_variant=50):
+        # mediana (p50, a dla starych wyników średnia) w kolejnych przebiegach, per wariant
+        where, params = self.build_where(filters or {})
+        rows = self.connection.execute(
+            f"SELECT variant, created_at, COALESCE(p50_ms, mean_ms) FROM ("
+            f"  SELECT variant, created_at, p50_ms, mean_ms, "
+            f"         ROW_NUMBER() OVER (PARTITION BY variant ORDER BY created_at DESC, id DESC) AS rn "
+            f"  FROM measurement_rows{where}"
+            f") WHERE rn <= ? ORDER BY variant, created_at",
+            params + [limit_per_variant]
+        ).fetchall()
+        series = {}
+        for variant, created_at, value in rows:
+            series.setdefault(variant, []).append((created_at, value))
+        return series
+
+
+def record_run(kind, results, iterations=None, message_size=None, path=HISTORY_PATH, workers=1):
+    with ResultsHistory(path) as history:
+        return history.record_run(kind, results, iterations=iterations, message_size=message_size, workers=workers)
@@ -0,0 +1,82 @@
+import math
+
+from analysis.stats import SampleStats
+
+
+def parse_mix(text, operations=None):
+    # "Kyber768:decap=50,Dilithium3:verify=30,Falcon-512:sign=20"
+    # operations: wariant -> dozwolone operacje; literówka w nazwie operacji wychodzi tu, a nie w procesie potomnym
+    mix = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        target, weight = part.rsplit("=", 1) if "=" in part else (part, "1")
+        if ":" not in target:
+            raise ValueError(f"Oczekiwano wariant:operacja, otrzymano: {target}")
+        variant, operation = target.rsplit(":", 1)
+        mix.append((variant.strip(), operation.strip(), float(weight)))
+    if not mix:
+        raise ValueError("Pusta mieszanka obciążenia")
+    if operations is not None:
+        check_operations(mix, operations)
+    return mix
+
+
+def check_operations(mix, operations):
+    for variant, operation, _ in mix:
+        allowed = operations(variant)
+        if operation not in allowed:
+            raise ValueError(f"Nieznana operacja {variant}:{operation} (dostępne: {', '.join(allowed)})")
+
+
+def allocate_processes(mix, processes):
+    # metoda największych reszt, każda operacja z mieszanki dostaje co najmniej jeden proces
+    if processes < len(mix):
+        raise ValueError(f"Za mało procesów ({processes}) dla {len(mix)} operacji w mieszance")
+    total = sum(weight for _, _, weight in mix)
+    ideal = [weight / total * processes for _, _, weight in mix]
+    counts = [max(1, math.floor(value)) for value in ideal]
+    while sum(counts) < processes:
+        index = max(range(len(mix)), key=lambda i: ideal[i] - counts[i])
+        counts[index] += 1
+    while sum(counts) > processes:
+        index = min((i for i in range(len(mix)) if counts[i] > 1), key=lambda i: ideal[i] - counts[i])
+        counts[index] -= 1
+    return counts
+
+
+def interleave(items, counts):
+    # kolejność round-robin: sąsiednie procesy (np. wątki SMT jednego rdzenia) wykonują różne operacje
+    remaining = list(counts)
+    order = []
+    while any(remaining):
+        for i, item in enumerate(items):
+            if remaining[i]:
+                order.append(item)
+                remaining[i] -= 1
+    return order
+
+
+def merge_worker_stats(workers):
+    stats = SampleStats()
+    for worker in workers:
+        stats.merge(SampleStats.from_dict(worker['stats']))
+    return stats
+
+
+def slowdown_rows(solo, mixed):
+    # solo: {klucz: [wynik procesu]}, mixed: {klucz: [wyniki procesów]}
+    header = ['operation', 'processes', 'solo_p50_ms', 'mixed_p50_ms', 'p50_slowdown',
+              'solo_p99_ms', 'mixed_p99_ms', 'p99_slowdown', 'throughput_ratio']
+    rows = []
+    for key, workers in mixed.items():
+        solo_stats = merge_worker_stats(solo[key])
+        mixed_stats = merge_worker_stats(workers)
+        solo_rate = sum(w['count'] / w['elapsed'] for w in solo[key]) / len(solo[key])
+        mixed_rate = sum(w['count'] / w['elapsed'] for w in workers) / len(workers)
+        solo_p50, mixed_p50 = solo_stats.quantile(0.5), mixed_stats.quantile(0.5)
+        solo_p99, mixed_p99 = solo_stats.quantile(0.99), mixed_stats.quantile(0.99)
+        rows.append([key, len(workers), solo_p50, mixed_p50, mixed_p50 / solo_p50,
+                     solo_p99, mixed_p99, mixed_p99 / solo_p99, mixed_rate / solo_rate])
+    return header, rows
@@ -0,0 +1,160 @@
+import math
+import random
+import time
+from array import array
+
+import numpy as np
+
+from analysis.stats import RunningStats
+
+# Progi statystyki t jak w dudect (Reparaz, Balasch, Verbauwhede 2017)
+T_THRESHOLD_PASS = 4.5
+T_THRESHOLD_LEAKAGE = 10
+NUMBER_PERCENTILES = 100
+ENOUGH_MEASUREMENTS = 10000
+
+
+class OnlineTTest:
+    def __init__(self):
+        self.classes = [RunningStats(), RunningStats()]
+
+    def push(self, x, cls):
+        self.classes[cls].add(x)
+
+    def push_batch(self, values, cls):
+        self.classes[cls].add_batch(values)
+
+    def count(self):
+        return self.classes[0].count + self.classes[1].count
+
+    def compute(self):
+        first, second = self.classes
+        if first.count < 2 or second.count < 2:
+            return 0.0
+        den = math.sqrt(first.variance / first.count + second.variance / second.count)
+        if den == 0:
+            return 0.0
+        return (first.mean - second.mean) / den
+
+
+def cropping_thresholds(samples, number_percentiles=NUMBER_PERCENTILES):
+    ordered = sorted(samples)
+    thresholds = []
+    for i in range(number_percentiles):
+        which = 1 - math.pow(0.5, 10 * (i + 1) / number_percentiles)
+        thresholds.append(ordered[min(int(which * len(ordered)), len(ordered) - 1)])
+    return thresholds
+
+
+class LeakageTest:
+    def __init__(self, target, batch_size=10000, number_percentiles=NUMBER_PERCENTILES,
+                 timer=time.perf_counter_ns, seed=None):
+        self.target = target
+        self.batch_size = batch_size
+        self.number_percentiles = number_percentiles
+        self.timer = timer
+        self.rng = random.Random(seed)
+        self.thresholds = None
+        # [0] bez przycinania, [1..N] przycięte percentylami, [N+1] test drugiego rzędu
+        self.tests = [OnlineTTest() for _ in range(number_percentiles + 2)]
+        self.measurements = 0
+
+    def measure_batch(self):
+        classes = bytearray(self.rng.getrandbits(1) for _ in range(self.batch_size))
+        inputs = self.target.prepare_inputs(classes)
+        operation = self.target.operation
+        timer = self.timer
+        exec_times = array('q', bytes(8 * self.batch_size))
+
+        for i in range(self.batch_size):
+            data = inputs[i]
+            start = timer()
+            operation(data)
+            exec_times[i] = timer() - start
+
+        return classes, exec_times
+
+    def update_statistics(self, classes, exec_times):
+        if self.thresholds is None:
+            # jak w dudect: pierwsza partia tylko wyznacza progi przycinania i pochłania efekty zimnego startu,
+            # nie trafia do testów ani do licznika pomiarów
+            self.thresholds = cropping_thresholds(exec_times, self.number_percentiles)
+            return
+
+        uncropped = self.tests[0]
+        second_order = self.tests[-1]
+        cropped = self.tests[1:-1]
+
+        x = np.frombuffer(exec_times, dtype=np.int64).astype(np.float64)
+        labels = np.frombuffer(bytes(classes), dtype=np.uint8)
+        valid = x > 0
+        x = x[valid]
+        labels = labels[valid]
+
+        for cls in (0, 1):
+            values = x[labels == cls]
+            uncropped.push_batch(values, cls)
+            for test, threshold in zip(cropped, self.thresholds):
+                test.push_batch(values[values < threshold], cls)
+            if uncropped.classes[0].count > ENOUGH_MEASUREMENTS:
+                centered = values - uncropped.classes[cls].mean
+                second_order.push_batch(centered * centered, cls)
+
+        self.measurements += len(exec_times)
+
+    def max_test(self):
+        best_t = 0.0
+        best_n = 0
+        for test in self.tests:
+            if test.count() <= ENOUGH_MEASUREMENTS:
+                continue
+            t = abs(test.compute())
+            if t > best_t:
+                best_t = t
+                best_n = test.count()
+        return best_t, best_n
+
+    def status(self):
+        max_t, max_n = self.max_test()
+        enough = max_n > ENOUGH_MEASUREMENTS
+        if not enough:
+            verdict = 'too_few_measurements'
+        elif max_t > T_THRESHOLD_LEAKAGE:
+            verdict = 'leakage'
+        elif max_t > T_THRESHOLD_PASS:
+            verdict = 'probably_leakage'
+        else:
+            verdict = 'no_leakage_evidence'
+
+        return {
+            'variant': self.target.variant,
+            'operation': self.target.operation_name,
+            'measurements': self.measurements,
+            'max_t': max_t,
+            'max_tau': max_t / math.sqrt(max_n) if max_n else 0.0,
+            'tested_measurements': max_n,
+            'mean_ns': {
+                'class_0': self.tests[0].classes[0].mean,
+                'class_1': self.tests[0].classes[1].mean
+            },
+            'verdict': verdict,
+            'passed': enough and max_t <= T_THRESHOLD_PASS
+        }
+
+    def run(self, measurements=1000000, max_seconds=None, progress=None):
+        started = time.monotonic()
+        while self.measurements < measurements:
+            classes, exec_times = self.measure_batch()
+            self.update_statistics(classes, exec_times)
+
+            elapsed = time.monotonic() - started
+            if progress is not None:
+                status = self.status()
+                status['elapsed_s'] = elapsed
+                progress(status)
+            if max_seconds is not None and elapsed >= max_seconds:
+                break
+
+        result = self.status()
+        result['elapsed_s'] = time.monotonic() - started
+        return result
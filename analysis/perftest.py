@@ -0,0 +1,248 @@
+import gc
+import hashlib
+import os
+import platform
+import sqlite3
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+PERF_HISTORY_PATH = "results/perf/perf_history.sqlite"
+CONFIDENCE = 0.95
+BOOTSTRAP_RESAMPLES = 2000
+# próbka krótsza niż to jest zdominowana przez rozdzielczość i narzut zegara - wtedy mierzymy kilka wywołań naraz
+MIN_SAMPLE_NS = 50000
+DEFAULT_TOLERANCE = 0.25
+TREND_RUNS = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS perf_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    test TEXT NOT NULL,
+    host TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    median_ms REAL NOT NULL,
+    ci_low_ms REAL NOT NULL,
+    ci_high_ms REAL NOT NULL,
+    samples INTEGER NOT NULL,
+    number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS perf_baselines (
+    test TEXT NOT NULL,
+    host TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    median_ms REAL NOT NULL,
+    ci_low_ms REAL NOT NULL,
+    ci_high_ms REAL NOT NULL,
+    PRIMARY KEY (test, host)
+);
+CREATE INDEX IF NOT EXISTS idx_perf_runs_test_host ON perf_runs(test, host);
+"""
+
+
+def cpu_model():
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def host_fingerprint():
+    # baseline ma sens tylko na tej samej maszynie i tym samym interpreterze
+    info = {
+        'node': platform.node(),
+        'machine': platform.machine(),
+        'cpu': cpu_model(),
+        'cpus': os.cpu_count(),
+        'python': f"{platform.python_implementation()} {platform.python_version()}"
+    }
+    info['id'] = hashlib.sha256(repr(sorted(info.items())).encode()).hexdigest()[:12]
+    return info
+
+
+def autorange(operation, min_ns=MIN_SAMPLE_NS, timer=time.perf_counter_ns):
+    number = 1
+    while True:
+        start = timer()
+        for _ in range(number):
+            operation()
+        if timer() - start >= min_ns:
+            return number
+        number *= 2
+
+
+def collect_samples(operation, samples=200, warmup=10, number=None, timer=time.perf_counter_ns):
+    for _ in range(warmup):
+        operation()
+    if number is None:
+        number = autorange(operation, timer=timer)
+
+    values = np.empty(samples)
+    # GC wyłączony na czas pomiaru, żeby pojedyncze przebiegi kolektora nie trafiały w próbki
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for i in range(samples):
+            start = timer()
+            for _ in range(number):
+                operation()
+            values[i] = (timer() - start) / number / 1e6
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return values, number
+
+
+def bootstrap_median_ci(samples, confidence=CONFIDENCE, resamples=BOOTSTRAP_RESAMPLES, seed=0):
+    samples = np.asarray(samples)
+    rng = np.random.default_rng(seed)
+    medians = np.median(samples[rng.integers(0, len(samples), (resamples, len(samples)))], axis=1)
+    alpha = (1 - confidence) / 2
+    return float(np.quantile(medians, alpha)), float(np.quantile(medians, 1 - alpha))
+
+
+def bootstrap_ratio_ci(numerator, denominator, confidence=CONFIDENCE, resamples=BOOTSTRAP_RESAMPLES, seed=0):
+    # przedział ufności ilorazu median dwóch niezależnych prób
+    numerator = np.asarray(numerator)
+    denominator = np.asarray(denominator)
+    rng = np.random.default_rng(seed)
+    top = np.median(numerator[rng.integers(0, len(numerator), (resamples, len(numerator)))], axis=1)
+    bottom = np.median(denominator[rng.integers(0, len(denominator), (resamples, len(denominator)))], axis=1)
+    ratios = top / bottom
+    alpha = (1 - confidence) / 2
+    return float(np.quantile(ratios, alpha)), float(np.quantile(ratios, 1 - alpha))
+
+
+class PerfResult:
+    def __init__(self, name, samples, number=1, confidence=CONFIDENCE):
+        self.name = name
+        self.samples = np.asarray(samples)
+        self.number = number
+        self.median = float(np.median(self.samples))
+        self.ci_low, self.ci_high = bootstrap_median_ci(self.samples, confidence)
+
+    def __repr__(self):
+        return f"{self.name}: mediana {self.median:.4f} ms [{self.ci_low:.4f}, {self.ci_high:.4f}]"
+
+
+def trend_per_run(medians):
+    # nachylenie prostej dopasowanej do log(mediany) - względna zmiana na jeden przebieg
+    if len(medians) < 3:
+        return None
+    slope = np.polyfit(np.arange(len(medians)), np.log(medians), 1)[0]
+    return float(np.expm1(slope))
+
+
+class PerfHistory:
+    def __init__(self, path=PERF_HISTORY_PATH):
+        self.path = path
+        if path != ":memory:":
+            Path(os.path.dirname(path) or ".").mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def record(self, test, host, result, created_at=None):
+        created_at = created_at or datetime.now(timezone.utc).isoformat(timespec='seconds')
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO perf_runs (test, host, created_at, median_ms, ci_low_ms, ci_high_ms, samples, number) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (test, host, created_at, result.median, result.ci_low, result.ci_high, len(result.samples), result.number)
+            )
+
+    def baseline(self, test, host):
+        row = self.connection.execute(
+            "SELECT median_ms, ci_low_ms, ci_high_ms, created_at FROM perf_baselines WHERE test = ? AND host = ?",
+            (test, host)
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('median_ms', 'ci_low_ms', 'ci_high_ms', 'created_at'), row))
+
+    def set_baseline(self, test, host, result, created_at=None):
+        created_at = created_at or datetime.now(timezone.utc).isoformat(timespec='seconds')
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO perf_baselines (test, host, created_at, median_ms, ci_low_ms, ci_high_ms) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (test, host, created_at, result.median, result.ci_low, result.ci_high)
+            )
+
+    def series(self, test, host, limit=TREND_RUNS):
+        rows = self.connection.execute(
+            "SELECT median_ms FROM perf_runs WHERE test = ? AND host = ? ORDER BY id DESC LIMIT ?",
+            (test, host, limit)
+        ).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+    def trend(self, test, host, limit=TREND_RUNS):
+        medians = self.series(test, host, limit)
+        baseline = self.baseline(test, host)
+        return {
+            'test': test,
+            'runs': len(medians),
+            'last_ms': medians[-1] if medians else None,
+            'baseline_ms': baseline['median_ms'] if baseline else None,
+            'trend_per_run': trend_per_run(medians)
+        }
+
+
+class PerfCheck:
+    def __init__(self, test_id, history, host, tolerance=DEFAULT_TOLERANCE, update_baseline=False,
+                 samples=200, confidence=CONFIDENCE):
+        self.test_id = test_id
+        self.history = history
+        self.host = host
+        self.tolerance = tolerance
+        self.update_baseline = update_baseline
+        self.samples = samples
+        self.confidence = confidence
+        self.recorded = []
+
+    def key(self, name):
+        return f"{self.test_id}[{name}]"
+
+    def measure(self, operation, name, samples=None, number=None):
+        values, number = collect_samples(operation, samples=samples or self.samples, number=number)
+        result = PerfResult(name, values, number, self.confidence)
+        key = self.key(name)
+        self.history.record(key, self.host, result)
+        self.recorded.append(key)
+
+        baseline = self.history.baseline(key, self.host)
+        if baseline is None or self.update_baseline:
+            self.history.set_baseline(key, self.host, result)
+        else:
+            # regresja tylko wtedy, gdy cały przedział ufności leży powyżej tolerancji względem baseline
+            limit = baseline['median_ms'] * (1 + self.tolerance)
+            assert result.ci_low <= limit, (
+                f"{result} - regresja względem baseline {baseline['median_ms']:.4f} ms "
+                f"z {baseline['created_at']} (tolerancja {self.tolerance:.0%})"
+            )
+        return result
+
+    def assert_below(self, result, limit_ms):
+        assert result.ci_high < limit_ms, f"{result} - górna granica przedziału ufności nie jest poniżej {limit_ms} ms"
+
+    def assert_faster(self, faster, slower, max_ratio=1.0):
+        low, high = bootstrap_ratio_ci(faster.samples, slower.samples, self.confidence)
+        assert high < max_ratio, (
+            f"{faster.name} / {slower.name}: iloraz median {faster.median / slower.median:.3f} "
+            f"[{low:.3f}, {high:.3f}] nie jest poniżej {max_ratio}"
+        )
+        return low, high
@@ -0,0 +1,104 @@
+import cProfile
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from analysis.stats import SampleStats
+
+PROFILE_DIR = "results/profile"
+SAMPLING_INTERVAL = 0.001
+
+
+def harness_overhead(iterations, timer=time.perf_counter):
+    # koszt samej pętli pomiarowej (para odczytów zegara + SampleStats.add) dla pustej operacji, w ms
+    stats = SampleStats()
+    noop = lambda: None
+    start = timer()
+    for _ in range(iterations):
+        begin = timer()
+        noop()
+        stats.add((timer() - begin) * 1000)
+    elapsed = (timer() - start) * 1000
+    return {'in_window_ms': stats.quantile(0.5), 'per_iteration_ms': elapsed / iterations}
+
+
+def frame_label(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame):
+    labels = []
+    while frame is not None:
+        labels.append(frame_label(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class SamplingProfiler:
+    # próbkuje stos wskazanego wątku z osobnego wątku; ctypes zwalnia GIL na czas wywołania C,
+    # więc czas spędzony w liboqs trafia na linię wrappera, która wywołała funkcję natywną
+    def __init__(self, interval=SAMPLING_INTERVAL, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is not None:
+            self.stacks[collapse_stack(frame)] += 1
+            self.samples += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def collapsed(self):
+        # format "ramka;ramka;ramka liczba" - wejście dla flamegraph.pl, speedscope i inferno
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+
+def profile_run(run, name, mode='cprofile', out_dir=PROFILE_DIR):
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    if mode == 'cprofile':
+        profiler = cProfile.Profile()
+        result = profiler.runcall(run)
+        path = os.path.join(out_dir, f"{name}.pstats")
+        profiler.dump_stats(path)
+    elif mode == 'sampling':
+        with SamplingProfiler() as profiler:
+            result = run()
+        path = os.path.join(out_dir, f"{name}.folded")
+        with open(path, "w") as f:
+            f.write(profiler.collapsed())
+    else:
+        raise ValueError(f"Nieznany tryb profilowania: {mode}")
+    return result, path
+
+
+def profile_benchmark(benchmark, iterations, mode='cprofile', out_dir=PROFILE_DIR):
+    name = getattr(benchmark, 'variant', None) or benchmark.algorithm_name
+    return profile_run(lambda: benchmark.measure(iterations), name, mode=mode, out_dir=out_dir)
@@ -0,0 +1,202 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# poziomy bezpieczeństwa NIST (1-5); algorytmy klasyczne mają poziom 0 - nie są odporne na komputer kwantowy
+NIST_LEVELS = [
+    (r'^(Kyber512|ML-KEM-512|BIKE-L1|HQC-128|FrodoKEM-640-\w+|Falcon-512|Falcon-padded-512)$', 1),
+    (r'^(Dilithium2|ML-DSA-44)$', 2),
+    (r'^(Kyber768|ML-KEM-768|BIKE-L3|HQC-192|FrodoKEM-976-\w+|Dilithium3|ML-DSA-65)$', 3),
+    (r'^(Kyber1024|ML-KEM-1024|BIKE-L5|HQC-256|FrodoKEM-1344-\w+|Dilithium5|ML-DSA-87|Falcon-1024|'
+     r'Falcon-padded-1024)$', 5),
+    (r'^SPHINCS\+?-\w+-128\w*$', 1),
+    (r'^SPHINCS\+?-\w+-192\w*$', 3),
+    (r'^SPHINCS\+?-\w+-256\w*$', 5),
+    (r'^(X25519|X448|ECDH-P\d+|Ed25519|Ed448|ECDSA-P\d+|RSA-\d+)$', 0),
+]
+OBJECTIVES = ('bytes', 'latency', 'tail', 'level')
+DEFAULT_WEIGHTS = {'bytes': 1.0, 'latency': 1.0, 'tail': 1.0, 'level': 0.0}
+CONSTRAINTS = ('max_kem_bytes', 'max_decap_p99_us', 'min_level', 'max_signature_bytes', 'max_sign_p99_us')
+SELECTION_HEADER = ['host', 'kem', 'signature', 'message_size', 'level', 'bytes', 'latency_ms', 'tail_ms', 'decap_p99_us', 'cost']
+# górna granica liczby porównań w jednym bloku macierzy dominacji (punkty x punkty x kryteria)
+PARETO_BLOCK = 4000000
+
+
+def nist_level(variant):
+    # hybryda ma poziom swojej części postkwantowej
+    levels = []
+    for name in variant.split("+"):
+        levels.extend(level for pattern, level in NIST_LEVELS if re.match(pattern, name))
+    return max(levels) if levels else np.nan
+
+
+def pareto_mask(values):
+    # values: (n, k), wszystkie kryteria minimalizowane; True dla punktów niezdominowanych
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    mask = np.ones(n, dtype=bool)
+    if n == 0:
+        return mask
+    block = max(1, PARETO_BLOCK // (n * values.shape[1]))
+    for start in range(0, n, block):
+        chunk = values[start:start + block]
+        no_worse = (values[None, :, :] <= chunk[:, None, :]).all(axis=2)
+        better = (values[None, :, :] < chunk[:, None, :]).any(axis=2)
+        mask[start:start + block] = ~(no_worse & better).any(axis=1)
+    return mask
+
+
+def load_frames(connection, aggregate='median', include_parallel=False):
+    # czas podpisu zależy od rozmiaru wiadomości - przebiegi z różnymi rozmiarami to osobne wiersze
+    # (0 - rozmiar nieznany w starych wynikach); KEM nie zależy od wiadomości
+    message_size = "CASE WHEN r.kind = 'sig' THEN COALESCE(r.message_size, 0) ELSE 0 END AS message_size"
+    # przebiegi sesji z kilkoma procesami naraz mierzą operacje pod konkurencją - domyślnie pomijane
+    where = "" if include_parallel else " WHERE COALESCE(r.workers, 1) <= 1"
+    measurements = pd.read_sql_query(
+        f"SELECT r.run_id, r.kind, r.host, r.created_at, {message_size}, r.variant, r.operation, "
+        f"COALESCE(r.p50_ms, r.mean_ms) AS p50_ms, r.p99_ms FROM measurement_rows r{where}", connection
+    )
+    sizes = pd.read_sql_query(
+        f"SELECT s.run_id, r.kind, r.host, r.created_at, {message_size}, s.variant, s.name, s.bytes "
+        f"FROM sizes s JOIN runs r ON r.id = s.run_id{where}", connection
+    )
+    keys = ['kind', 'host', 'variant', 'message_size']
+    if aggregate == 'latest':
+        # tylko najnowszy przebieg każdego wariantu na każdym hoście
+        latest = measurements.groupby(keys)['created_at'].transform('max')
+        measurements = measurements[measurements['created_at'] == latest]
+        latest = sizes.groupby(keys)['created_at'].transform('max')
+        sizes = sizes[sizes['created_at'] == latest]
+    elif aggregate != 'median':
+        raise ValueError(f"Nieznana agregacja: {aggregate}")
+
+    # mediana po przebiegach - pojedynczy zaszumiony przebieg nie przestawia rankingu
+    group = keys + ['operation']
+    times = measurements.groupby(group)[['p50_ms']].median()
+    # stare wyniki (bez time_stats) nie mają p99 - mediana tylko z dostępnych wartości, bez pustych grup
+    measurements['p99_ms'] = measurements['p99_ms'].astype(float)
+    times = times.join(measurements.dropna(subset=['p99_ms']).groupby(group)['p99_ms'].median())
+    times = times.unstack('operation')
+    times.columns = [f"{operation}_{stat[:-3]}_ms" for stat, operation in times.columns]
+    runs = measurements.groupby(keys)['run_id'].nunique().rename('runs')
+    size_table = sizes.groupby(keys + ['name'])['bytes'].median().unstack('name')
+
+    frame = times.join(size_table, how='inner').join(runs).reset_index()
+    frame['level'] = frame['variant'].map(nist_level)
+    # kolumny drugiego rodzaju (np. signature przy KEM) są puste - usuwamy je, żeby nie kolidowały przy łączeniu par
+    kem = frame[frame['kind'] == 'kem'].drop(columns=['kind', 'message_size'])
+    kem = kem.dropna(axis=1, how='all').reset_index(drop=True)
+    sig = frame[frame['kind'] == 'sig'].drop(columns='kind').dropna(axis=1, how='all').reset_index(drop=True)
+    return kem, sig
+
+
+def column(frame, name):
+    return frame[name] if name in frame else pd.Series(np.nan, index=frame.index)
+
+
+def filter_kem(kem, constraints):
+    mask = pd.Series(True, index=kem.index)
+    if constraints.get('max_kem_bytes') is not None:
+        mask &= column(kem, 'public_key') + column(kem, 'ciphertext') <= constraints['max_kem_bytes']
+    if constraints.get('max_decap_p99_us') is not None:
+        mask &= column(kem, 'decap_p99_ms') * 1000 <= constraints['max_decap_p99_us']
+    if constraints.get('min_level') is not None:
+        mask &= column(kem, 'level') >= constraints['min_level']
+    return kem[mask]
+
+
+def filter_sig(sig, constraints):
+    mask = pd.Series(True, index=sig.index)
+    if constraints.get('max_signature_bytes') is not None:
+        mask &= column(sig, 'signature') <= constraints['max_signature_bytes']
+    if constraints.get('max_sign_p99_us') is not None:
+        mask &= column(sig, 'sign_p99_ms') * 1000 <= constraints['max_sign_p99_us']
+    if constraints.get('min_level') is not None:
+        mask &= column(sig, 'level') >= constraints['min_level']
+    return sig[mask]
+
+
+def combine(kem, sig):
+    # para KEM x podpis na tym samym hoście - czasy z różnych maszyn nie są porównywalne
+    pairs = kem.merge(sig, on='host', suffixes=('_kem', '_sig'))
+    # uzgodnienie w stylu TLS: klucz KEM + szyfrogram + klucz publiczny podpisu (certyfikat) + podpis
+    pairs['bytes'] = (column(pairs, 'public_key_kem') + column(pairs, 'ciphertext')
+                      + column(pairs, 'public_key_sig') + column(pairs, 'signature'))
+    # pełne uzgodnienie z kluczem efemerycznym; keygen podpisu pomijamy - klucz podpisu jest długoterminowy
+    latency = ['keygen_p50_ms_kem', 'encap_p50_ms', 'decap_p50_ms', 'sign_p50_ms', 'verify_p50_ms']
+    pairs['latency'] = sum(column(pairs, name) for name in latency)
+    # ogon po stronie serwera: dekapsulacja i podpis; brak p99 w starych wynikach zastępujemy p50
+    pairs['tail'] = (column(pairs, 'decap_p99_ms').fillna(column(pairs, 'decap_p50_ms'))
+                     + column(pairs, 'sign_p99_ms').fillna(column(pairs, 'sign_p50_ms')))
+    pairs['level'] = np.fmin(pairs['level_kem'], pairs['level_sig'])
+    return pairs
+
+
+def objective_matrix(pairs):
+    # wszystkie kryteria minimalizowane - poziom bezpieczeństwa z przeciwnym znakiem
+    return np.column_stack([pairs['bytes'], pairs['latency'], pairs['tail'], -pairs['level'].fillna(0)])
+
+
+def weighted_cost(pairs, weights):
+    values = objective_matrix(pairs)
+    low, high = values.min(axis=0), values.max(axis=0)
+    normalized = (values - low) / np.where(high > low, high - low, 1.0)
+    vector = np.array([weights.get(name, 0.0) for name in OBJECTIVES])
+    return normalized @ vector
+
+
+class AlgorithmSelector:
+    def __init__(self, connection, aggregate='median', include_parallel=False):
+        # dane z historii wczytywane raz - kolejne zapytania to już tylko operacje na ramkach w pamięci
+        self.kem, self.sig = load_frames(connection, aggregate, include_parallel)
+
+    def hosts(self):
+        if self.kem.empty or self.sig.empty:
+            return []
+        return sorted(set(self.kem['host']) & set(self.sig['host']))
+
+    def message_sizes(self):
+        return [] if self.sig.empty else sorted(int(size) for size in self.sig['message_size'].unique())
+
+    def default_message_size(self):
+        # rozmiar wiadomości z największą liczbą przebiegów, przy remisie większy
+        if self.sig.empty:
+            return None
+        runs = self.sig.groupby('message_size')['runs'].sum()
+        return int(runs[runs == runs.max()].index.max())
+
+    def select(self, constraints=None, weights=None, host=None, pareto_only=True, message_size=None):
+        constraints = constraints or {}
+        weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        if self.kem.empty or self.sig.empty:
+            return pd.DataFrame()
+        kem, sig = self.kem, self.sig
+        # podpisy porównywane tylko przy jednym rozmiarze wiadomości
+        message_size = self.default_message_size() if message_size is None else message_size
+        sig = sig[sig['message_size'] == message_size]
+        if host:
+            kem, sig = kem[kem['host'] == host], sig[sig['host'] == host]
+        pairs = combine(filter_kem(kem, constraints), filter_sig(sig, constraints))
+        pairs = pairs.dropna(subset=['bytes', 'latency']).reset_index(drop=True)
+        if pairs.empty:
+            return pairs
+
+        values = objective_matrix(pairs)
+        pairs['pareto'] = False
+        for _, index in pairs.groupby('host').indices.items():
+            pairs.loc[index, 'pareto'] = pareto_mask(values[index])
+        if pareto_only:
+            pairs = pairs[pairs['pareto']].reset_index(drop=True)
+        pairs['cost'] = weighted_cost(pairs, weights)
+        return pairs.sort_values(['cost', 'bytes']).reset_index(drop=True)
+
+
+def selection_rows(pairs, limit=None):
+    rows = []
+    for row in pairs.head(limit).itertuples() if limit else pairs.itertuples():
+        decap_p99 = getattr(row, 'decap_p99_ms', np.nan)
+        rows.append([row.host, row.variant_kem, row.variant_sig, int(row.message_size),
+                     None if np.isnan(row.level) else int(row.level), int(row.bytes), row.latency, row.tail,
+                     None if np.isnan(decap_p99) else decap_p99 * 1000, row.cost])
+    return SELECTION_HEADER, rows
@@ -0,0 +1,208 @@
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+from analysis.topology import CpuTopology
+
+SESSION_DIR = "results/sessions"
+SESSION_FILE = "session.json"
+
+
+def run_unit(factory, spec, iterations):
+    # wykonywane w procesie roboczym - zwracamy stan statystyk, nie surowe próbki
+    benchmark = factory(spec)
+    return benchmark.metrics_to_dict(benchmark.measure(iterations))
+
+
+def pin_worker(cpus, counter):
+    # każdy proces roboczy na osobnym rdzeniu - procesy na wspólnym rdzeniu zawyżałyby sobie nawzajem czasy
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+
+def split_iterations(iterations, unit_iterations):
+    sizes = [unit_iterations] * (iterations // unit_iterations)
+    if iterations % unit_iterations:
+        sizes.append(iterations % unit_iterations)
+    return sizes
+
+
+def write_atomic(path, data):
+    # zapis do pliku tymczasowego i os.replace - przerwany zapis nie psuje poprzedniego punktu kontrolnego
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class BenchmarkSession:
+    def __init__(self, path, state, factory):
+        self.path = path
+        self.state = state
+        self.factory = factory
+
+    @classmethod
+    def create(cls, kind, specs, iterations, factory, unit_iterations, message_size=None, session_dir=SESSION_DIR,
+               workers=1):
+        now = datetime.now()
+        path = os.path.join(session_dir, f"{now.strftime('%Y%m%d-%H%M%S-%f')}-{kind}")
+        units = []
+        for spec in specs:
+            for index, size in enumerate(split_iterations(iterations, unit_iterations)):
+                units.append({'id': f"{spec['variant']}/{index}", 'variant': spec['variant'], 'iterations': size,
+                              'status': 'pending', 'metrics': None})
+        state = {
+            'kind': kind,
+            'created_at': now.isoformat(timespec='seconds'),
+            'iterations': iterations,
+            'message_size': message_size,
+            'workers': workers,
+            'status': 'running',
+            'specs': specs,
+            'units': units,
+            'energy_domains': {}
+        }
+        Path(path).mkdir(parents=True, exist_ok=True)
+        session = cls(path, state, factory)
+        session.checkpoint()
+        return session
+
+    @classmethod
+    def load(cls, path, factory):
+        with open(os.path.join(path, SESSION_FILE)) as f:
+            return cls(path, json.load(f), factory)
+
+    @staticmethod
+    def unfinished(kind=None, session_dir=SESSION_DIR):
+        if not os.path.isdir(session_dir):
+            return []
+        paths = []
+        for name in sorted(os.listdir(session_dir)):
+            path = os.path.join(session_dir, name)
+            try:
+                with open(os.path.join(path, SESSION_FILE)) as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if state['status'] == 'running' and (kind is None or state['kind'] == kind):
+                paths.append(path)
+        return paths
+
+    @property
+    def kind(self):
+        return self.state['kind']
+
+    @property
+    def variants(self):
+        return [spec['variant'] for spec in self.state['specs']]
+
+    @property
+    def workers(self):
+        # sesje zapisane przed dodaniem tego pola były uruchamiane równolegle bez przypinania
+        return self.state.get('workers', os.cpu_count() or 1)
+
+    @property
+    def finished(self):
+        return self.state['status'] == 'finished'
+
+    def abandon(self):
+        self.state['status'] = 'abandoned'
+        self.checkpoint()
+
+    def checkpoint(self):
+        write_atomic(os.path.join(self.path, SESSION_FILE), self.state)
+
+    def pending_units(self):
+        return [unit for unit in self.state['units'] if unit['status'] != 'done']
+
+    def done_iterations(self, variant):
+        return sum(unit['iterations'] for unit in self.state['units']
+                   if unit['variant'] == variant and unit['status'] == 'done')
+
+    def variant_metrics(self, variant, benchmark):
+        metrics = benchmark.new_metrics()
+        for unit in self.state['units']:
+            if unit['variant'] == variant and unit['status'] == 'done':
+                benchmark.merge_metrics(metrics, benchmark.metrics_from_dict(unit['metrics']))
+        return metrics
+
+    def complete(self, unit, metrics, benchmarks, progress=None):
+        unit['status'] = 'done'
+        unit['metrics'] = metrics
+        unit.pop('error', None)
+        self.checkpoint()
+        if progress is not None:
+            variant = unit['variant']
+            progress(variant, self.variant_metrics(variant, benchmarks[variant]), self.done_iterations(variant))
+
+    def run(self, workers=None, progress=None, energy_meter=None):
+        # domyślnie tyle procesów, ile zapisano przy tworzeniu sesji (1 - pomiar sekwencyjny)
+        workers = workers or self.workers
+        specs = {spec['variant']: spec for spec in self.state['specs']}
+        benchmarks = {variant: self.factory(spec) for variant, spec in specs.items()}
+
+        # po wznowieniu od razu pokazujemy to, co zostało policzone wcześniej
+        if progress is not None:
+            for variant in self.variants:
+                if self.done_iterations(variant):
+                    progress(variant, self.variant_metrics(variant, benchmarks[variant]), self.done_iterations(variant))
+
+        pending = self.pending_units()
+        failed = []
+        if pending and workers == 1:
+            for unit in pending:
+                self.complete(unit, run_unit(self.factory, specs[unit['variant']], unit['iterations']),
+                              benchmarks, progress)
+        elif pending:
+            cores = [core[0] for core in CpuTopology().cores()]
+            workers = min(workers, len(cores)) if cores else workers
+            # sesja oznaczona jako równoległa - takie wyniki można odfiltrować w historii
+            self.state['workers'] = max(self.state.get('workers', 1), workers)
+            counter = multiprocessing.Value('i', 0)
+            with ProcessPoolExecutor(max_workers=workers, initializer=pin_worker,
+                                     initargs=(cores or [0], counter)) as executor:
+                futures = {executor.submit(run_unit, self.factory, specs[unit['variant']], unit['iterations']): unit
+                           for unit in pending}
+                for future in as_completed(futures):
+                    unit = futures[future]
+                    try:
+                        metrics = future.result()
+                    except Exception as e:
+                        unit['error'] = str(e)
+                        failed.append(unit['id'])
+                        continue
+                    self.complete(unit, metrics, benchmarks, progress)
+
+        if failed:
+            self.checkpoint()
+            raise RuntimeError(f"Nieudane jednostki pracy (zostaną powtórzone po wznowieniu): {', '.join(failed)}")
+
+        # energia mierzona sekwencyjnie w tym procesie - równoległe procesy zafałszowałyby liczniki RAPL
+        if energy_meter is not None and energy_meter.available():
+            for variant, benchmark in benchmarks.items():
+                if variant not in self.state['energy_domains']:
+                    self.state['energy_domains'][variant] = benchmark.measure_energy(energy_meter)
+                    self.checkpoint()
+
+        results = self.results(benchmarks)
+        self.state['status'] = 'finished'
+        self.checkpoint()
+        return results
+
+    def results(self, benchmarks):
+        results = []
+        for variant in self.variants:
+            benchmark = benchmarks[variant]
+            result = benchmark.summarize(self.variant_metrics(variant, benchmark))
+            if variant in self.state['energy_domains']:
+                benchmark.add_energy(result, self.state['energy_domains'][variant])
+            results.append(result)
+        return results
@@ -0,0 +1,203 @@
+import math
+
+import numpy as np
+
+QUANTILES = {'p50': 0.50, 'p99': 0.99, 'p999': 0.999}
+
+
+class RunningStats:
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+    def add_batch(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return
+        batch = RunningStats()
+        batch.count = len(values)
+        batch.mean = float(np.mean(values))
+        batch.m2 = float(np.sum((values - batch.mean) ** 2))
+        batch.min = float(np.min(values))
+        batch.max = float(np.max(values))
+        self.merge(batch)
+
+    def merge(self, other):
+        # równoległa wersja algorytmu Welforda (Chan i in.)
+        if other.count == 0:
+            return self
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / n
+        self.m2 += other.m2 + delta * delta * self.count * other.count / n
+        self.count = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def to_dict(self):
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2, 'min': self.min, 'max': self.max}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.count = data['count']
+        stats.mean = data['mean']
+        stats.m2 = data['m2']
+        stats.min = data['min']
+        stats.max = data['max']
+        return stats
+
+
+class QuantileSketch:
+    # Histogram o logarytmicznych kubełkach (jak DDSketch / HDR histogram): każda wartość dodatnia
+    # trafia do kubełka o względnej szerokości 2 * relative_accuracy, więc kwantyle mają
+    # gwarantowany błąd względny, a scalanie szkiców z wielu procesów jest sumą liczników.
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def bucket_index(self, x):
+        return math.ceil(math.log(x) / self.log_gamma)
+
+    def add(self, x):
+        self.count += 1
+        if x <= 0:
+            self.zero_count += 1
+            return
+        index = self.bucket_index(x)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def add_batch(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return
+        positive = values[values > 0]
+        self.zero_count += len(values) - len(positive)
+        self.count += len(values)
+        indices, counts = np.unique(np.ceil(np.log(positive) / self.log_gamma).astype(np.int64), return_counts=True)
+        for index, count in zip(indices.tolist(), counts.tolist()):
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def merge(self, other):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Nie można scalić szkiców o różnej dokładności")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        return self
+
+    def quantile(self, q):
+        if self.count == 0:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                return 2 * self.gamma ** index / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    def to_dict(self):
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'zero_count': self.zero_count,
+            'count': self.count,
+            'buckets': {str(index): count for index, count in self.buckets.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data['relative_accuracy'])
+        sketch.zero_count = data['zero_count']
+        sketch.count = data['count']
+        sketch.buckets = {int(index): count for index, count in data['buckets'].items()}
+        return sketch
+
+
+class SampleStats:
+    def __init__(self, relative_accuracy=0.01):
+        self.moments = RunningStats()
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    @property
+    def count(self):
+        return self.moments.count
+
+    @property
+    def mean(self):
+        return self.moments.mean
+
+    def add(self, x):
+        self.moments.add(x)
+        self.sketch.add(x)
+
+    def add_batch(self, values):
+        self.moments.add_batch(values)
+        self.sketch.add_batch(values)
+
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+
+    def summary(self):
+        result = {
+            'count': self.moments.count,
+            'mean': self.moments.mean,
+            'std': self.moments.std,
+            'min': self.moments.min if self.moments.count else math.nan,
+            'max': self.moments.max if self.moments.count else math.nan
+        }
+        for name, q in QUANTILES.items():
+            result[name] = self.sketch.quantile(q)
+        return result
+
+    def to_dict(self):
+        return {'moments': self.moments.to_dict(), 'sketch': self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.moments = RunningStats.from_dict(data['moments'])
+        stats.sketch = QuantileSketch.from_dict(data['sketch'])
+        return stats
+
+
+def merge_all(stats_list):
+    merged = None
+    for stats in stats_list:
+        if merged is None:
+            merged = SampleStats.from_dict(stats.to_dict())
+        else:
+            merged.merge(stats)
+    return merged
@@ -0,0 +1,112 @@
+import os
+
+CPU_ROOT = "/sys/devices/system/cpu"
+PLACEMENTS = ('smt', 'l3', 'spread')
+
+
+def parse_cpu_list(text):
+    # format jądra: "0-3,8,10-11"
+    cpus = []
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-")
+            cpus.extend(range(int(start), int(end) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def read_text(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+class CpuTopology:
+    def __init__(self, root=CPU_ROOT, allowed=None):
+        self.root = root
+        if allowed is None:
+            allowed = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else range(os.cpu_count() or 1)
+        online = read_text(os.path.join(root, "online"))
+        cpus = parse_cpu_list(online) if online else sorted(allowed)
+        self.cpus = [cpu for cpu in cpus if cpu in set(allowed)]
+        self.siblings = {cpu: self.read_list(cpu, "topology/thread_siblings_list") for cpu in self.cpus}
+        self.l3 = {cpu: self.l3_domain(cpu) for cpu in self.cpus}
+
+    def read_list(self, cpu, name):
+        text = read_text(os.path.join(self.root, f"cpu{cpu}", name))
+        allowed = set(self.cpus)
+        return [c for c in parse_cpu_list(text) if c in allowed] if text else [cpu]
+
+    def l3_domain(self, cpu):
+        cache_dir = os.path.join(self.root, f"cpu{cpu}", "cache")
+        if os.path.isdir(cache_dir):
+            for index in sorted(os.listdir(cache_dir)):
+                if read_text(os.path.join(cache_dir, index, "level")) == "3":
+                    text = read_text(os.path.join(cache_dir, index, "shared_cpu_list"))
+                    if text:
+                        return tuple(parse_cpu_list(text))
+        return tuple(self.cpus)
+
+    def cores(self):
+        # rdzenie fizyczne jako krotki wątków SMT, w kolejności pierwszego CPU
+        seen = []
+        for cpu in self.cpus:
+            core = tuple(self.siblings[cpu])
+            if core not in seen:
+                seen.append(core)
+        return seen
+
+    def l3_groups(self):
+        groups = {}
+        for core in self.cores():
+            groups.setdefault(self.l3[core[0]], []).append(core)
+        return list(groups.values())
+
+    def placement(self, count, policy='spread'):
+        if policy == 'smt':
+            # najpierw wszystkie wątki jednego rdzenia - procesy 0 i 1 dzielą rdzeń fizyczny
+            order = [cpu for core in self.cores() for cpu in core]
+        elif policy == 'l3':
+            # różne rdzenie fizyczne w obrębie jednej (największej) domeny L3
+            group = max(self.l3_groups(), key=len)
+            order = [core[0] for core in group]
+        elif policy == 'spread':
+            # po jednym wątku na rdzeń, na przemian między domenami L3
+            groups = self.l3_groups()
+            order = []
+            for i in range(max(len(group) for group in groups)):
+                order.extend(group[i][0] for group in groups if i < len(group))
+        else:
+            raise ValueError(f"Nieznane rozmieszczenie: {policy}")
+        # więcej procesów niż CPU w danym rozmieszczeniu - wracamy na początek listy
+        return [order[i % len(order)] for i in range(count)]
+
+
+def parse_cache_size(text):
+    # "48K", "2048K", "32M"
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+    text = text.strip()
+    if text and text[-1].upper() in units:
+        return int(text[:-1]) * units[text[-1].upper()]
+    return int(text)
+
+
+def cache_sizes(cpu=0, root=CPU_ROOT):
+    # rozmiary pamięci podręcznych danych widocznych z danego CPU: {'L1d': bajty, 'L2': ..., 'L3': ...}
+    cache_dir = os.path.join(root, f"cpu{cpu}", "cache")
+    sizes = {}
+    if not os.path.isdir(cache_dir):
+        return sizes
+    for index in sorted(os.listdir(cache_dir)):
+        level = read_text(os.path.join(cache_dir, index, "level"))
+        kind = read_text(os.path.join(cache_dir, index, "type"))
+        size = read_text(os.path.join(cache_dir, index, "size"))
+        if level is None or size is None or kind == "Instruction":
+            continue
+        sizes[f"L{level}d" if level == "1" else f"L{level}"] = parse_cache_size(size)
+    return sizes
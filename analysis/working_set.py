@@ -0,0 +1,84 @@
+import ctypes as ct
+
+import numpy as np
+
+CACHE_LINE = 64
+# pola rekordu, z których korzysta każda operacja - reszta nie musi zajmować miejsca w buforze
+OPERATION_FIELDS = {
+    'encap': ('public_key',),
+    'decap': ('secret_key', 'ciphertext'),
+    'sign': ('secret_key',),
+    'verify': ('public_key', 'signature'),
+}
+
+
+def sweep_sizes(max_keys=100000, per_decade=2):
+    # 1, 3, 10, 32, 100, ... - równe odstępy na osi logarytmicznej
+    count = int(round(np.log10(max_keys) * per_decade)) + 1
+    sizes = np.unique(np.round(np.logspace(0, np.log10(max_keys), count)).astype(int))
+    return [int(size) for size in sizes]
+
+
+def align(size, alignment=CACHE_LINE):
+    return (size + alignment - 1) // alignment * alignment
+
+
+def record_layout(operation, lengths):
+    # lengths: {pole: maksymalna długość}, zwraca ({pole: przesunięcie}, rozmiar rekordu)
+    if operation not in OPERATION_FIELDS:
+        raise ValueError(f"Nieobsługiwana operacja: {operation}")
+    offsets = {}
+    position = 0
+    for field in OPERATION_FIELDS[operation]:
+        offsets[field] = position
+        position += lengths[field]
+    # rekordy wyrównane do linii cache - sąsiednie klucze nie dzielą linii
+    return offsets, align(position)
+
+
+def buffer_address(buffer):
+    return ct.addressof((ct.c_char * len(buffer)).from_buffer(buffer))
+
+
+def aligned_buffer(size, alignment=CACHE_LINE):
+    # bytearray nie gwarantuje wyrównania do linii cache - alokujemy nadmiar i przesuwamy początek;
+    # zwraca (bufor, przesunięcie pierwszego wyrównanego bajtu)
+    buffer = bytearray(size + alignment - 1)
+    return buffer, -buffer_address(buffer) % alignment
+
+
+def pack_records(pool, offsets, record_size, count, buffer=None, start=0):
+    # pool: lista słowników {pole: bytes}; rekord i pochodzi z pool[i % len(pool)]
+    # buffer: opcjonalny bufor docelowy, rekordy zapisywane od bajtu start
+    template = bytearray(record_size * len(pool))
+    for i, entry in enumerate(pool):
+        for field, offset in offsets.items():
+            position = i * record_size + offset
+            template[position:position + len(entry[field])] = entry[field]
+    size = record_size * count
+    if buffer is None:
+        buffer, start = bytearray(size), 0
+    view = memoryview(template)
+    for position in range(0, size, len(template)):
+        chunk = view[:size - position]
+        buffer[start + position:start + position + len(chunk)] = chunk
+    return buffer
+
+
+def access_order(count, calls, seed=0):
+    # losowa permutacja kluczy powtarzana w kółko - prefetcher nie przewidzi następnego rekordu,
+    # a każdy klucz jest używany tak samo często
+    rng = np.random.default_rng(seed)
+    permutation = rng.permutation(count)
+    return np.resize(permutation, calls)
+
+
+def sweep_rows(results):
+    header = ['variant', 'operation', 'keys', 'working_set_bytes', 'p50_ms', 'p99_ms', 'mean_ms', 'p50_vs_single']
+    rows = []
+    for result in results:
+        single = result['points'][0]['p50_ms']
+        for point in result['points']:
+            rows.append([result['variant'], result['operation'], point['keys'], point['working_set_bytes'],
+                         point['p50_ms'], point['p99_ms'], point['mean_ms'], point['p50_ms'] / single])
+    return header, rows
@@ -0,0 +1,142 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from analysis.builds import parse_build_arg, speedup_table
+from report import csv_text, markdown_table
+
+BUILDS_DIR = "results/builds"
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_KEM = ("Kyber512", "Kyber768", "Kyber1024", "BIKE-L1", "BIKE-L3", "BIKE-L5")
+DEFAULT_SIG = ("Dilithium2", "Dilithium3", "Dilithium5", "Falcon-512", "Falcon-1024")
+
+
+def prepare_prefix(label, library_path, workdir):
+    # liboqs-python szuka liboqs w $OQS_INSTALL_PATH/lib, a find_library może zwrócić sam soname,
+    # więc linkujemy wszystkie nazwy wskazujące na ten plik i dokładamy katalog do LD_LIBRARY_PATH
+    lib_dir = os.path.join(workdir, label, "lib")
+    Path(lib_dir).mkdir(parents=True, exist_ok=True)
+    real_path = os.path.realpath(library_path)
+    directory = os.path.dirname(os.path.abspath(library_path))
+    names = {"liboqs.so", os.path.basename(library_path)}
+    for entry in os.listdir(directory):
+        if entry.startswith("liboqs") and os.path.realpath(os.path.join(directory, entry)) == real_path:
+            names.add(entry)
+    for name in names:
+        os.symlink(real_path, os.path.join(lib_dir, name))
+    return os.path.dirname(lib_dir), lib_dir
+
+
+def run_build(label, library_path, plan, workdir):
+    prefix, lib_dir = prepare_prefix(label, library_path, workdir)
+    plan_path = os.path.join(workdir, f"{label}-plan.json")
+    out_path = os.path.join(workdir, f"{label}-results.json")
+    with open(plan_path, "w") as f:
+        json.dump(dict(plan, label=label, library=os.path.abspath(library_path)), f)
+
+    env = dict(os.environ, OQS_INSTALL_PATH=prefix,
+               LD_LIBRARY_PATH=os.pathsep.join(filter(None, [lib_dir, os.environ.get("LD_LIBRARY_PATH")])))
+    subprocess.run([sys.executable, "-m", "algorithms.build_worker", plan_path, out_path],
+                   env=env, cwd=ROOT_DIR, check=True)
+    with open(out_path) as f:
+        return json.load(f)
+
+
+def build_timings(build):
+    timings = {}
+    for result in build['kem']:
+        timings[result['variant']] = {op: stats['p50'] for op, stats in result['time_stats'].items()}
+    for result in build['sig']:
+        timings[result['algorithm']] = {op: stats['p50'] for op, stats in result['time_stats'].items()}
+    return timings
+
+
+def compare_builds(libraries, kem_variants=DEFAULT_KEM, sig_variants=DEFAULT_SIG, iterations=1000,
+                   sig_iterations=100, message_length=1024, baseline=None, out_dir=None):
+    if baseline is not None and baseline not in [label for label, _ in libraries]:
+        raise ValueError(f"Nieznana budowa odniesienia: {baseline} "
+                         f"(dostępne: {', '.join(label for label, _ in libraries)})")
+    plan = {
+        'kem': list(kem_variants),
+        'sig': list(sig_variants),
+        'iterations': iterations,
+        'sig_iterations': sig_iterations,
+        'message': os.urandom(message_length).hex()
+    }
+
+    builds = []
+    failed = {}
+    # budowy uruchamiane po kolei - równoległe procesy zakłócałyby sobie nawzajem pomiary
+    with tempfile.TemporaryDirectory() as workdir:
+        for label, library_path in libraries:
+            try:
+                builds.append(run_build(label, library_path, plan, workdir))
+            except subprocess.CalledProcessError as e:
+                failed[label] = f"proces roboczy zakończył się kodem {e.returncode}"
+    if not builds:
+        raise RuntimeError("Żadna z budów liboqs nie zakończyła benchmarku")
+
+    if baseline in failed:
+        # budowa odniesienia nie dała wyników - porównujemy względem pierwszej udanej
+        failed[baseline] += f"; odniesieniem jest {builds[0]['label']}"
+        baseline = None
+    header, rows = speedup_table([(build['label'], build_timings(build)) for build in builds], baseline)
+    out_dir = out_dir or os.path.join(BUILDS_DIR, datetime.now().strftime("%Y%m%d-%H%M%S"))
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    comparison = {'plan': plan, 'builds': builds, 'failed': failed, 'speedup': {'header': header, 'rows': rows}}
+    with open(os.path.join(out_dir, "comparison.json"), "w") as f:
+        json.dump(comparison, f, indent=2)
+    with open(os.path.join(out_dir, "speedup.csv"), "w") as f:
+        f.write(csv_text(header, rows))
+    with open(os.path.join(out_dir, "speedup.md"), "w") as f:
+        f.write(markdown_table(header, rows))
+    comparison['out_dir'] = out_dir
+    return comparison
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Porównanie kilku budów liboqs, każda w osobnym procesie")
+    parser.add_argument("libraries", nargs="+", help="ścieżki do liboqs.so, opcjonalnie w postaci etykieta=ścieżka")
+    parser.add_argument("--kem", nargs="*", default=list(DEFAULT_KEM), help="warianty KEM")
+    parser.add_argument("--sig", nargs="*", default=list(DEFAULT_SIG), help="algorytmy podpisu")
+    parser.add_argument("--iterations", type=int, default=1000, help="iteracje KEM")
+    parser.add_argument("--sig-iterations", type=int, default=100, help="iteracje podpisu")
+    parser.add_argument("--baseline", help="etykieta budowy odniesienia (domyślnie pierwsza)")
+    parser.add_argument("--out", help="katalog wyjściowy")
+    args = parser.parse_args()
+
+    libraries = []
+    for value in args.libraries:
+        label, path = parse_build_arg(value)
+        if label in dict(libraries):
+            label = f"{label}-{len(libraries) + 1}"
+        libraries.append((label, path))
+    try:
+        comparison = compare_builds(libraries, args.kem, args.sig, args.iterations, args.sig_iterations,
+                                    baseline=args.baseline, out_dir=args.out)
+    except ValueError as e:
+        parser.error(str(e))
+
+    for build in comparison['builds']:
+        fingerprint = build['fingerprint']
+        options = fingerprint['compile_options']
+        print(f"{build['label']}: liboqs {fingerprint['oqs_version']}, {fingerprint['id']}, "
+              f"{', '.join(fingerprint['compiler']) or 'kompilator nieznany'}, "
+              f"OPT_TARGET={options.get('OQS_OPT_TARGET', '?')}, "
+              f"instrukcje: {', '.join(key[8:-13] for key in options if key.endswith('_INSTRUCTIONS')) or '-'}")
+        if build['missing']:
+            print(f"  brak w tej budowie: {', '.join(build['missing'])}")
+    for label, reason in comparison['failed'].items():
+        print(f"{label}: {reason}")
+    print()
+    print(markdown_table(comparison['speedup']['header'], comparison['speedup']['rows']))
+    print(f"Wyniki: {comparison['out_dir']}")
+
+
+if __name__ == "__main__":
+    main()
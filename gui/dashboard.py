@@ -0,0 +1,144 @@
+import time
+import tkinter as tk
+
+import numpy as np
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+
+def show_chart_grid(master, figs, titles, window_title, columns=2):
+    # wszystkie wykresy w jednym, niemodalnym oknie zamiast łańcucha grab_set()/wait_window()
+    window = tk.Toplevel(master)
+    window.title(window_title)
+    window.geometry("1400x900")
+
+    rows = (len(figs) + columns - 1) // columns
+    for i, (fig, title) in enumerate(zip(figs, titles)):
+        frame = tk.LabelFrame(window, text=title, padx=5, pady=5)
+        frame.grid(row=i // columns, column=i % columns, sticky='nsew', padx=5, pady=5)
+
+        fig.set_size_inches(6.5, 4)
+        fig.tight_layout(pad=1.5)
+        canvas = FigureCanvasTkAgg(fig, master=frame)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    for row in range(rows):
+        window.rowconfigure(row, weight=1)
+    for column in range(columns):
+        window.columnconfigure(column, weight=1)
+    return window
+
+
+class LiveDashboard:
+    # Ułamek czasu CPU, który może zająć rysowanie w trakcie benchmarku
+    RENDER_BUDGET = 0.05
+    MIN_INTERVAL = 0.1
+
+    def __init__(self, master, title, operations, variants, iterations):
+        self.operations = operations
+        self.variants = list(variants)
+        self.iterations = iterations
+        self.snapshots = {}
+        self.next_render = 0.0
+        self.render_time = 0.0
+        self.background = None
+
+        self.window = tk.Toplevel(master)
+        self.window.title(title)
+        self.window.geometry("1200x800")
+
+        self.fig = Figure(figsize=(12, 8))
+        panels = len(operations) + 1
+        columns = 2
+        rows = (panels + columns - 1) // columns
+        x = np.arange(len(self.variants))
+
+        self.axes = {}
+        self.bars = {}
+        self.tails = {}
+        for i, op in enumerate(operations):
+            ax = self.fig.add_subplot(rows, columns, i + 1)
+            ax.set_title(f"{op}: średnia (słupki) i p99 (kreski)")
+            ax.set_ylabel("Czas (ms)")
+            ax.set_xticks(x, self.variants, fontsize=8)
+            ax.set_ylim(0, 1e-3)
+            ax.grid(axis='y', linestyle='--', alpha=0.7)
+            self.axes[op] = ax
+            self.bars[op] = ax.bar(x, np.zeros(len(x)), animated=True)
+            self.tails[op], = ax.plot(x, np.zeros(len(x)), 'k_', markersize=18, animated=True)
+
+        ax = self.fig.add_subplot(rows, columns, panels)
+        ax.set_title("Postęp")
+        ax.set_xlim(0, 1)
+        ax.set_yticks(x, self.variants, fontsize=8)
+        self.progress_bars = ax.barh(x, np.zeros(len(x)), color='#2ca02c', animated=True)
+        self.fig.tight_layout(pad=1.5)
+
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.window)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+        self.canvas.draw()
+
+    def animated_artists(self):
+        for op in self.operations:
+            yield from self.bars[op]
+            yield self.tails[op]
+        yield from self.progress_bars
+
+    def on_draw(self, event):
+        # pełne przerysowanie (start, zmiana rozmiaru, nowa skala) - zapamiętujemy tło do blittingu
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self.animated_artists():
+            self.fig.draw_artist(artist)
+
+    def update(self, variant, metrics, done, force=False):
+        self.snapshots[variant] = (
+            {op: (metrics[op].mean, metrics[op].quantile(0.99)) for op in self.operations if metrics[op].count},
+            done
+        )
+        now = time.perf_counter()
+        if force or now >= self.next_render:
+            self.render()
+            self.next_render = time.perf_counter() + max(self.MIN_INTERVAL, self.render_time / self.RENDER_BUDGET)
+
+    def finish(self):
+        self.render()
+
+    def render(self):
+        if not self.window.winfo_exists():
+            return
+        start = time.perf_counter()
+        rescale = False
+
+        for op in self.operations:
+            means = np.zeros(len(self.variants))
+            tails = np.full(len(self.variants), np.nan)
+            for i, variant in enumerate(self.variants):
+                values, _ = self.snapshots.get(variant, ({}, 0))
+                if op in values:
+                    means[i], tails[i] = values[op]
+            for bar, height in zip(self.bars[op], means):
+                bar.set_height(height)
+            self.tails[op].set_ydata(tails)
+
+            heights = np.concatenate([means, tails])
+            top = np.nanmax(heights) if np.isfinite(heights).any() else 0
+            _, high = self.axes[op].get_ylim()
+            if top > high or (0 < top < high * 0.3):
+                self.axes[op].set_ylim(0, top * 1.25)
+                rescale = True
+
+        for i, variant in enumerate(self.variants):
+            _, done = self.snapshots.get(variant, ({}, 0))
+            self.progress_bars[i].set_width(done / self.iterations if self.iterations else 0)
+
+        if rescale or self.background is None:
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self.background)
+            for artist in self.animated_artists():
+                self.fig.draw_artist(artist)
+            self.canvas.blit(self.fig.bbox)
+        self.window.update()
+        self.render_time = time.perf_counter() - start
@@ -1,13 +1,20 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import messagebox
 from pathlib import Path
 import json
 import os
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from algorithms.kem.kyber import KyberBenchmark
 from algorithms.kem.bike import BikeBenchmark
-from visualization import plot_key_sizes, plot_total_time_comparison, plot_operation_times_bike, plot_operation_times_kyber
+from algorithms.kem.classical import ClassicalKemBenchmark
+from algorithms.kem.hybrid import HybridKemBenchmark
+from algorithms.session import latest_unfinished, new_session
+from analysis.energy import EnergyMeter
+from analysis.history import record_run
+from gui.dashboard import LiveDashboard, show_chart_grid
+from gui.results_explorer import ResultsExplorer
+from visualization import plot_key_sizes, plot_total_time_comparison, plot_operation_times_bike, plot_operation_times_kyber, plot_energy_kem, load_kem_results
+from visualization import KEM_BASELINE, find_baseline, plot_migration_overhead_kem
 
 class KemWindow:
     KEM_VARIANTS = [
@@ -16,13 +23,16 @@ class KemWindow:
         "Kyber1024",
         "BIKE-L1",
         "BIKE-L3",
-        "BIKE-L5"
+        "BIKE-L5",
+        "X25519",
+        "ECDH-P256",
+        "X25519+Kyber768"
     ]
 
     def __init__(self, master):
         self.window = tk.Toplevel(master)
         self.window.title("KEM Benchmark")
-        self.window.geometry("600x700")
+        self.window.geometry("600x740")
         self.window.resizable(False, False)
 
         tk.Label(self.window, text="Liczba iteracji:").pack(pady=10)
@@ -33,12 +43,26 @@ class KemWindow:
         self.check_vars = {}
         frame = tk.Frame(self.window)
         frame.pack(pady=5)
-        for variant in self.KEM_VARIANTS:
+        for i, variant in enumerate(self.KEM_VARIANTS):
             var = tk.IntVar(value=1)
             cb = tk.Checkbutton(frame, text=variant, variable=var)
-            cb.pack(side=tk.LEFT, padx=5)
+            cb.grid(row=i // 6, column=i % 6, sticky='w', padx=5)
             self.check_vars[variant] = var
 
+        options = tk.Frame(self.window)
+        options.pack()
+        self.live_var = tk.IntVar(value=1)
+        tk.Checkbutton(options, text="Wykresy na żywo", variable=self.live_var).pack(side=tk.LEFT, padx=5)
+        self.energy_var = tk.IntVar(value=0)
+        tk.Checkbutton(options, text="Pomiar energii (RAPL)", variable=self.energy_var).pack(side=tk.LEFT, padx=5)
+        self.session_var = tk.IntVar(value=0)
+        tk.Checkbutton(options, text="Sesja wznawialna", variable=self.session_var).pack(side=tk.LEFT, padx=5)
+        # więcej niż 1 proces tylko na życzenie - przebieg jest wtedy oznaczany w historii jako równoległy
+        tk.Label(options, text="Procesy sesji:").pack(side=tk.LEFT)
+        self.workers_entry = tk.Entry(options, width=3)
+        self.workers_entry.insert(0, "1")
+        self.workers_entry.pack(side=tk.LEFT, padx=5)
+
         self.run_button = tk.Button(self.window, text="Uruchom benchmark Kyber, BIKE", command=self.run_benchmarks)
         self.run_button.pack(pady=10)
 
@@ -49,6 +73,12 @@ class KemWindow:
         tk.Button(self.window, text="Pokaż wykresy", command=self.show_all_plots).pack(pady=10)
         tk.Button(self.window, text="Pokaż tabelę wyników", command=self.show_results_table).pack(pady=10)
 
+    def session_workers(self):
+        try:
+            return max(1, int(self.workers_entry.get()))
+        except ValueError:
+            return 1
+
     def append_output(self, text):
         self.output.config(state=tk.NORMAL)
         self.output.insert(tk.END, text)
@@ -82,34 +112,97 @@ class KemWindow:
             "Kyber1024": KyberBenchmark("1024"),
             "BIKE-L1": BikeBenchmark("L1"),
             "BIKE-L3": BikeBenchmark("L3"),
-            "BIKE-L5": BikeBenchmark("L5")
+            "BIKE-L5": BikeBenchmark("L5"),
+            "X25519": ClassicalKemBenchmark("X25519"),
+            "ECDH-P256": ClassicalKemBenchmark("ECDH-P256"),
+            "X25519+Kyber768": HybridKemBenchmark("X25519+Kyber768")
         }
 
+        session = None
+        if self.session_var.get() == 1:
+            session = latest_unfinished('kem')
+            if session is not None and messagebox.askyesno(
+                    "Sesja", f"Znaleziono niedokończoną sesję z {session.state['created_at']} "
+                             f"({len(session.pending_units())} jednostek do wykonania). Wznowić?"):
+                selected_variants = session.variants
+                iterations = session.state['iterations']
+            else:
+                if session is not None:
+                    session.abandon()
+                session = new_session('kem', [kem_variants[name] for name in selected_variants], iterations,
+                                      workers=self.session_workers())
+
         all_results = []
         self.append_output("Start benchmarku KEM...\n")
 
-        for name in selected_variants:
-            benchmark = kem_variants[name]
-            result = benchmark.run_benchmark(iterations=iterations)
-            all_results.append(result)
-
-            self.append_output(f"Algorytm: {result['variant']}\n")
-            self.append_output(f" - Czas generowania klucza: {result['time_avg']['keygen']:.2f} ms\n")
-            self.append_output(f" - Średni czas enkapsulacji: {result['time_avg']['encap']:.2f} ms\n")
-            self.append_output(f" - Średni czas dekapsulacji: {result['time_avg']['decap']:.2f} ms\n")
-            self.append_output(f" - Rozmiar klucza publicznego: {result['size_avg']['public_key']} bajtów\n")
-            self.append_output(f" - Rozmiar klucza prywatnego: {result['size_avg']['secret_key']} bajtów\n")
-            self.append_output(f" - Rozmiar szyfrogramu: {result['size_avg']['ciphertext']} bajtów\n")
-            self.append_output(f" - Liczba iteracji: {iterations}\n\n")
-
-        self.save_results(all_results)
-
-    def save_results(self, results):
+        energy_meter = None
+        if self.energy_var.get() == 1:
+            energy_meter = self.create_energy_meter()
+
+        dashboard = None
+        if self.live_var.get() == 1:
+            dashboard = LiveDashboard(self.window, "KEM Benchmark - na żywo", KyberBenchmark.OPERATIONS,
+                                      selected_variants, iterations)
+
+        if session is not None:
+            # jednostki pracy wykonywane po kolei (lub w przypiętych procesach), stan zapisywany po każdej z nich
+            self.append_output(f"Sesja: {session.path} ({len(session.pending_units())} jednostek do wykonania)\n\n")
+            try:
+                all_results = session.run(progress=dashboard.update if dashboard is not None else None,
+                                          energy_meter=energy_meter)
+            except RuntimeError as e:
+                messagebox.showerror("Błąd", str(e))
+                return
+            for result in all_results:
+                self.print_result(result, iterations)
+        else:
+            for name in selected_variants:
+                benchmark = kem_variants[name]
+                progress = None
+                if dashboard is not None:
+                    progress = lambda metrics, done, name=name: dashboard.update(name, metrics, done)
+                result = benchmark.run_benchmark(iterations=iterations, progress=progress, energy_meter=energy_meter)
+                all_results.append(result)
+                self.print_result(result, iterations)
+
+        if dashboard is not None:
+            dashboard.finish()
+        self.save_results(all_results, iterations, workers=session.workers if session is not None else 1)
+
+    def print_result(self, result, iterations):
+        self.append_output(f"Algorytm: {result['variant']}\n")
+        self.append_output(f" - Czas generowania klucza: {result['time_avg']['keygen']:.2f} ms\n")
+        self.append_output(f" - Średni czas enkapsulacji: {result['time_avg']['encap']:.2f} ms\n")
+        self.append_output(f" - Średni czas dekapsulacji: {result['time_avg']['decap']:.2f} ms\n")
+        for op in ('keygen', 'encap', 'decap'):
+            stats = result['time_stats'][op]
+            self.append_output(f" - {op} p50/p99/p99.9: {stats['p50']:.3f} / {stats['p99']:.3f} / {stats['p999']:.3f} ms\n")
+        if 'energy_avg' in result:
+            energy = result['energy_avg']
+            self.append_output(f" - Energia keygen/encap/decap: {energy['keygen']:.1f} / {energy['encap']:.1f} / {energy['decap']:.1f} µJ\n")
+        self.append_output(f" - Rozmiar klucza publicznego: {result['size_avg']['public_key']} bajtów\n")
+        self.append_output(f" - Rozmiar klucza prywatnego: {result['size_avg']['secret_key']} bajtów\n")
+        self.append_output(f" - Rozmiar szyfrogramu: {result['size_avg']['ciphertext']} bajtów\n")
+        self.append_output(f" - Liczba iteracji: {iterations}\n\n")
+
+    def create_energy_meter(self):
+        meter = EnergyMeter()
+        if not meter.available():
+            self.append_output("Liczniki RAPL (/sys/class/powercap) niedostępne - pomijam pomiar energii\n")
+            return None
+        self.append_output("Kalibracja mocy spoczynkowej RAPL...\n")
+        idle = meter.calibrate_idle()
+        for label, power in idle.items():
+            self.append_output(f" - {label}: {power / 1e6:.2f} W\n")
+        return meter
+
+    def save_results(self, results, iterations=None, workers=1):
         base_dir = "results/kem"
         Path(base_dir).mkdir(parents=True, exist_ok=True)
         json_path = os.path.join(base_dir, "kem_results.json")
         with open(json_path, "w") as f:
             json.dump(results, f, indent=2)
+        record_run('kem', results, iterations=iterations, workers=workers)
 
     def show_all_plots(self):
         figs = [
@@ -121,58 +214,15 @@ class KemWindow:
 
         titles = ["Operation Times Kyber", "Operation Times Bike", "Key Sizes", "Total Time Comparison"]
 
-        for fig, title in zip(figs, titles):
-            fig.set_size_inches(8, 5)
-            fig.tight_layout(pad=2.0)
-
-            plot_window = tk.Toplevel(self.window)
-            plot_window.title(title)
-            plot_window.geometry("900x600")
-
-            frame = tk.Frame(plot_window, padx=20, pady=20)
-            frame.pack(fill=tk.BOTH, expand=True)
-
-            canvas = FigureCanvasTkAgg(fig, master=frame)
-            canvas.draw()
-            w = canvas.get_tk_widget()
-            w.pack(padx=10, pady=10)
+        results = load_kem_results()
+        if any(r.get('energy_avg') for r in results):
+            figs.append(plot_energy_kem(results=results))
+            titles.append("Energy per Operation")
+        if find_baseline(results, 'variant', KEM_BASELINE):
+            figs.append(plot_migration_overhead_kem(results=results))
+            titles.append("Migration Overhead")
 
-            plot_window.grab_set()
-            plot_window.wait_window(plot_window)
+        show_chart_grid(self.window, figs, titles, "Wykresy KEM")
 
     def show_results_table(self):
-        base_dir = "results/kem"
-        json_path = os.path.join(base_dir, "kem_results.json")
-        if not os.path.exists(json_path):
-            messagebox.showerror("Błąd", "Plik wyników nie istnieje!")
-            return
-
-        with open(json_path) as f:
-            results = json.load(f)
-
-        table_window = tk.Toplevel(self.window)
-        table_window.title("Tabela wyników benchmarku KEM")
-        table_window.geometry("900x300")
-
-        frame = tk.Frame(table_window, padx=10, pady=10)
-        frame.pack(fill=tk.BOTH, expand=True)
-
-        columns = ['variant', 'keygen_time', 'encap_time', 'decap_time', 'public_key_size', 'ciphertext_size', 'secret_key_size']
-        tree = ttk.Treeview(frame, columns=columns, show='headings')
-
-        for col in columns:
-            tree.heading(col, text=col.replace('_', ' ').capitalize())
-            tree.column(col, width=120, anchor='center')
-
-        for result in results:
-            tree.insert('', tk.END, values=(
-                result['variant'],
-                round(result['time_avg']['keygen'], 2),
-                round(result['time_avg']['encap'], 2),
-                round(result['time_avg']['decap'], 2),
-                result['size_avg']['public_key'],
-                result['size_avg']['ciphertext'],
-                result['size_avg']['secret_key']
-            ))
-
-        tree.pack(fill=tk.BOTH, expand=True)
+        ResultsExplorer(self.window, kind='kem')
@@ -0,0 +1,115 @@
+import tkinter as tk
+from tkinter import messagebox
+from pathlib import Path
+import json
+import os
+
+from algorithms.leakage import create_target
+from analysis.leakage import LeakageTest
+
+
+class LeakageWindow:
+    VARIANTS = [
+        "Kyber512",
+        "Kyber768",
+        "Kyber1024",
+        "BIKE-L1",
+        "BIKE-L3",
+        "BIKE-L5",
+        "Dilithium2",
+        "Dilithium3",
+        "Dilithium5",
+        "Falcon-512",
+        "Falcon-1024"
+    ]
+
+    def __init__(self, master):
+        self.window = tk.Toplevel(master)
+        self.window.title("Test stałoczasowości (dudect)")
+        self.window.geometry("800x700")
+
+        tk.Label(self.window, text="Liczba pomiarów na wariant:").pack(pady=5)
+        self.measurements_entry = tk.Entry(self.window)
+        self.measurements_entry.insert(0, "1000000")
+        self.measurements_entry.pack(pady=5)
+
+        tk.Label(self.window, text="Limit czasu na wariant (s, puste = bez limitu):").pack(pady=5)
+        self.time_entry = tk.Entry(self.window)
+        self.time_entry.pack(pady=5)
+
+        self.check_vars = {}
+        frame = tk.Frame(self.window)
+        frame.pack(pady=5)
+        for i, variant in enumerate(self.VARIANTS):
+            var = tk.IntVar(value=0)
+            cb = tk.Checkbutton(frame, text=variant, variable=var)
+            cb.grid(row=i // 6, column=i % 6, sticky='w', padx=5)
+            self.check_vars[variant] = var
+
+        tk.Label(self.window, text="KEM: dekapsulacja poprawnego vs losowego szyfrogramu, "
+                                   "podpis: stała vs losowa wiadomość").pack(pady=5)
+
+        self.run_button = tk.Button(self.window, text="Uruchom test", command=self.run_tests)
+        self.run_button.pack(pady=10)
+
+        self.output = tk.Text(self.window, height=25, width=95)
+        self.output.pack(pady=10)
+        self.output.config(state=tk.DISABLED)
+
+    def append_output(self, text):
+        self.output.config(state=tk.NORMAL)
+        self.output.insert(tk.END, text)
+        self.output.see(tk.END)
+        self.output.config(state=tk.DISABLED)
+        self.window.update()
+
+    def clear_output(self):
+        self.output.config(state=tk.NORMAL)
+        self.output.delete('1.0', tk.END)
+        self.output.config(state=tk.DISABLED)
+
+    def show_progress(self, status):
+        self.append_output(
+            f"   {status['measurements']:>10} pomiarów | max t = {status['max_t']:7.2f} | "
+            f"{status['elapsed_s']:7.1f} s\n"
+        )
+
+    def run_tests(self):
+        self.clear_output()
+
+        try:
+            measurements = int(self.measurements_entry.get())
+            time_text = self.time_entry.get().strip()
+            max_seconds = float(time_text) if time_text else None
+        except ValueError:
+            messagebox.showerror("Błąd", "Niepoprawna liczba pomiarów lub limit czasu")
+            return
+
+        selected_variants = [variant for variant, var in self.check_vars.items() if var.get() == 1]
+        if not selected_variants:
+            messagebox.showerror("Błąd", "Wybierz przynajmniej jeden algorytm!")
+            return
+
+        self.run_button.config(state=tk.DISABLED)
+        all_results = []
+        try:
+            for variant in selected_variants:
+                test = LeakageTest(create_target(variant))
+                self.append_output(f"Algorytm: {variant} ({test.target.operation_name})\n")
+                result = test.run(measurements=measurements, max_seconds=max_seconds, progress=self.show_progress)
+                all_results.append(result)
+
+                verdict = "PASS" if result['passed'] else "FAIL"
+                self.append_output(f" - Wynik: {verdict} ({result['verdict']}), max t = {result['max_t']:.2f}\n\n")
+        finally:
+            self.run_button.config(state=tk.NORMAL)
+
+        self.save_results(all_results)
+        self.append_output("Wyniki zapisano do results/leakage/leakage_results.json\n")
+
+    def save_results(self, results):
+        base_dir = "results/leakage"
+        Path(base_dir).mkdir(parents=True, exist_ok=True)
+        json_path = os.path.join(base_dir, "leakage_results.json")
+        with open(json_path, "w") as f:
+            json.dump(results, f, indent=2)
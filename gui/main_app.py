@@ -1,17 +1,26 @@
+import os
 import tkinter as tk
+from tkinter import messagebox
 from .kem_window import KemWindow
 from .sig_window import SigWindow
+from .leakage_window import LeakageWindow
+from .rng_window import RngWindow
+from .selector_window import SelectorWindow
 
 
 class MainApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Algorytmy Post Kwantowe")
-        self.root.geometry("400x200")
+        self.root.geometry("400x400")
 
         tk.Label(root, text="Wybierz tryb:").pack(pady=10)
         tk.Button(root, text="KEM Benchmark", command=self.open_kem_window).pack(pady=10)
         tk.Button(root, text="Signature Benchmark & Signing", command=self.open_sig_window).pack(pady=10)
+        tk.Button(root, text="Test stałoczasowości (dudect)", command=self.open_leakage_window).pack(pady=10)
+        tk.Button(root, text="Koszt RNG (system / OpenSSL / deterministyczny)", command=self.open_rng_window).pack(pady=10)
+        tk.Button(root, text="Dobór algorytmów (ograniczenia i front Pareto)", command=self.open_selector_window).pack(pady=10)
+        tk.Button(root, text="Raport HTML z ostatnich wyników", command=self.generate_report).pack(pady=10)
 
     def open_kem_window(self):
         KemWindow(self.root)
@@ -19,6 +28,24 @@ class MainApp:
     def open_sig_window(self):
         SigWindow(self.root)
 
+    def open_leakage_window(self):
+        LeakageWindow(self.root)
+
+    def open_rng_window(self):
+        RngWindow(self.root)
+
+    def open_selector_window(self):
+        SelectorWindow(self.root)
+
+    def generate_report(self):
+        from report import generate_report
+        try:
+            report = generate_report()
+        except ValueError as e:
+            messagebox.showerror("Błąd", str(e))
+            return
+        messagebox.showinfo("Raport", f"Raport zapisano do {os.path.join(report['out_dir'], 'report.html')}")
+
 
 def main():
     root = tk.Tk()
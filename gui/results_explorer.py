@@ -0,0 +1,149 @@
+import tkinter as tk
+from tkinter import ttk
+
+from analysis.history import COLUMNS, ResultsHistory
+
+
+class ResultsExplorer:
+    PAGE_SIZE = 200
+    SPARKLINE_WIDTH = 220
+    SPARKLINE_HEIGHT = 24
+    DEFAULT_OPERATION = {'kem': 'decap', 'sig': 'sign'}
+
+    def __init__(self, master, kind, history_path=None):
+        self.kind = kind
+        self.history = ResultsHistory(history_path) if history_path else ResultsHistory()
+        self.history.import_legacy_results()
+
+        self.order_by = 'created_at'
+        self.descending = True
+        self.loaded = 0
+        self.total = 0
+
+        self.window = tk.Toplevel(master)
+        self.window.title("Historia wyników KEM" if kind == 'kem' else "Historia wyników podpisu")
+        self.window.geometry("1100x650")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        filters = tk.Frame(self.window, padx=10, pady=5)
+        filters.pack(fill=tk.X)
+
+        self.filter_widgets = {}
+        for column, label in (('variant', "Wariant"), ('operation', "Operacja"), ('host', "Host")):
+            tk.Label(filters, text=label + ":").pack(side=tk.LEFT)
+            values = [''] + self.history.distinct_values(column, kind=kind)
+            combo = ttk.Combobox(filters, values=values, width=14, state='readonly')
+            combo.pack(side=tk.LEFT, padx=5)
+            self.filter_widgets[column] = combo
+
+        for column, label in (('date_from', "Od (RRRR-MM-DD)"), ('date_to', "Do")):
+            tk.Label(filters, text=label + ":").pack(side=tk.LEFT)
+            entry = tk.Entry(filters, width=12)
+            entry.pack(side=tk.LEFT, padx=5)
+            self.filter_widgets[column] = entry
+
+        tk.Button(filters, text="Filtruj", command=self.reload).pack(side=tk.LEFT, padx=5)
+
+        self.status = tk.Label(self.window, anchor='w', padx=10)
+        self.status.pack(fill=tk.X)
+
+        frame = tk.Frame(self.window, padx=10, pady=5)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        self.tree = ttk.Treeview(frame, columns=COLUMNS, show='headings')
+        for col in COLUMNS:
+            self.tree.heading(col, text=col.replace('_', ' ').capitalize(), command=lambda c=col: self.sort_by(c))
+            self.tree.column(col, width=150 if col == 'created_at' else 90, anchor='center')
+
+        self.scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+
+        tk.Label(self.window, text="Mediana w kolejnych przebiegach:", anchor='w', padx=10).pack(fill=tk.X)
+        self.sparklines = tk.Canvas(self.window, height=150, background='white')
+        self.sparklines.pack(fill=tk.X, padx=10, pady=5)
+
+        self.reload()
+
+    def close(self):
+        self.history.close()
+        self.window.destroy()
+
+    def current_filters(self):
+        filters = {'kind': self.kind}
+        for column, widget in self.filter_widgets.items():
+            filters[column] = widget.get().strip()
+        return filters
+
+    def sort_by(self, column):
+        if self.order_by == column:
+            self.descending = not self.descending
+        else:
+            self.order_by = column
+            self.descending = False
+        self.reload()
+
+    def reload(self):
+        filters = self.current_filters()
+        self.tree.delete(*self.tree.get_children())
+        self.loaded = 0
+        self.total = self.history.count_measurements(filters)
+        self.load_page()
+        self.draw_sparklines(filters)
+
+    def load_page(self):
+        if self.loaded >= self.total:
+            return
+        rows = self.history.query_measurements(
+            self.current_filters(), order_by=self.order_by, descending=self.descending,
+            limit=self.PAGE_SIZE, offset=self.loaded
+        )
+        for row in rows:
+            self.tree.insert('', tk.END, values=[self.format_value(value) for value in row])
+        self.loaded += len(rows)
+        arrow = "↓" if self.descending else "↑"
+        self.status.config(text=f"Wczytano {self.loaded} z {self.total} wierszy, sortowanie: {self.order_by} {arrow}")
+
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        # kolejna strona dopiero gdy użytkownik zbliża się do końca listy
+        if float(last) > 0.9 and self.loaded < self.total:
+            self.load_page()
+
+    def format_value(self, value):
+        if isinstance(value, float):
+            return round(value, 4)
+        return "" if value is None else value
+
+    def draw_sparklines(self, filters):
+        self.sparklines.delete('all')
+        series_filters = dict(filters)
+        if not series_filters.get('operation'):
+            series_filters['operation'] = self.DEFAULT_OPERATION[self.kind]
+        series = self.history.median_series(series_filters)
+
+        row_height = self.SPARKLINE_HEIGHT + 6
+        self.sparklines.config(height=max(row_height * len(series), row_height))
+        for i, (variant, points) in enumerate(series.items()):
+            y0 = i * row_height + 3
+            self.sparklines.create_text(10, y0 + self.SPARKLINE_HEIGHT / 2, text=variant, anchor='w')
+
+            values = [value for _, value in points if value is not None]
+            if not values:
+                continue
+            low, high = min(values), max(values)
+            span = (high - low) or 1.0
+            step = self.SPARKLINE_WIDTH / max(len(values) - 1, 1)
+            coords = []
+            for j, value in enumerate(values):
+                coords.append(120 + j * step)
+                coords.append(y0 + self.SPARKLINE_HEIGHT - (value - low) / span * self.SPARKLINE_HEIGHT)
+            if len(coords) >= 4:
+                self.sparklines.create_line(*coords, fill='#1f77b4', width=1.5)
+            else:
+                self.sparklines.create_oval(coords[0] - 2, coords[1] - 2, coords[0] + 2, coords[1] + 2, fill='#1f77b4')
+            self.sparklines.create_text(
+                130 + self.SPARKLINE_WIDTH, y0 + self.SPARKLINE_HEIGHT / 2, anchor='w',
+                text=f"{series_filters['operation']}: ostatnio {values[-1]:.4f} ms (min {low:.4f}, max {high:.4f})"
+            )
@@ -0,0 +1,108 @@
+import tkinter as tk
+from tkinter import messagebox
+from pathlib import Path
+import json
+import os
+
+from algorithms.kem.kyber import KyberBenchmark
+from algorithms.kem.bike import BikeBenchmark
+from algorithms.signature.dilithium import DilithiumBenchmark
+from algorithms.signature.falcon import FalconBenchmark
+from algorithms.rng import RNG_SOURCES, run_rng_comparison
+
+
+class RngWindow:
+    BENCHMARKS = {
+        "Kyber512": lambda: KyberBenchmark("512"),
+        "Kyber768": lambda: KyberBenchmark("768"),
+        "Kyber1024": lambda: KyberBenchmark("1024"),
+        "BIKE-L1": lambda: BikeBenchmark("L1"),
+        "BIKE-L3": lambda: BikeBenchmark("L3"),
+        "BIKE-L5": lambda: BikeBenchmark("L5"),
+        "Dilithium2": lambda: DilithiumBenchmark("Dilithium2", message_length=1024),
+        "Dilithium3": lambda: DilithiumBenchmark("Dilithium3", message_length=1024),
+        "Dilithium5": lambda: DilithiumBenchmark("Dilithium5", message_length=1024),
+        "Falcon-512": lambda: FalconBenchmark("Falcon-512", message_length=1024),
+        "Falcon-1024": lambda: FalconBenchmark("Falcon-1024", message_length=1024)
+    }
+
+    def __init__(self, master):
+        self.window = tk.Toplevel(master)
+        self.window.title("Koszt RNG")
+        self.window.geometry("800x700")
+
+        tk.Label(self.window, text="Liczba iteracji na operację:").pack(pady=5)
+        self.iter_entry = tk.Entry(self.window)
+        self.iter_entry.insert(0, "1000")
+        self.iter_entry.pack(pady=5)
+
+        tk.Label(self.window, text="Ziarno źródła deterministycznego:").pack(pady=5)
+        self.seed_entry = tk.Entry(self.window)
+        self.seed_entry.insert(0, "pqc-benchmark")
+        self.seed_entry.pack(pady=5)
+
+        self.check_vars = {}
+        frame = tk.Frame(self.window)
+        frame.pack(pady=5)
+        for i, variant in enumerate(self.BENCHMARKS):
+            var = tk.IntVar(value=0)
+            cb = tk.Checkbutton(frame, text=variant, variable=var)
+            cb.grid(row=i // 6, column=i % 6, sticky='w', padx=5)
+            self.check_vars[variant] = var
+
+        tk.Button(self.window, text="Porównaj źródła losowości", command=self.run_comparison).pack(pady=10)
+
+        self.output = tk.Text(self.window, height=25, width=95)
+        self.output.pack(pady=10)
+        self.output.config(state=tk.DISABLED)
+
+    def append_output(self, text):
+        self.output.config(state=tk.NORMAL)
+        self.output.insert(tk.END, text)
+        self.output.see(tk.END)
+        self.output.config(state=tk.DISABLED)
+        self.window.update()
+
+    def clear_output(self):
+        self.output.config(state=tk.NORMAL)
+        self.output.delete('1.0', tk.END)
+        self.output.config(state=tk.DISABLED)
+
+    def run_comparison(self):
+        self.clear_output()
+
+        try:
+            iterations = int(self.iter_entry.get())
+        except ValueError:
+            messagebox.showerror("Błąd", "Niepoprawna liczba iteracji")
+            return
+        seed = self.seed_entry.get().encode()
+
+        selected_variants = [variant for variant, var in self.check_vars.items() if var.get() == 1]
+        if not selected_variants:
+            messagebox.showerror("Błąd", "Wybierz przynajmniej jeden algorytm!")
+            return
+
+        all_results = []
+        for variant in selected_variants:
+            self.append_output(f"Algorytm: {variant}\n")
+            result = run_rng_comparison(self.BENCHMARKS[variant](), iterations=iterations, seed=seed)
+            all_results.append(result)
+
+            for name, reason in result['skipped'].items():
+                self.append_output(f" - źródło {name} niedostępne: {reason}\n")
+            for op, overhead in result['rng_overhead'].items():
+                self.append_output(f" - {op}: arytmetyka {overhead['arithmetic_ms']:.4f} ms, "
+                                   f"{overhead['rng_calls_per_op']:.1f} wywołań RNG / {overhead['rng_bytes_per_op']:.0f} B\n")
+                for name in RNG_SOURCES:
+                    if name in overhead:
+                        source = overhead[name]
+                        self.append_output(f"     {name}: narzut RNG {source['measured_ms']:.4f} ms "
+                                           f"({source['share'] * 100:.1f}%), bezpośrednio {source['direct_ms']:.4f} ms\n")
+            self.append_output("\n")
+
+        base_dir = "results/rng"
+        Path(base_dir).mkdir(parents=True, exist_ok=True)
+        with open(os.path.join(base_dir, "rng_results.json"), "w") as f:
+            json.dump(all_results, f, indent=2)
+        self.append_output("Wyniki zapisano do results/rng/rng_results.json\n")
@@ -0,0 +1,124 @@
+import tkinter as tk
+from tkinter import ttk
+
+from analysis.history import ResultsHistory
+from analysis.selector import DEFAULT_WEIGHTS, OBJECTIVES, SELECTION_HEADER, AlgorithmSelector, selection_rows
+
+
+class SelectorWindow:
+    # opóźnienie przeliczenia po wpisaniu znaku - nie liczymy rankingu przy każdym naciśnięciu klawisza
+    REFRESH_DELAY_MS = 150
+    CONSTRAINTS = (
+        ('max_kem_bytes', "Maks. klucz publiczny + szyfrogram KEM (B)", float),
+        ('max_decap_p99_us', "Maks. p99 dekapsulacji (µs)", float),
+        ('min_level', "Min. poziom NIST (1-5)", int),
+        ('max_signature_bytes', "Maks. rozmiar podpisu (B)", float),
+        ('max_sign_p99_us', "Maks. p99 podpisu (µs)", float),
+    )
+    WEIGHT_LABELS = {'bytes': "Bajty", 'latency': "Czas uzgodnienia", 'tail': "Ogon p99", 'level': "Poziom NIST"}
+
+    def __init__(self, master, history_path=None):
+        with (ResultsHistory(history_path) if history_path else ResultsHistory()) as history:
+            history.import_legacy_results()
+            self.selector = AlgorithmSelector(history.connection)
+        self.pending = None
+
+        self.window = tk.Toplevel(master)
+        self.window.title("Dobór algorytmów")
+        self.window.geometry("1100x650")
+
+        form = tk.Frame(self.window, padx=10, pady=5)
+        form.pack(fill=tk.X)
+
+        self.constraint_entries = {}
+        for row, (name, label, _) in enumerate(self.CONSTRAINTS):
+            tk.Label(form, text=label + ":").grid(row=row, column=0, sticky='w')
+            entry = tk.Entry(form, width=10)
+            entry.grid(row=row, column=1, padx=5, sticky='w')
+            entry.bind("<KeyRelease>", self.schedule_refresh)
+            self.constraint_entries[name] = entry
+
+        self.weight_scales = {}
+        for row, name in enumerate(OBJECTIVES):
+            tk.Label(form, text=f"Waga: {self.WEIGHT_LABELS[name]}").grid(row=row, column=2, padx=(30, 0), sticky='w')
+            scale = tk.Scale(form, from_=0, to=5, resolution=0.5, orient=tk.HORIZONTAL, length=150,
+                             command=lambda _: self.schedule_refresh())
+            scale.set(DEFAULT_WEIGHTS[name])
+            scale.grid(row=row, column=3, sticky='w')
+            self.weight_scales[name] = scale
+
+        tk.Label(form, text="Host:").grid(row=0, column=4, padx=(30, 0), sticky='w')
+        self.host_combo = ttk.Combobox(form, values=[''] + self.selector.hosts(), width=16, state='readonly')
+        self.host_combo.grid(row=0, column=5, sticky='w')
+        self.host_combo.bind("<<ComboboxSelected>>", self.schedule_refresh)
+
+        tk.Label(form, text="Wiadomość (B):").grid(row=1, column=4, padx=(30, 0), sticky='w')
+        self.message_combo = ttk.Combobox(form, values=self.selector.message_sizes(), width=16, state='readonly')
+        default_size = self.selector.default_message_size()
+        if default_size is not None:
+            self.message_combo.set(default_size)
+        self.message_combo.grid(row=1, column=5, sticky='w')
+        self.message_combo.bind("<<ComboboxSelected>>", self.schedule_refresh)
+
+        self.pareto_only = tk.BooleanVar(value=True)
+        tk.Checkbutton(form, text="Tylko front Pareto", variable=self.pareto_only,
+                       command=self.schedule_refresh).grid(row=2, column=4, columnspan=2, padx=(30, 0), sticky='w')
+
+        self.status = tk.Label(self.window, anchor='w', padx=10)
+        self.status.pack(fill=tk.X)
+
+        frame = tk.Frame(self.window, padx=10, pady=5)
+        frame.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(frame, columns=SELECTION_HEADER, show='headings')
+        for col in SELECTION_HEADER:
+            self.tree.heading(col, text=col.replace('_', ' ').capitalize())
+            self.tree.column(col, width=130 if col in ('kem', 'signature', 'host') else 90, anchor='center')
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+
+        self.refresh()
+
+    def schedule_refresh(self, _event=None):
+        if self.pending is not None:
+            self.window.after_cancel(self.pending)
+        self.pending = self.window.after(self.REFRESH_DELAY_MS, self.refresh)
+
+    def current_constraints(self):
+        constraints = {}
+        invalid = []
+        for name, label, convert in self.CONSTRAINTS:
+            text = self.constraint_entries[name].get().strip().replace(",", ".")
+            if not text:
+                continue
+            try:
+                constraints[name] = convert(text)
+            except ValueError:
+                invalid.append(label)
+        return constraints, invalid
+
+    def refresh(self):
+        self.pending = None
+        constraints, invalid = self.current_constraints()
+        weights = {name: scale.get() for name, scale in self.weight_scales.items()}
+        message_size = self.message_combo.get()
+        ranking = self.selector.select(constraints, weights, host=self.host_combo.get() or None,
+                                       pareto_only=self.pareto_only.get(),
+                                       message_size=int(message_size) if message_size else None)
+
+        self.tree.delete(*self.tree.get_children())
+        if ranking.empty:
+            self.status.config(text="Żadna para KEM + podpis nie spełnia ograniczeń")
+        else:
+            _, rows = selection_rows(ranking)
+            for row in rows:
+                self.tree.insert('', tk.END, values=[self.format_value(value) for value in row])
+            self.status.config(text=f"Par w rankingu: {len(rows)}")
+        if invalid:
+            self.status.config(text=self.status.cget('text') + f" (pominięto nieprawidłowe pola: {', '.join(invalid)})")
+
+    def format_value(self, value):
+        if isinstance(value, float):
+            return round(value, 4)
+        return "" if value is None else value
@@ -1,11 +1,19 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import messagebox
 import os
 import json
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from algorithms.signature.dilithium import DilithiumBenchmark
 from algorithms.signature.falcon import FalconBenchmark
-from visualization import plot_keygen_times, plot_sign_times, plot_verify_times, plot_total_times, plot_key_sizes_signature
+from algorithms.signature.base import SignatureBenchmark
+from algorithms.signature.classical import CLASSICAL_SIGNATURES, ClassicalSignatureBenchmark
+from algorithms.signature.hybrid import HybridSignatureBenchmark
+from algorithms.session import latest_unfinished, new_session
+from analysis.energy import EnergyMeter
+from analysis.history import record_run
+from gui.dashboard import LiveDashboard, show_chart_grid
+from gui.results_explorer import ResultsExplorer
+from visualization import plot_keygen_times, plot_sign_times, plot_verify_times, plot_total_times, plot_key_sizes_signature, plot_energy_signature
+from visualization import SIGNATURE_BASELINE, find_baseline, plot_migration_overhead_signature
 
 class SigWindow:
     def __init__(self, master):
@@ -15,6 +23,10 @@ class SigWindow:
             "Dilithium5",
             "Falcon-512",
             "Falcon-1024",
+            "Ed25519",
+            "ECDSA-P256",
+            "RSA-3072",
+            "Ed25519+Dilithium2",
         ]
         self.window = tk.Toplevel(master)
         self.window.title("Signature Benchmark & Signing")
@@ -33,12 +45,26 @@ class SigWindow:
         self.check_vars = []
         frame = tk.Frame(self.window)
         frame.pack(pady=5)
-        for alg in self.ALGORITHMS:
+        for i, alg in enumerate(self.ALGORITHMS):
             var = tk.IntVar(value=1)  # domyślnie zaznaczone
             cb = tk.Checkbutton(frame, text=alg, variable=var)
-            cb.pack(side=tk.LEFT, padx=5)
+            cb.grid(row=i // 5, column=i % 5, sticky='w', padx=5)
             self.check_vars.append((alg, var))
 
+        options = tk.Frame(self.window)
+        options.pack()
+        self.live_var = tk.IntVar(value=1)
+        tk.Checkbutton(options, text="Wykresy na żywo", variable=self.live_var).pack(side=tk.LEFT, padx=5)
+        self.energy_var = tk.IntVar(value=0)
+        tk.Checkbutton(options, text="Pomiar energii (RAPL)", variable=self.energy_var).pack(side=tk.LEFT, padx=5)
+        self.session_var = tk.IntVar(value=0)
+        tk.Checkbutton(options, text="Sesja wznawialna", variable=self.session_var).pack(side=tk.LEFT, padx=5)
+        # więcej niż 1 proces tylko na życzenie - przebieg jest wtedy oznaczany w historii jako równoległy
+        tk.Label(options, text="Procesy sesji:").pack(side=tk.LEFT)
+        self.workers_entry = tk.Entry(options, width=3)
+        self.workers_entry.insert(0, "1")
+        self.workers_entry.pack(side=tk.LEFT, padx=5)
+
         tk.Button(self.window, text="Uruchom benchmark podpisu", command=self.run_signature_benchmark).pack(pady=10)
         tk.Button(self.window, text="Pokaż wykresy z wyników", command=self.show_charts_from_file).pack(pady=5)
         tk.Button(self.window, text="Pokaż tabelę wyników", command=self.show_results_table).pack(pady=5)
@@ -46,6 +72,12 @@ class SigWindow:
         self.output = tk.Text(self.window, height=15, width=80)
         self.output.pack(pady=5)
 
+    def session_workers(self):
+        try:
+            return max(1, int(self.workers_entry.get()))
+        except ValueError:
+            return 1
+
     def append_output(self, text):
         self.output.insert(tk.END, text)
         self.output.see(tk.END)
@@ -67,30 +99,72 @@ class SigWindow:
         except ValueError:
             iterations = 10
 
+        session = None
+        if self.session_var.get() == 1:
+            session = latest_unfinished('sig')
+            if session is not None and messagebox.askyesno(
+                    "Sesja", f"Znaleziono niedokończoną sesję z {session.state['created_at']} "
+                             f"({len(session.pending_units())} jednostek do wykonania). Wznowić?"):
+                selected_algorithms = session.variants
+                iterations = session.state['iterations']
+                message_bytes = bytes.fromhex(session.state['specs'][0]['message'])
+            else:
+                if session is not None:
+                    session.abandon()
+                session = None
+
         all_results = []
 
-        for alg_name in selected_algorithms:
-            # Wybór odpowiedniej klasy benchmarku
-            if alg_name.startswith("Dilithium"):
-                benchmark = DilithiumBenchmark(variant=alg_name, message=message_bytes)
-            elif alg_name.startswith("Falcon"):
-                benchmark = FalconBenchmark(variant=alg_name, message=message_bytes)
-            else:
-                self.append_output(f"Nieobsługiwany algorytm: {alg_name}\n")
-                continue
-
-            results = benchmark.run_benchmark(iterations=iterations)
-            all_results.extend(results)
-
-            for res in results:
-                self.append_output(f"Algorytm: {res['algorithm']}\n")
-                self.append_output(f" - Czas generowania klucza: {res['keygen_time_ms']:.2f} ms\n")
-                self.append_output(f" - Średni czas podpisu: {res['avg_sign_time_ms']:.2f} ms\n")
-                self.append_output(f" - Średni czas weryfikacji: {res['avg_verify_time_ms']:.2f} ms\n")
-                self.append_output(f" - Rozmiar klucza publicznego: {res['public_key_size']} bajtów\n")
-                self.append_output(f" - Rozmiar klucza prywatnego: {res['private_key_size']} bajtów\n")
-                self.append_output(f" - Rozmiar podpisu: {res['signature_size']} bajtów\n")
-                self.append_output(f" - Rozmiar wiadomości: {res['message_size']} bajtów\n\n")
+        energy_meter = None
+        if self.energy_var.get() == 1:
+            energy_meter = self.create_energy_meter()
+
+        dashboard = None
+        if self.live_var.get() == 1:
+            dashboard = LiveDashboard(self.window, "Signature Benchmark - na żywo", SignatureBenchmark.OPERATIONS,
+                                      selected_algorithms, iterations)
+
+        benchmarks = []
+        if session is None:
+            for alg_name in selected_algorithms:
+                # Wybór odpowiedniej klasy benchmarku
+                if "+" in alg_name:
+                    benchmarks.append(HybridSignatureBenchmark(variant=alg_name, message=message_bytes))
+                elif alg_name in CLASSICAL_SIGNATURES:
+                    benchmarks.append(ClassicalSignatureBenchmark(variant=alg_name, message=message_bytes))
+                elif alg_name.startswith("Dilithium"):
+                    benchmarks.append(DilithiumBenchmark(variant=alg_name, message=message_bytes))
+                elif alg_name.startswith("Falcon"):
+                    benchmarks.append(FalconBenchmark(variant=alg_name, message=message_bytes))
+                else:
+                    self.append_output(f"Nieobsługiwany algorytm: {alg_name}\n")
+            if self.session_var.get() == 1:
+                session = new_session('sig', benchmarks, iterations, message_size=len(message_bytes),
+                                      workers=self.session_workers())
+
+        if session is not None:
+            # jednostki pracy wykonywane po kolei (lub w przypiętych procesach), stan zapisywany po każdej z nich
+            self.append_output(f"Sesja: {session.path} ({len(session.pending_units())} jednostek do wykonania)\n\n")
+            try:
+                all_results = session.run(progress=dashboard.update if dashboard is not None else None,
+                                          energy_meter=energy_meter)
+            except RuntimeError as e:
+                messagebox.showerror("Błąd", str(e))
+                return
+            for res in all_results:
+                self.print_result(res)
+        else:
+            for benchmark in benchmarks:
+                progress = None
+                if dashboard is not None:
+                    progress = lambda metrics, done, name=benchmark.algorithm_name: dashboard.update(name, metrics, done)
+                results = benchmark.run_benchmark(iterations=iterations, progress=progress, energy_meter=energy_meter)
+                all_results.extend(results)
+                for res in results:
+                    self.print_result(res)
+
+        if dashboard is not None:
+            dashboard.finish()
 
         os.makedirs("results/sig", exist_ok=True)
         with open("results/sig/signature_results.json", "w") as f:
@@ -99,9 +173,38 @@ class SigWindow:
                 "iterations": iterations,
                 "results": all_results
             }, f, indent=2)
+        record_run('sig', all_results, iterations=iterations, message_size=len(message_bytes),
+                   workers=session.workers if session is not None else 1)
 
         self.append_output("Wyniki zapisano do results/sig/signature_results.json\n")
 
+    def print_result(self, res):
+        self.append_output(f"Algorytm: {res['algorithm']}\n")
+        self.append_output(f" - Czas generowania klucza: {res['keygen_time_ms']:.2f} ms\n")
+        self.append_output(f" - Średni czas podpisu: {res['avg_sign_time_ms']:.2f} ms\n")
+        self.append_output(f" - Średni czas weryfikacji: {res['avg_verify_time_ms']:.2f} ms\n")
+        for op in ('sign', 'verify'):
+            stats = res['time_stats'][op]
+            self.append_output(f" - {op} p50/p99/p99.9: {stats['p50']:.3f} / {stats['p99']:.3f} / {stats['p999']:.3f} ms\n")
+        if 'sign_energy_uj' in res:
+            self.append_output(f" - Energia keygen/podpis/weryfikacja: {res['keygen_energy_uj']:.1f} / "
+                               f"{res['sign_energy_uj']:.1f} / {res['verify_energy_uj']:.1f} µJ\n")
+        self.append_output(f" - Rozmiar klucza publicznego: {res['public_key_size']} bajtów\n")
+        self.append_output(f" - Rozmiar klucza prywatnego: {res['private_key_size']} bajtów\n")
+        self.append_output(f" - Rozmiar podpisu: {res['signature_size']} bajtów\n")
+        self.append_output(f" - Rozmiar wiadomości: {res['message_size']} bajtów\n\n")
+
+    def create_energy_meter(self):
+        meter = EnergyMeter()
+        if not meter.available():
+            self.append_output("Liczniki RAPL (/sys/class/powercap) niedostępne - pomijam pomiar energii\n")
+            return None
+        self.append_output("Kalibracja mocy spoczynkowej RAPL...\n")
+        idle = meter.calibrate_idle()
+        for label, power in idle.items():
+            self.append_output(f" - {label}: {power / 1e6:.2f} W\n")
+        return meter
+
     def show_charts_from_file(self):
         try:
             with open("results/sig/signature_results.json", "r") as f:
@@ -133,58 +236,14 @@ class SigWindow:
             "Rozmiary kluczy i podpisów"
         ]
 
-        for fig, title in zip(figs, titles):
-            plot_window = tk.Toplevel(self.window)
-            plot_window.title(title)
-            plot_window.geometry("900x600")
+        if any(r.get('sign_energy_uj') is not None for r in filtered_results):
+            figs.append(plot_energy_signature(filtered_results, data["message_size"]))
+            titles.append("Energia na operację")
+        if find_baseline(filtered_results, 'algorithm', SIGNATURE_BASELINE):
+            figs.append(plot_migration_overhead_signature(filtered_results, data["message_size"]))
+            titles.append("Narzut migracji")
 
-            frame = tk.Frame(plot_window, padx=20, pady=20)
-            frame.pack(fill=tk.BOTH, expand=True)
-
-            canvas = FigureCanvasTkAgg(fig, master=frame)
-            canvas.draw()
-            w = canvas.get_tk_widget()
-            w.pack(padx=10, pady=10)
-
-            plot_window.grab_set()
-            plot_window.wait_window(plot_window)
+        show_chart_grid(self.window, figs, titles, "Wykresy podpisu")
 
     def show_results_table(self):
-        try:
-            with open("results/sig/signature_results.json", "r") as f:
-                data = json.load(f)
-        except FileNotFoundError:
-            messagebox.showerror("Błąd", "Plik wyników nie istnieje!")
-            return
-
-        results = data["results"]
-
-        # Tworzenie nowego okna
-        table_window = tk.Toplevel(self.window)
-        table_window.title("Tabela wyników benchmarku podpisu")
-        table_window.geometry("900x400")
-
-        frame = tk.Frame(table_window, padx=10, pady=10)
-        frame.pack(fill=tk.BOTH, expand=True)
-
-        columns = ['algorithm', 'keygen_time_ms', 'avg_sign_time_ms', 'avg_verify_time_ms',
-                   'public_key_size', 'private_key_size', 'signature_size', 'message_size']
-
-        tree = ttk.Treeview(frame, columns=columns, show='headings')
-        for col in columns:
-            tree.heading(col, text=col.replace('_', ' ').capitalize())
-            tree.column(col, width=120, anchor='center')
-
-        for result in results:
-            tree.insert('', tk.END, values=(
-                result['algorithm'],
-                round(result['keygen_time_ms'], 2),
-                round(result['avg_sign_time_ms'], 2),
-                round(result['avg_verify_time_ms'], 2),
-                result['public_key_size'],
-                result['private_key_size'],
-                result['signature_size'],
-                result['message_size']
-            ))
-
-        tree.pack(fill=tk.BOTH, expand=True)
+        ResultsExplorer(self.window, kind='sig')
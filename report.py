@@ -0,0 +1,283 @@
+import argparse
+import base64
+import csv
+import hashlib
+import html
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from analysis.history import HISTORY_PATH, ResultsHistory
+
+REPORT_DIR = "results/report"
+
+KEM_CHARTS = [
+    ('kem_operation_times_kyber', 'plot_operation_times_kyber', "Operation Times Kyber"),
+    ('kem_operation_times_bike', 'plot_operation_times_bike', "Operation Times BIKE"),
+    ('kem_key_sizes', 'plot_key_sizes', "Key Sizes"),
+    ('kem_total_time', 'plot_total_time_comparison', "Total Time Comparison"),
+]
+
+SIG_CHARTS = [
+    ('sig_keygen_times', 'plot_keygen_times', "Czasy generowania kluczy"),
+    ('sig_sign_times', 'plot_sign_times', "Czasy podpisywania"),
+    ('sig_verify_times', 'plot_verify_times', "Czasy weryfikacji"),
+    ('sig_total_times', 'plot_total_times', "Czasy całkowite"),
+    ('sig_key_sizes', 'plot_key_sizes_signature', "Rozmiary kluczy"),
+    ('sig_signature_sizes', 'plot_signature_sizes', "Rozmiary podpisów"),
+]
+
+# wykresy rysowane tylko wtedy, gdy któryś wynik ma pomiar energii RAPL
+KEM_ENERGY_CHART = ('kem_energy', 'plot_energy_kem', "Energy per Operation")
+SIG_ENERGY_CHART = ('sig_energy', 'plot_energy_signature', "Energia na operację")
+# wykresy narzutu migracji tylko wtedy, gdy w wynikach jest klasyczne odniesienie
+KEM_MIGRATION_CHART = ('kem_migration', 'plot_migration_overhead_kem', "Migration Overhead")
+SIG_MIGRATION_CHART = ('sig_migration', 'plot_migration_overhead_signature', "Narzut migracji")
+
+KEM_HEADER = ['variant', 'keygen_ms', 'encap_ms', 'decap_ms', 'decap_p99_ms',
+              'keygen_uj', 'encap_uj', 'decap_uj', 'public_key', 'secret_key', 'ciphertext']
+SIG_HEADER = ['algorithm', 'keygen_ms', 'sign_ms', 'verify_ms', 'sign_p99_ms',
+              'keygen_uj', 'sign_uj', 'verify_uj', 'public_key', 'private_key', 'signature', 'message']
+
+
+def init_worker():
+    import matplotlib.pyplot as plt
+    plt.switch_backend('Agg')
+
+
+def render_chart(function_name, kwargs, path):
+    import matplotlib.pyplot as plt
+    import visualization
+
+    fig = getattr(visualization, function_name)(**kwargs)
+    fig.savefig(path, dpi=110)
+    plt.close(fig)
+    return path
+
+
+def source_fingerprint():
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "visualization.py"), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def chart_key(function_name, kwargs, fingerprint):
+    payload = json.dumps([function_name, kwargs], sort_keys=True)
+    return hashlib.sha256((payload + fingerprint).encode()).hexdigest()
+
+
+def collect_dataset(history, run_ids):
+    dataset = {'kem': {'results': [], 'runs': []}, 'sig': {'results': [], 'runs': [], 'message_size': None}}
+    infos = [history.run_info(run_id) for run_id in run_ids]
+    per_kind = {kind: sum(1 for info in infos if info['kind'] == kind) for kind in dataset}
+
+    for info in infos:
+        kind = info['kind']
+        key = 'variant' if kind == 'kem' else 'algorithm'
+        for result in history.run_results(info['id']):
+            # przy porównaniu kilku przebiegów dopisujemy numer przebiegu do nazwy wariantu
+            if per_kind[kind] > 1:
+                result = dict(result, **{key: f"{result[key]} #{info['id']}"})
+            dataset[kind]['results'].append(result)
+        dataset[kind]['runs'].append(info)
+        if kind == 'sig' and dataset['sig']['message_size'] is None:
+            dataset['sig']['message_size'] = info['message_size']
+    return dataset
+
+
+def chart_jobs(dataset):
+    from visualization import KEM_BASELINE, SIGNATURE_BASELINE, find_baseline
+
+    jobs = []
+    if dataset['kem']['results']:
+        charts = list(KEM_CHARTS)
+        if any(r.get('energy_avg') for r in dataset['kem']['results']):
+            charts.append(KEM_ENERGY_CHART)
+        if find_baseline(dataset['kem']['results'], 'variant', KEM_BASELINE):
+            charts.append(KEM_MIGRATION_CHART)
+        for name, function_name, title in charts:
+            jobs.append((name, function_name, title, {'results': dataset['kem']['results']}))
+    if dataset['sig']['results']:
+        message_size = dataset['sig']['message_size'] or 0
+        charts = list(SIG_CHARTS)
+        if any(r.get('sign_energy_uj') is not None for r in dataset['sig']['results']):
+            charts.append(SIG_ENERGY_CHART)
+        if find_baseline(dataset['sig']['results'], 'algorithm', SIGNATURE_BASELINE):
+            charts.append(SIG_MIGRATION_CHART)
+        for name, function_name, title in charts:
+            jobs.append((name, function_name, title,
+                         {'results': dataset['sig']['results'], 'message_size': message_size}))
+    return jobs
+
+
+def kem_rows(results):
+    rows = []
+    for r in results:
+        p99 = r.get('time_stats', {}).get('decap', {}).get('p99')
+        energy = r.get('energy_avg') or {}
+        rows.append([r['variant'], r['time_avg']['keygen'], r['time_avg']['encap'], r['time_avg']['decap'], p99,
+                     energy.get('keygen'), energy.get('encap'), energy.get('decap'),
+                     r['size_avg']['public_key'], r['size_avg']['secret_key'], r['size_avg']['ciphertext']])
+    return rows
+
+
+def sig_rows(results):
+    rows = []
+    for r in results:
+        p99 = r.get('time_stats', {}).get('sign', {}).get('p99')
+        rows.append([r['algorithm'], r['keygen_time_ms'], r['avg_sign_time_ms'], r['avg_verify_time_ms'], p99,
+                     r.get('keygen_energy_uj'), r.get('sign_energy_uj'), r.get('verify_energy_uj'),
+                     r['public_key_size'], r['private_key_size'], r['signature_size'], r['message_size']])
+    return rows
+
+
+def format_cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.4f}"
+    return str(value)
+
+
+def csv_text(header, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(header)
+    writer.writerows([[format_cell(value) for value in row] for row in rows])
+    return buffer.getvalue()
+
+
+def markdown_table(header, rows):
+    lines = ["| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+    for row in rows:
+        lines.append("| " + " | ".join(format_cell(value) for value in row) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def html_table(header, rows):
+    head = "".join(f"<th>{html.escape(col)}</th>" for col in header)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(format_cell(value))}</td>" for value in row) + "</tr>"
+        for row in rows
+    )
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def write_if_changed(path, text):
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return True
+
+
+def default_out_dir(run_ids):
+    return os.path.join(REPORT_DIR, "runs-" + "-".join(str(run_id) for run_id in run_ids))
+
+
+def generate_report(run_ids=None, out_dir=None, workers=None, history_path=HISTORY_PATH):
+    with ResultsHistory(history_path) as history:
+        history.import_legacy_results()
+        if not run_ids:
+            run_ids = [run_id for run_id in (history.latest_run_id('kem'), history.latest_run_id('sig')) if run_id]
+        if not run_ids:
+            raise ValueError("Brak wyników w historii - najpierw uruchom benchmark")
+        dataset = collect_dataset(history, run_ids)
+
+    out_dir = out_dir or default_out_dir(run_ids)
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    # renderujemy tylko wykresy, których dane lub kod visualization.py się zmieniły
+    fingerprint = source_fingerprint()
+    jobs = chart_jobs(dataset)
+    pending = []
+    for name, function_name, title, kwargs in jobs:
+        key = chart_key(function_name, kwargs, fingerprint)
+        path = os.path.join(out_dir, f"{name}.png")
+        if manifest.get(name) != key or not os.path.exists(path):
+            pending.append((name, function_name, kwargs, path, key))
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+            futures = {name: executor.submit(render_chart, function_name, kwargs, path)
+                       for name, function_name, kwargs, path, key in pending}
+            for name, function_name, kwargs, path, key in pending:
+                futures[name].result()
+                manifest[name] = key
+
+    tables = []
+    if dataset['kem']['results']:
+        tables.append(('kem', "KEM", KEM_HEADER, kem_rows(dataset['kem']['results'])))
+    if dataset['sig']['results']:
+        tables.append(('sig', "Podpisy cyfrowe", SIG_HEADER, sig_rows(dataset['sig']['results'])))
+
+    markdown = [f"# Raport PQC Benchmark (przebiegi: {', '.join(map(str, run_ids))})\n"]
+    for kind, title, header, rows in tables:
+        write_if_changed(os.path.join(out_dir, f"{kind}.csv"), csv_text(header, rows))
+        markdown.append(f"\n## {title}\n\n" + markdown_table(header, rows))
+        for name, function_name, chart_title, kwargs in jobs:
+            if name.startswith(kind + "_"):
+                markdown.append(f"\n![{chart_title}]({name}.png)\n")
+    write_if_changed(os.path.join(out_dir, "report.md"), "".join(markdown))
+
+    write_if_changed(os.path.join(out_dir, "report.html"), render_html(dataset, tables, jobs, out_dir, run_ids))
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    return {'out_dir': out_dir, 'rendered': [job[0] for job in pending], 'charts': [job[0] for job in jobs]}
+
+
+def render_html(dataset, tables, jobs, out_dir, run_ids):
+    sections = []
+    runs = dataset['kem']['runs'] + dataset['sig']['runs']
+    run_lines = "".join(
+        f"<li>#{run['id']} {html.escape(run['kind'])} - {html.escape(run['host'])}, {html.escape(run['created_at'])}, "
+        f"iteracje: {run['iterations'] if run['iterations'] is not None else '-'}</li>"
+        for run in runs
+    )
+    sections.append(f"<h2>Przebiegi</h2><ul>{run_lines}</ul>")
+
+    for kind, title, header, rows in tables:
+        sections.append(f"<h2>{html.escape(title)}</h2>" + html_table(header, rows))
+        for name, function_name, chart_title, kwargs in jobs:
+            if not name.startswith(kind + "_"):
+                continue
+            # obrazy osadzone w base64 - raport jest jednym samodzielnym plikiem
+            with open(os.path.join(out_dir, f"{name}.png"), "rb") as f:
+                encoded = base64.b64encode(f.read()).decode()
+            sections.append(f"<figure><img src=\"data:image/png;base64,{encoded}\" alt=\"{html.escape(chart_title)}\">"
+                            f"<figcaption>{html.escape(chart_title)}</figcaption></figure>")
+
+    return (
+        "<!DOCTYPE html>\n<html lang=\"pl\"><head><meta charset=\"utf-8\">"
+        f"<title>Raport PQC Benchmark {', '.join(map(str, run_ids))}</title>"
+        "<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse}"
+        "td,th{border:1px solid #ccc;padding:4px 8px;text-align:right}th{background:#eee}"
+        "img{max-width:100%}</style></head><body>"
+        f"<h1>Raport PQC Benchmark</h1>{''.join(sections)}</body></html>\n"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generowanie raportu (wykresy, CSV, Markdown, HTML) z historii wyników")
+    parser.add_argument("--runs", type=int, nargs="*", help="id przebiegów z historii (domyślnie najnowszy KEM i podpis)")
+    parser.add_argument("--out", help="katalog wyjściowy")
+    parser.add_argument("--workers", type=int, help="liczba procesów renderujących")
+    parser.add_argument("--history", default=HISTORY_PATH, help="ścieżka do bazy historii wyników")
+    args = parser.parse_args()
+
+    report = generate_report(args.runs, out_dir=args.out, workers=args.workers, history_path=args.history)
+    print(f"Raport: {os.path.join(report['out_dir'], 'report.html')} "
+          f"(wyrenderowano {len(report['rendered'])} z {len(report['charts'])} wykresów)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import argparse
+
+from analysis.history import HISTORY_PATH, ResultsHistory
+from analysis.selector import OBJECTIVES, AlgorithmSelector, selection_rows
+from report import csv_text, markdown_table
+
+
+def parse_weights(text):
+    # "bytes=1,latency=2,tail=0.5,level=1"
+    weights = {}
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        name, value = part.split("=", 1)
+        name = name.strip()
+        if name not in OBJECTIVES:
+            raise ValueError(f"Nieznane kryterium: {name} (dostępne: {', '.join(OBJECTIVES)})")
+        weights[name] = float(value)
+    return weights
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wybór pary KEM + podpis spełniającej ograniczenia, na podstawie historii wyników")
+    parser.add_argument("--max-kem-bytes", type=float, help="maksymalny rozmiar klucza publicznego KEM + szyfrogramu")
+    parser.add_argument("--max-decap-p99-us", type=float, help="maksymalne p99 dekapsulacji w µs")
+    parser.add_argument("--max-sign-p99-us", type=float, help="maksymalne p99 podpisu w µs")
+    parser.add_argument("--min-level", type=int, help="minimalny poziom bezpieczeństwa NIST (1-5)")
+    parser.add_argument("--max-signature-bytes", type=float, help="maksymalny rozmiar podpisu")
+    parser.add_argument("--weights", default="", help="wagi kryteriów, np. bytes=1,latency=2,tail=1,level=0.5")
+    parser.add_argument("--host", help="tylko wyniki z danego hosta (domyślnie każdy host osobno)")
+    parser.add_argument("--aggregate", choices=('median', 'latest'), default='median',
+                        help="mediana ze wszystkich przebiegów lub tylko najnowszy przebieg")
+    parser.add_argument("--message-size", type=int,
+                        help="rozmiar wiadomości podpisu w bajtach (domyślnie najczęstszy w historii)")
+    parser.add_argument("--include-parallel", action="store_true",
+                        help="uwzględnij przebiegi sesji z kilkoma procesami naraz (pomiar pod konkurencją)")
+    parser.add_argument("--all", action="store_true", help="wszystkie pary spełniające ograniczenia, nie tylko front Pareto")
+    parser.add_argument("--limit", type=int, default=20, help="liczba wierszy rankingu")
+    parser.add_argument("--csv", help="zapisz pełny ranking do pliku CSV")
+    parser.add_argument("--history", default=HISTORY_PATH, help="ścieżka do bazy historii wyników")
+    args = parser.parse_args()
+
+    constraints = {
+        'max_kem_bytes': args.max_kem_bytes,
+        'max_decap_p99_us': args.max_decap_p99_us,
+        'max_sign_p99_us': args.max_sign_p99_us,
+        'min_level': args.min_level,
+        'max_signature_bytes': args.max_signature_bytes
+    }
+    with ResultsHistory(args.history) as history:
+        history.import_legacy_results()
+        selector = AlgorithmSelector(history.connection, args.aggregate, args.include_parallel)
+
+    message_size = selector.default_message_size() if args.message_size is None else args.message_size
+    if message_size is not None:
+        print(f"Rozmiar wiadomości podpisu: {message_size} B (dostępne: {', '.join(map(str, selector.message_sizes()))})")
+    ranking = selector.select(constraints, parse_weights(args.weights), host=args.host, pareto_only=not args.all,
+                              message_size=message_size)
+    if ranking.empty:
+        print("Żadna para KEM + podpis nie spełnia ograniczeń")
+        return
+    print(markdown_table(*selection_rows(ranking, args.limit)))
+    if args.csv:
+        with open(args.csv, "w") as f:
+            f.write(csv_text(*selection_rows(ranking)))
+        print(f"Ranking: {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from analysis.perftest import DEFAULT_TOLERANCE, PERF_HISTORY_PATH, PerfCheck, PerfHistory, host_fingerprint
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf", "testy wydajności")
+    group.addoption("--perf-history", default=os.environ.get("PQC_PERF_HISTORY", PERF_HISTORY_PATH),
+                    help="baza historii i baseline'ów testów wydajności")
+    group.addoption("--perf-update-baseline", action="store_true",
+                    help="zapisz bieżące pomiary jako nowe baseline'y dla tego hosta")
+    group.addoption("--perf-tolerance", type=float, default=DEFAULT_TOLERANCE,
+                    help="dopuszczalny wzrost mediany względem baseline'u (ułamek)")
+
+
+@pytest.fixture(scope="session")
+def perf_history(request):
+    history = PerfHistory(request.config.getoption("--perf-history"))
+    request.config._perf_history = history
+    request.config._perf_tests = []
+    yield history
+
+
+@pytest.fixture
+def perf(request, perf_history):
+    check = PerfCheck(request.node.nodeid, perf_history, host_fingerprint()['id'],
+                      tolerance=request.config.getoption("--perf-tolerance"),
+                      update_baseline=request.config.getoption("--perf-update-baseline"))
+    yield check
+    request.config._perf_tests.extend(check.recorded)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    history = getattr(config, "_perf_history", None)
+    if history is None or not config._perf_tests:
+        return
+    host = host_fingerprint()['id']
+    terminalreporter.section(f"wydajność (host {host})")
+    for test in config._perf_tests:
+        trend = history.trend(test, host)
+        line = f"{test}: {trend['last_ms']:.4f} ms, baseline {trend['baseline_ms']:.4f} ms, przebiegów {trend['runs']}"
+        if trend['trend_per_run'] is not None:
+            line += f", trend {trend['trend_per_run'] * 100:+.2f}%/przebieg"
+        terminalreporter.write_line(line)
+    history.close()
@@ -0,0 +1,66 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from algorithms.binding import EntryPoint, attribute_overhead, median_call_ms
+
+
+def wrapper():
+    pass
+
+
+def native():
+    pass
+
+
+def export_wrapper():
+    pass
+
+
+def stub_measure(operation):
+    # czasy w ms ustalone z góry, żeby sprawdzić samą arytmetykę podziału
+    name = operation.__qualname__
+    if name.startswith("ffi_baseline"):
+        return 0.001
+    if name.startswith("EntryPoint.copy_baseline"):
+        return 0.002
+    return {'wrapper': 0.010, 'native': 0.007, 'export_wrapper': 0.004}[name]
+
+
+def test_attribute_overhead_splits_wrapper_time():
+    entry_points = [EntryPoint('encap_secret', wrapper, native, inputs=(800,), outputs=(768, 32)),
+                    EntryPoint('export_secret_key', export_wrapper, outputs=(1632,))]
+    result = attribute_overhead(entry_points, iterations=100, measure=stub_measure)
+    assert result['ffi_ms'] == pytest.approx(0.001)
+    harness = result['harness']['per_iteration_ms']
+
+    encap = result['entry_points']['encap_secret']
+    # czas natywny pomniejszony o koszt samego przejścia przez FFI
+    assert encap['native_ms'] == pytest.approx(0.006)
+    assert encap['binding_ms'] == pytest.approx(0.004)
+    assert encap['copy_ms'] == pytest.approx(0.002)
+    total = 0.010 + harness
+    assert encap['native_share'] == pytest.approx(0.006 / total)
+    assert encap['native_share'] + encap['binding_share'] + encap['harness_share'] == pytest.approx(1.0)
+
+    # punkt wejścia bez odpowiednika natywnego - cały czas wrappera to narzut wiązania
+    export = result['entry_points']['export_secret_key']
+    assert export['native_ms'] == 0.0
+    assert export['binding_ms'] == pytest.approx(0.004)
+
+
+def test_native_time_never_negative():
+    # wywołanie natywne zmierzone szybciej niż samo przejście przez FFI - różnica byłaby ujemna
+    timings = {wrapper: 0.010, native: 0.0002}
+    entry_points = [EntryPoint('sign', wrapper, native)]
+    result = attribute_overhead(entry_points, iterations=10, measure=lambda op: timings.get(op, 0.0005))
+    assert result['entry_points']['sign']['native_ms'] == 0.0
+    assert result['entry_points']['sign']['binding_ms'] == pytest.approx(0.010)
+
+
+def test_median_call_ms_uses_shared_sampler():
+    calls = []
+    assert median_call_ms(lambda: calls.append(1), samples=20) >= 0
+    assert len(calls) > 20
+
@@ -0,0 +1,77 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from analysis.builds import build_fingerprint, build_label, parse_build_arg, parse_oqsconfig, speedup_table
+
+OQSCONFIG = """
+#define OQS_VERSION_TEXT "0.10.1"
+#define OQS_COMPILE_BUILD_TARGET "x86_64-Linux-6.5.0"
+#define OQS_DIST_BUILD 1
+#define OQS_OPT_TARGET generic
+#define OQS_USE_AVX2_INSTRUCTIONS 1
+#define OQS_ENABLE_KEM_kyber_512 1
+/* #undef OQS_USE_AVX512_INSTRUCTIONS */
+"""
+
+
+def test_parse_oqsconfig_keeps_build_options_only():
+    options = parse_oqsconfig(OQSCONFIG)
+    assert options == {
+        'OQS_VERSION_TEXT': '0.10.1',
+        'OQS_COMPILE_BUILD_TARGET': 'x86_64-Linux-6.5.0',
+        'OQS_DIST_BUILD': '1',
+        'OQS_OPT_TARGET': 'generic',
+        'OQS_USE_AVX2_INSTRUCTIONS': '1'
+    }
+
+
+def test_build_labels():
+    assert build_label("/opt/liboqs-avx2/lib/liboqs.so") == "liboqs-avx2"
+    assert build_label("/home/u/build-ref/liboqs.so.5") == "build-ref"
+    assert parse_build_arg("ref=/opt/x/lib/liboqs.so") == ("ref", "/opt/x/lib/liboqs.so")
+
+
+def test_fingerprint_reads_install_layout(tmp_path):
+    lib_dir = tmp_path / "liboqs-ref" / "lib"
+    lib_dir.mkdir(parents=True)
+    library = lib_dir / "liboqs.so"
+    library.write_bytes(b"\x7fELF....GCC: (Ubuntu 13.2.0-23ubuntu4) 13.2.0\x00")
+    include_dir = tmp_path / "liboqs-ref" / "include" / "oqs"
+    include_dir.mkdir(parents=True)
+    (include_dir / "oqsconfig.h").write_text(OQSCONFIG)
+
+    fingerprint = build_fingerprint(str(library))
+    assert fingerprint['oqs_version'] == "0.10.1"
+    assert fingerprint['compiler'] == ["GCC: (Ubuntu 13.2.0-23ubuntu4) 13.2.0"]
+    assert fingerprint['compile_options']['OQS_USE_AVX2_INSTRUCTIONS'] == '1'
+    assert fingerprint['id'] == fingerprint['sha256'][:12]
+    assert build_fingerprint(str(library), oqs_version="0.10.2")['oqs_version'] == "0.10.2"
+
+
+def test_speedup_table_relative_to_baseline():
+    builds = [
+        ('ref', {'Kyber512': {'keygen': 0.04, 'decap': 0.03}}),
+        ('avx2', {'Kyber512': {'keygen': 0.01, 'decap': 0.01}}),
+        ('clang', {'Kyber512': {'keygen': 0.02}})
+    ]
+    header, rows = speedup_table(builds)
+    assert header == ['variant', 'operation', 'ref_ms', 'avx2_ms', 'avx2_speedup', 'clang_ms', 'clang_speedup']
+    assert rows[0] == ['Kyber512', 'keygen', 0.04, 0.01, pytest.approx(4.0), 0.02, pytest.approx(2.0)]
+    # brak pomiaru w jednej z budów nie przerywa tabeli
+    assert rows[1][-2:] == [None, None]
+
+    header, rows = speedup_table(builds, baseline='avx2')
+    assert header[2] == 'avx2_ms'
+    assert rows[0][4] == pytest.approx(0.25)
+
+    with pytest.raises(ValueError, match="ref, avx2, clang"):
+        speedup_table(builds, baseline='gcc')
+
+
+def test_compare_builds_rejects_unknown_baseline_before_running(tmp_path):
+    from compare_builds import compare_builds
+    with pytest.raises(ValueError, match="gcc"):
+        compare_builds([('ref', str(tmp_path / "missing.so"))], baseline='gcc', out_dir=str(tmp_path))
+    assert not any(tmp_path.iterdir())
@@ -0,0 +1,100 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from algorithms.kem.classical import CLASSICAL_KEMS, ClassicalKemBenchmark
+from algorithms.kem.hybrid import HybridKemBenchmark
+from algorithms.signature.classical import CLASSICAL_SIGNATURES, ClassicalSignatureBenchmark
+from algorithms.signature.hybrid import HybridSignatureBenchmark
+
+
+@pytest.mark.parametrize("variant", list(CLASSICAL_KEMS) + ["X25519+Kyber768"])
+def test_kem_baselines_agree_on_shared_secret(variant):
+    benchmark = HybridKemBenchmark(variant) if "+" in variant else ClassicalKemBenchmark(variant)
+    with benchmark.create_kem() as kem:
+        public_key = kem.generate_keypair()
+        ciphertext, shared_secret = kem.encap_secret(public_key)
+        assert kem.decap_secret(ciphertext) == shared_secret
+
+    result = benchmark.run_benchmark(iterations=5)
+    assert result['variant'] == variant
+    for key in ['keygen', 'encap', 'decap']:
+        assert result['time_avg'][key] > 0
+
+
+def test_hybrid_kem_sizes_add_up():
+    result = HybridKemBenchmark("X25519+Kyber768").run_benchmark(iterations=2)
+    assert result['size_avg']['public_key'] == 32 + 1184
+    assert result['size_avg']['ciphertext'] == 32 + 1088
+
+
+@pytest.mark.parametrize("variant", list(CLASSICAL_SIGNATURES) + ["Ed25519+Dilithium2"])
+def test_signature_baselines_verify_and_reject_tampering(variant):
+    if "+" in variant:
+        benchmark = HybridSignatureBenchmark(variant, message_length=128)
+    else:
+        benchmark = ClassicalSignatureBenchmark(variant, message_length=128)
+    with benchmark.create_signer() as signer:
+        public_key = signer.generate_keypair()
+        signature = signer.sign(benchmark.message)
+        assert signer.verify(benchmark.message, signature, public_key)
+
+        tampered = bytearray(signature)
+        tampered[-1] ^= 0xFF
+        assert not signer.verify(benchmark.message, bytes(tampered), public_key)
+
+    result = benchmark.run_benchmark(iterations=3)[0]
+    assert result['algorithm'] == variant
+    assert result['signature_size'] > 0
+
+
+@pytest.mark.parametrize("variant", ["Ed25519+Dilithium2", "ECDSA-P256+Dilithium2"])
+def test_hybrid_signature_requires_valid_classical_part(variant):
+    benchmark = HybridSignatureBenchmark(variant, message_length=128)
+    with benchmark.create_signer() as signer:
+        public_key = signer.generate_keypair()
+        signature = signer.sign(benchmark.message)
+        split = int.from_bytes(signature[:2], 'big') + 2
+
+        # uszkodzony bajt w podpisie klasycznym - część postkwantowa nadal poprawna
+        tampered = bytearray(signature)
+        tampered[2 + (split - 2) // 2] ^= 0xFF
+        assert not signer.verify(benchmark.message, bytes(tampered), public_key)
+
+        # zmieniony prefiks długości przesuwa granicę między podpisami
+        for delta in (1, -1):
+            tampered = bytearray(signature)
+            tampered[:2] = (split - 2 + delta).to_bytes(2, 'big')
+            assert not signer.verify(benchmark.message, bytes(tampered), public_key)
+
+
+def test_unknown_classical_variant_is_rejected():
+    with pytest.raises(ValueError):
+        ClassicalKemBenchmark("X448")
+    with pytest.raises(ValueError):
+        ClassicalSignatureBenchmark("DSA-1024")
+
+
+def test_classical_signer_requires_key_and_verify_implementation():
+    from algorithms.signature.classical import ClassicalSigner
+    with pytest.raises(TypeError):
+        ClassicalSigner()
+
+    class Incomplete(ClassicalSigner):
+        def generate_private_key(self):
+            pass
+
+        def sign(self, message):
+            pass
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+@pytest.mark.parametrize("variant, public_key_size, secret_key_size", [
+    ("Ed25519", 32, 32), ("ECDSA-P256", 65, 32), ("ECDSA-P384", 97, 48), ("RSA-2048", 256, 256), ("RSA-3072", 384, 384)])
+def test_classical_signature_keys_use_raw_encoding(variant, public_key_size, secret_key_size):
+    # surowe klucze jak w liboqs, bez narzutu DER (SubjectPublicKeyInfo / PKCS8)
+    with ClassicalSignatureBenchmark(variant).create_signer() as signer:
+        assert len(signer.generate_keypair()) == public_key_size
+        assert len(signer.export_secret_key()) == secret_key_size
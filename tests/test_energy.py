@@ -0,0 +1,66 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from analysis.energy import EnergyMeter, RaplReader, primary_domain
+
+
+def write_zone(root, zone, name, energy, max_range=1000000):
+    path = root / zone
+    path.mkdir()
+    (path / "name").write_text(name + "\n")
+    (path / "energy_uj").write_text(f"{energy}\n")
+    (path / "max_energy_range_uj").write_text(f"{max_range}\n")
+    return path
+
+
+class FakeRapl:
+    def __init__(self):
+        self.now = 0.0
+        self.energy = 0
+
+    def clock(self):
+        return self.now
+
+    def advance(self, seconds, watts):
+        self.now += seconds
+        self.energy += int(watts * seconds * 1e6)
+
+    def available(self):
+        return True
+
+    def read(self):
+        return {"package-0": self.energy}
+
+    def delta(self, before, after):
+        return {label: after[label] - before[label] for label in before}
+
+
+def test_reader_discovers_domains_and_handles_wraparound(tmp_path):
+    write_zone(tmp_path, "intel-rapl:0", "package-0", 999000)
+    write_zone(tmp_path, "intel-rapl:0:0", "core", 10)
+    (tmp_path / "intel-rapl-mmio:0").mkdir()
+
+    reader = RaplReader(root=str(tmp_path))
+    assert [d.label for d in reader.domains] == ["package-0", "package-0/core"]
+
+    delta = reader.delta({"package-0": 999000, "package-0/core": 10}, {"package-0": 1000, "package-0/core": 30})
+    assert delta == {"package-0": 2001, "package-0/core": 20}
+
+
+def test_missing_powercap_falls_back(tmp_path):
+    meter = EnergyMeter(reader=RaplReader(root=str(tmp_path / "missing")))
+    assert not meter.available()
+
+
+def test_meter_subtracts_idle_baseline():
+    rapl = FakeRapl()
+    meter = EnergyMeter(reader=rapl, burst_seconds=1.0, clock=rapl.clock,
+                        sleep=lambda seconds: rapl.advance(seconds, 10))
+    meter.calibrate_idle()
+    assert meter.idle_power["package-0"] == pytest.approx(10e6)
+
+    # każda operacja trwa 1 ms przy mocy 30 W, czyli 20 W ponad spoczynek -> 20000 µJ na operację
+    per_op = meter.measure(lambda: rapl.advance(0.001, 30))
+    assert primary_domain(per_op) == pytest.approx(20000.0, rel=0.01)
@@ -2,7 +2,6 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-import time
 import oqs
 
 import pytest
@@ -21,19 +20,13 @@ def test_falcon_benchmark_output(variant):
         assert result[key] > 0
 
 
-def test_falcon_signing_time_limit():
-    benchmark = FalconBenchmark(variant="Falcon-512", message_length=64)
-
+def test_falcon_signing_time_limit(perf):
     msg = b"performance test"
-    with oqs.Signature(benchmark.algorithm_name) as signer:
-        public_key = signer.generate_keypair()
-        secret_key = signer.export_secret_key()
-
-        start = time.time()
-        signature = signer.sign(msg)
-        elapsed_ms = (time.time() - start) * 1000
+    with oqs.Signature("Falcon-512") as signer:
+        signer.generate_keypair()
+        result = perf.measure(lambda: signer.sign(msg), name="Falcon-512 sign", samples=100)
 
-        assert elapsed_ms < 100
+    perf.assert_below(result, 100)
 
 
 def test_falcon_tampered_signature_fails():
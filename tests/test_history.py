@@ -0,0 +1,76 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from analysis.history import ResultsHistory
+
+
+def kem_result(variant, decap):
+    return {
+        'variant': variant,
+        'time_avg': {'keygen': 0.1, 'encap': 0.05, 'decap': decap},
+        'time_stats': {'decap': {'p50': decap * 0.9, 'p99': decap * 2, 'p999': decap * 3, 'std': 0.01, 'count': 10}},
+        'size_avg': {'secret_key': 2400.0, 'public_key': 1184.0, 'ciphertext': 1088.0}
+    }
+
+
+@pytest.fixture
+def history():
+    with ResultsHistory(":memory:") as history:
+        history.record_run('kem', [kem_result("Kyber512", 0.04), kem_result("Kyber768", 0.06)],
+                           iterations=10, host="a", created_at="2026-01-01T10:00:00+00:00")
+        history.record_run('kem', [kem_result("Kyber512", 0.05)],
+                           iterations=10, host="b", created_at="2026-02-01T10:00:00+00:00")
+        history.record_run('sig', [{'algorithm': "Falcon-512", 'keygen_time_ms': 5.0, 'avg_sign_time_ms': 0.2,
+                                    'avg_verify_time_ms': 0.05, 'public_key_size': 897, 'private_key_size': 1281,
+                                    'signature_size': 666, 'message_size': 17}],
+                           iterations=10, message_size=17, host="a", created_at="2026-02-01T10:00:00+00:00")
+        yield history
+
+
+def test_filters_and_paging_run_in_sql(history):
+    assert history.count_measurements({'kind': 'kem'}) == 9
+    assert history.count_measurements({'kind': 'kem', 'host': 'b'}) == 3
+    assert history.count_measurements({'kind': 'kem', 'date_to': '2026-01-01'}) == 6
+
+    page = history.query_measurements({'kind': 'kem', 'operation': 'decap'}, order_by='mean_ms',
+                                      descending=True, limit=2, offset=0)
+    assert [row[3] for row in page] == ["Kyber768", "Kyber512"]
+    assert history.query_measurements({'kind': 'kem', 'operation': 'decap'}, order_by='mean_ms',
+                                      limit=2, offset=2)[0][5] == pytest.approx(0.04)
+
+
+def test_unknown_sort_column_is_rejected(history):
+    with pytest.raises(ValueError):
+        history.query_measurements(order_by="mean_ms; DROP TABLE runs")
+
+
+def test_median_series_per_variant(history):
+    series = history.median_series({'kind': 'kem', 'operation': 'decap'})
+    assert [value for _, value in series["Kyber512"]] == pytest.approx([0.036, 0.045])
+    assert history.median_series({'kind': 'sig', 'operation': 'sign'})["Falcon-512"][0][1] == 0.2
+
+
+def test_runs_record_number_of_workers():
+    with ResultsHistory(":memory:") as history:
+        sequential = history.record_run('kem', [kem_result("Kyber512", 0.04)])
+        parallel = history.record_run('kem', [kem_result("Kyber512", 0.09)], workers=4)
+        assert history.run_info(sequential)['workers'] == 1
+        assert history.run_info(parallel)['workers'] == 4
+        rows = history.connection.execute(
+            "SELECT DISTINCT run_id, workers FROM measurement_rows ORDER BY run_id").fetchall()
+        assert rows == [(sequential, 1), (parallel, 4)]
+
+
+def test_old_database_gets_workers_column(tmp_path):
+    import sqlite3
+    path = str(tmp_path / "old.sqlite")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE runs (id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, "
+                       "host TEXT NOT NULL, created_at TEXT NOT NULL, iterations INTEGER, message_size INTEGER)")
+    connection.commit()
+    connection.close()
+    with ResultsHistory(path) as history:
+        run_id = history.record_run('kem', [kem_result("Kyber512", 0.04)], workers=2)
+        assert history.run_info(run_id)['workers'] == 2
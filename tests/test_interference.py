@@ -0,0 +1,63 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from analysis.interference import allocate_processes, interleave, parse_mix, slowdown_rows
+from analysis.stats import SampleStats
+
+
+def test_parse_mix():
+    mix = parse_mix("Kyber768:decap=50, Dilithium3:verify=30,Falcon-512:sign=20")
+    assert mix == [('Kyber768', 'decap', 50.0), ('Dilithium3', 'verify', 30.0), ('Falcon-512', 'sign', 20.0)]
+    assert parse_mix("X25519+Kyber768:encap") == [('X25519+Kyber768', 'encap', 1.0)]
+    with pytest.raises(ValueError):
+        parse_mix("Kyber768=50")
+
+
+def test_parse_mix_rejects_unknown_operation():
+    operations = {'Kyber768': ('keygen', 'encap', 'decap'), 'Dilithium3': ('keygen', 'sign', 'verify')}.get
+    assert parse_mix("Kyber768:decap,Dilithium3:sign", operations) == [('Kyber768', 'decap', 1.0),
+                                                                       ('Dilithium3', 'sign', 1.0)]
+    with pytest.raises(ValueError, match="decaps"):
+        parse_mix("Kyber768:decaps=50,Dilithium3:verify=30", operations)
+    with pytest.raises(ValueError):
+        parse_mix("Dilithium3:decap", operations)
+
+
+def test_allocate_processes_largest_remainder():
+    mix = parse_mix("A:x=50,B:y=30,C:z=20")
+    assert allocate_processes(mix, 10) == [5, 3, 2]
+    assert allocate_processes(mix, 4) == [2, 1, 1]
+    # każda operacja dostaje przynajmniej jeden proces
+    assert allocate_processes(parse_mix("A:x=98,B:y=1,C:z=1"), 3) == [1, 1, 1]
+    with pytest.raises(ValueError):
+        allocate_processes(mix, 2)
+
+
+def test_interleave_alternates_operations():
+    assert interleave(['a', 'b', 'c'], [2, 1, 1]) == ['a', 'b', 'c', 'a']
+
+
+def worker(values, elapsed):
+    stats = SampleStats()
+    stats.add_batch(values)
+    return {'stats': stats.to_dict(), 'count': len(values), 'elapsed': elapsed}
+
+
+def test_slowdown_rows():
+    solo = {'Kyber768 decap': [worker([1.0] * 100, 0.1)]}
+    mixed = {'Kyber768 decap': [worker([1.5] * 60, 0.1), worker([1.5] * 60, 0.1)]}
+    header, rows = slowdown_rows(solo, mixed)
+    row = dict(zip(header, rows[0]))
+    assert row['processes'] == 2
+    assert row['p50_slowdown'] == pytest.approx(1.5, rel=0.02)
+    assert row['throughput_ratio'] == pytest.approx(0.6)
+
+
+def test_run_group_reports_failed_worker_instead_of_hanging():
+    from algorithms.interference import run_group
+    spec = {'kind': 'kem', 'variant': 'X25519'}
+    # literówka w nazwie operacji w jednym procesie - drugi nie może czekać na barierze w nieskończoność
+    with pytest.raises(RuntimeError, match="decaps"):
+        run_group([(spec, 'decap', None), (spec, 'decaps', None)], duration=0.1)
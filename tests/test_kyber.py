@@ -22,14 +22,13 @@ def test_kyber_benchmark_output(variant):
         assert result['size_avg'][key] > 0
 
 
-def test_kyber_512_faster_than_1024():
-    bench_512 = KyberBenchmark(variant="512")
-    bench_1024 = KyberBenchmark(variant="1024")
+def test_kyber_512_faster_than_1024(perf):
+    results = {}
+    for variant in ("512", "1024"):
+        operations = KyberBenchmark(variant=variant).operation_callables()
+        results[variant] = perf.measure(operations['encap'], name=f"Kyber{variant} encap")
 
-    time_512 = bench_512.run_benchmark(iterations=3)["time_avg"]["encap"]
-    time_1024 = bench_1024.run_benchmark(iterations=3)["time_avg"]["encap"]
-
-    assert time_512 < time_1024
+    perf.assert_faster(results["512"], results["1024"])
 
 # test_kyber_tamper.py
 from algorithms.kem.kyber import KyberBenchmark
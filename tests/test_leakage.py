@@ -0,0 +1,73 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+
+import numpy as np
+import pytest
+from analysis.leakage import LeakageTest, OnlineTTest, cropping_thresholds
+
+
+class FakeTarget:
+    variant = "Fake"
+    operation_name = "decap"
+
+    def __init__(self, leak_ns):
+        self.leak_ns = leak_ns
+        self.clock = 0
+        self.rng = random.Random(1)
+
+    def prepare_inputs(self, classes):
+        return list(classes)
+
+    def operation(self, cls):
+        self.clock += 1000 + self.rng.randint(0, 50) + (self.leak_ns if cls == 1 else 0)
+
+    def timer(self):
+        return self.clock
+
+
+def test_online_ttest_batch_matches_single_pushes():
+    values = np.random.default_rng(0).normal(100, 5, size=1000)
+    single = OnlineTTest()
+    batched = OnlineTTest()
+    for x in values:
+        single.push(x, 0)
+    batched.push_batch(values[:300], 0)
+    batched.push_batch(values[300:], 0)
+
+    assert batched.classes[0].count == single.classes[0].count
+    assert batched.classes[0].mean == pytest.approx(single.classes[0].mean)
+    assert batched.classes[0].m2 == pytest.approx(single.classes[0].m2)
+
+
+def test_cropping_thresholds_are_increasing():
+    thresholds = cropping_thresholds(list(range(1000)), number_percentiles=10)
+    assert len(thresholds) == 10
+    assert thresholds == sorted(thresholds)
+
+
+def test_first_batch_only_sets_thresholds():
+    target = FakeTarget(0)
+    test = LeakageTest(target, batch_size=1000, number_percentiles=10, timer=target.timer, seed=3)
+    classes, exec_times = test.measure_batch()
+    test.update_statistics(classes, exec_times)
+    assert len(test.thresholds) == 10
+    assert test.measurements == 0
+    assert all(t.count() == 0 for t in test.tests)
+
+    classes, exec_times = test.measure_batch()
+    test.update_statistics(classes, exec_times)
+    assert test.measurements == 1000
+    assert test.tests[0].count() == 1000
+
+
+@pytest.mark.parametrize("leak_ns, passed", [(0, True), (20, False)])
+def test_leakage_test_verdict(leak_ns, passed):
+    target = FakeTarget(leak_ns)
+    test = LeakageTest(target, batch_size=5000, timer=target.timer, seed=2)
+    result = test.run(measurements=30000)
+
+    assert result['measurements'] == 30000
+    assert result['passed'] is passed
@@ -0,0 +1,82 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pytest
+from analysis.perftest import (PerfCheck, PerfHistory, PerfResult, bootstrap_median_ci, bootstrap_ratio_ci,
+                               collect_samples, trend_per_run)
+
+
+def short_work():
+    sum(range(200))
+
+
+def long_work():
+    sum(range(4000))
+
+
+def test_bootstrap_intervals_cover_true_values():
+    rng = np.random.default_rng(3)
+    fast = rng.lognormal(np.log(1.0), 0.2, 400)
+    slow = rng.lognormal(np.log(2.0), 0.2, 400)
+
+    low, high = bootstrap_median_ci(fast)
+    assert low < 1.0 < high
+    low, high = bootstrap_ratio_ci(fast, slow)
+    assert low < 0.5 < high
+    assert high < 1.0
+
+
+def test_collect_samples_batches_short_operations():
+    calls = []
+    values, number = collect_samples(lambda: calls.append(1), samples=20, warmup=3)
+    # wywołanie trwające ułamek mikrosekundy musi zostać zgrupowane
+    assert number > 1
+    assert len(values) == 20
+    assert np.all(values > 0)
+
+
+def test_trend_per_run():
+    assert trend_per_run([1.0, 1.0]) is None
+    assert trend_per_run([1.0, 1.1, 1.21, 1.331]) == pytest.approx(0.1)
+    assert trend_per_run([2.0, 2.0, 2.0]) == pytest.approx(0.0)
+
+
+def test_perf_check_stores_baseline_and_detects_regression(tmp_path):
+    with PerfHistory(str(tmp_path / "perf.sqlite")) as history:
+        check = PerfCheck("tests/test_x.py::test_op", history, "host-a", tolerance=0.25, samples=50)
+        fast = check.measure(short_work, name="op")
+        assert history.baseline(check.key("op"), "host-a")['median_ms'] == fast.median
+
+        check.measure(short_work, name="op")
+        with pytest.raises(AssertionError, match="regresja"):
+            check.measure(long_work, name="op")
+
+        # inny host ma własny baseline
+        other = PerfCheck("tests/test_x.py::test_op", history, "host-b", samples=50)
+        other.measure(long_work, name="op")
+
+        trend = history.trend(check.key("op"), "host-a")
+        assert trend['runs'] == 3
+        assert trend['baseline_ms'] == fast.median
+
+        updating = PerfCheck("tests/test_x.py::test_op", history, "host-a", update_baseline=True, samples=50)
+        slow = updating.measure(long_work, name="op")
+        assert history.baseline(check.key("op"), "host-a")['median_ms'] == slow.median
+
+
+def test_perf_check_ratio_and_limit_asserts(tmp_path):
+    with PerfHistory(str(tmp_path / "perf.sqlite")) as history:
+        check = PerfCheck("tests/test_x.py::test_ratio", history, "host-a", samples=50)
+        fast = check.measure(short_work, name="fast")
+        slow = check.measure(long_work, name="slow")
+
+        low, high = check.assert_faster(fast, slow)
+        assert low <= high < 1.0
+        with pytest.raises(AssertionError):
+            check.assert_faster(slow, fast)
+
+        check.assert_below(fast, 1000)
+        with pytest.raises(AssertionError):
+            check.assert_below(PerfResult("x", [5.0] * 10), 1.0)
@@ -0,0 +1,53 @@
+import os
+import pstats
+import sys
+import time
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from analysis.profiling import SamplingProfiler, harness_overhead, profile_run
+
+
+def busy_leaf(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def busy_root():
+    busy_leaf(0.2)
+    return 42
+
+
+def test_harness_overhead_is_positive():
+    overhead = harness_overhead(100)
+    assert overhead['per_iteration_ms'] > 0
+    assert overhead['in_window_ms'] >= 0
+
+
+def test_sampling_profiler_produces_collapsed_stacks():
+    with SamplingProfiler(interval=0.001) as profiler:
+        busy_root()
+    assert profiler.samples > 0
+    lines = profiler.collapsed().splitlines()
+    assert any("busy_root" in line and "busy_leaf" in line for line in lines)
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        assert ";" in stack
+
+
+def test_profile_run_writes_output_per_mode(tmp_path):
+    result, path = profile_run(busy_root, "Kyber512", mode='cprofile', out_dir=str(tmp_path))
+    assert result == 42
+    assert path.endswith("Kyber512.pstats")
+    names = [func[2] for func in pstats.Stats(path).stats]
+    assert "busy_leaf" in names
+
+    _, path = profile_run(busy_root, "Kyber512", mode='sampling', out_dir=str(tmp_path))
+    assert path.endswith("Kyber512.folded")
+    with open(path) as f:
+        assert "busy_leaf" in f.read()
+
+    with pytest.raises(ValueError):
+        profile_run(busy_root, "Kyber512", mode='perf', out_dir=str(tmp_path))
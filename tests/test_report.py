@@ -0,0 +1,33 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+
+from analysis.history import ResultsHistory
+from report import generate_report
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def test_report_renders_once_and_skips_unchanged_charts(tmp_path):
+    history_path = str(tmp_path / "history.sqlite")
+    with open(os.path.join(ROOT, "results/kem/kem_results.json")) as f:
+        kem_results = json.load(f)
+    with ResultsHistory(history_path) as history:
+        first = history.record_run('kem', kem_results, iterations=10)
+        second = history.record_run('kem', kem_results[:3], iterations=10)
+
+    out_dir = str(tmp_path / "report")
+    report = generate_report([first, second], out_dir=out_dir, workers=2, history_path=history_path)
+
+    assert sorted(report['rendered']) == sorted(report['charts'])
+    for name in ('report.html', 'report.md', 'kem.csv'):
+        assert os.path.exists(os.path.join(out_dir, name))
+    with open(os.path.join(out_dir, 'kem.csv')) as f:
+        assert f"Kyber512 #{second}" in f.read()
+    with open(os.path.join(out_dir, 'report.html')) as f:
+        assert f.read().count("data:image/png;base64,") == len(report['charts'])
+
+    again = generate_report([first, second], out_dir=out_dir, workers=2, history_path=history_path)
+    assert again['rendered'] == []
@@ -0,0 +1,65 @@
+import ctypes as ct
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from algorithms.rng import DeterministicRandom, rng_overhead
+
+
+def draw(source, lengths):
+    outputs = []
+    for length in lengths:
+        buffer = (ct.c_uint8 * length)()
+        source.fill(buffer, length)
+        outputs.append(bytes(buffer))
+    return outputs
+
+
+def test_deterministic_random_is_reproducible():
+    first = draw(DeterministicRandom(b"seed"), [32, 64, 16])
+    assert first == draw(DeterministicRandom(b"seed"), [32, 64, 16])
+    assert first != draw(DeterministicRandom(b"other"), [32, 64, 16])
+    # kolejne wywołania z tym samym ziarnem nie powtarzają bloków
+    assert len(set(first)) == 3
+
+
+def test_deterministic_random_counts_calls_and_bytes():
+    source = DeterministicRandom()
+    draw(source, [32, 64])
+    calls, size, elapsed = source.snapshot()
+    assert (calls, size) == (2, 96)
+    assert elapsed >= 0
+
+
+def test_rng_overhead_uses_means_on_both_sides():
+    # mediany celowo różne od średnich - wynik ma zależeć wyłącznie od średnich
+    per_source = {
+        'deterministic': {'keygen': {'mean': 1.0, 'p50': 0.5, 'rng_callback_ms': 0.2,
+                                     'rng_calls_per_op': 2, 'rng_bytes_per_op': 64}},
+        'system': {'keygen': {'mean': 1.2, 'p50': 5.0}},
+        'OpenSSL': {'keygen': {'mean': 0.9, 'p50': 5.0}}
+    }
+    lengths = []
+
+    def direct_cost(name, length):
+        lengths.append(length)
+        return 0.01
+
+    overhead = rng_overhead(per_source, ('keygen',), direct_cost)['keygen']
+    assert overhead['arithmetic_ms'] == pytest.approx(0.8)
+    assert overhead['system']['measured_ms'] == pytest.approx(0.4)
+    assert overhead['system']['share'] == pytest.approx(0.4 / 1.2)
+    assert overhead['OpenSSL']['measured_ms'] == pytest.approx(0.1)
+    assert overhead['system']['direct_ms'] == pytest.approx(0.02)
+    assert lengths == [32, 32]
+
+
+def test_rng_overhead_without_rng_calls():
+    per_source = {
+        'deterministic': {'verify': {'mean': 0.1, 'rng_callback_ms': 0.0, 'rng_calls_per_op': 0,
+                                     'rng_bytes_per_op': 0}},
+        'system': {'verify': {'mean': 0.1}}
+    }
+    overhead = rng_overhead(per_source, ('verify',), lambda name, length: pytest.fail("bez wywołań RNG"))
+    assert overhead['verify']['system'] == {'measured_ms': pytest.approx(0.0), 'direct_ms': 0.0, 'share': pytest.approx(0.0)}
@@ -0,0 +1,144 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import warnings
+
+import numpy as np
+import pytest
+from analysis.history import ResultsHistory
+from analysis.selector import AlgorithmSelector, nist_level, pareto_mask
+
+
+def kem_result(variant, public_key, ciphertext, decap):
+    return {
+        'variant': variant,
+        'time_avg': {'keygen': decap, 'encap': decap, 'decap': decap},
+        'time_stats': {op: {'p50': decap, 'p99': decap * 2, 'p999': decap * 3, 'std': 0.0, 'count': 10}
+                       for op in ('keygen', 'encap', 'decap')},
+        'size_avg': {'secret_key': 1.0, 'public_key': public_key, 'ciphertext': ciphertext}
+    }
+
+
+def sig_result(algorithm, public_key, signature, sign):
+    return {
+        'algorithm': algorithm, 'keygen_time_ms': sign, 'avg_sign_time_ms': sign, 'avg_verify_time_ms': sign / 2,
+        'time_stats': {op: {'p50': sign, 'p99': sign * 3, 'p999': sign * 4, 'std': 0.0, 'count': 10}
+                       for op in ('keygen', 'sign', 'verify')},
+        'public_key_size': public_key, 'private_key_size': 1, 'signature_size': signature
+    }
+
+
+@pytest.fixture
+def selector():
+    with ResultsHistory(":memory:") as history:
+        for decap in (0.02, 0.04, 0.03):
+            history.record_run('kem', [kem_result("Kyber512", 800, 768, decap),
+                                       kem_result("Kyber768", 1184, 1088, 0.03),
+                                       kem_result("BIKE-L1", 1541, 1573, 0.5),
+                                       kem_result("X25519", 32, 32, 0.05)], host="a")
+        history.record_run('sig', [sig_result("Dilithium3", 1952, 3293, 0.2),
+                                   sig_result("Falcon-512", 897, 666, 0.3),
+                                   sig_result("Ed25519", 32, 64, 0.05)], host="a", message_size=10)
+        history.record_run('kem', [kem_result("Kyber768", 1184, 1088, 0.01)], host="b")
+        history.record_run('sig', [sig_result("Dilithium3", 1952, 3293, 0.1)], host="b", message_size=10)
+        yield AlgorithmSelector(history.connection)
+
+
+def test_nist_levels():
+    assert nist_level("Kyber768") == 3
+    assert nist_level("Falcon-1024") == 5
+    assert nist_level("X25519") == 0
+    assert nist_level("X25519+Kyber768") == 3
+    assert np.isnan(nist_level("Unknown-KEM"))
+
+
+def test_pareto_mask():
+    values = np.array([[1, 5], [2, 2], [5, 1], [3, 3], [2, 2]])
+    assert pareto_mask(values).tolist() == [True, True, True, False, True]
+
+
+def test_medians_across_runs(selector):
+    kyber = selector.kem[(selector.kem['host'] == 'a') & (selector.kem['variant'] == 'Kyber512')].iloc[0]
+    assert kyber['decap_p50_ms'] == pytest.approx(0.03)
+    assert kyber['runs'] == 3
+    assert selector.hosts() == ['a', 'b']
+
+
+def test_constraints_filter_pairs(selector):
+    ranking = selector.select({'min_level': 1, 'max_kem_bytes': 2000, 'max_decap_p99_us': 100,
+                               'max_signature_bytes': 4000}, host='a', pareto_only=False)
+    assert set(zip(ranking['variant_kem'], ranking['variant_sig'])) == {
+        ("Kyber512", "Dilithium3"), ("Kyber512", "Falcon-512")}
+    assert (ranking['level'] >= 1).all()
+    assert ranking['bytes'].iloc[0] == 800 + 768 + 1952 + 3293
+
+
+def test_pareto_frontier_per_host(selector):
+    ranking = selector.select({'min_level': 3})
+    # Kyber768 z Dilithium3 - jedyna para poziomu 3 na każdym hoście, pary z różnych hostów nie są łączone
+    assert sorted(ranking['host']) == ['a', 'b']
+    assert set(ranking['variant_kem']) == {"Kyber768"}
+    everything = selector.select(host='a', pareto_only=False)
+    frontier = selector.select(host='a')
+    assert len(everything) == 12 and 0 < len(frontier) < len(everything)
+    # BIKE-L1 jest gorszy od Kyber512 w każdym kryterium przy tym samym podpisie
+    assert "BIKE-L1" not in set(frontier['variant_kem'])
+
+
+def test_weights_change_ranking(selector):
+    by_bytes = selector.select({'min_level': 1}, {'bytes': 1, 'latency': 0, 'tail': 0}, host='a')
+    by_latency = selector.select({'min_level': 1}, {'bytes': 0, 'latency': 1, 'tail': 0}, host='a')
+    assert by_bytes.iloc[0]['variant_sig'] == "Falcon-512"
+    assert by_latency.iloc[0]['variant_sig'] == "Dilithium3"
+    assert selector.select({'min_level': 5}).empty
+
+
+def test_signatures_grouped_by_message_size_and_parallel_runs_skipped():
+    with ResultsHistory(":memory:") as history:
+        history.record_run('kem', [kem_result("Kyber768", 1184, 1088, 0.03)], host="a")
+        # przebieg równoległej sesji - opóźnienia pod konkurencją nie trafiają do mediany
+        history.record_run('kem', [kem_result("Kyber768", 1184, 1088, 3.0)], host="a", workers=4)
+        for _ in range(2):
+            history.record_run('sig', [sig_result("Dilithium3", 1952, 3293, 0.2)], host="a", message_size=32)
+        history.record_run('sig', [sig_result("Dilithium3", 1952, 3293, 2.0)], host="a", message_size=65536)
+        selector = AlgorithmSelector(history.connection)
+        parallel = AlgorithmSelector(history.connection, include_parallel=True)
+
+    assert selector.kem.iloc[0]['decap_p50_ms'] == pytest.approx(0.03)
+    assert parallel.kem.iloc[0]['runs'] == 2
+    assert selector.message_sizes() == [32, 65536]
+    assert selector.default_message_size() == 32
+    ranking = selector.select()
+    assert ranking['message_size'].tolist() == [32]
+    assert ranking.iloc[0]['sign_p50_ms'] == pytest.approx(0.2)
+    large = selector.select(message_size=65536)
+    assert large.iloc[0]['sign_p50_ms'] == pytest.approx(2.0)
+    assert selector.select(message_size=1).empty
+
+
+def test_legacy_runs_without_p99_load_quietly():
+    with ResultsHistory(":memory:") as history:
+        # wyniki sprzed time_stats - jest tylko średni czas, p99 puste
+        legacy = [kem_result("Kyber512", 800, 768, 0.02), kem_result("Kyber768", 1184, 1088, 0.03),
+                  sig_result("Dilithium3", 1952, 3293, 0.2)]
+        for result in legacy:
+            del result['time_stats']
+        history.record_run('kem', legacy[:2], host="a")
+        history.record_run('kem', legacy[:2], host="a")
+        history.record_run('sig', legacy[2:], host="a", message_size=10)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            selector = AlgorithmSelector(history.connection)
+            history.record_run('kem', [kem_result("Kyber512", 800, 768, 0.02)], host="a")
+            mixed = AlgorithmSelector(history.connection)
+
+    assert 'decap_p99_ms' not in selector.kem and 'sign_p99_ms' not in selector.sig
+    # brak p99 zastępowany przez p50 w ogonie
+    ranking = selector.select(host='a', pareto_only=False).set_index('variant_kem')
+    assert ranking.loc['Kyber768', 'tail'] == pytest.approx(0.03 + 0.2)
+
+    # p99 z nowszego przebiegu, bez mieszania z pustymi wartościami starszych
+    kem = mixed.kem.set_index('variant')
+    assert kem.loc['Kyber512', 'decap_p99_ms'] == pytest.approx(0.04)
+    assert np.isnan(kem.loc['Kyber768', 'decap_p99_ms'])
@@ -0,0 +1,122 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+
+import pytest
+from analysis.session import SESSION_FILE, BenchmarkSession, split_iterations
+from analysis.stats import SampleStats
+
+
+class FakeBenchmark:
+    OPERATIONS = ('encap', 'decap')
+
+    def __init__(self, variant):
+        self.variant = variant
+
+    def new_metrics(self):
+        return {op: SampleStats() for op in self.OPERATIONS}
+
+    def measure(self, iterations):
+        metrics = self.new_metrics()
+        for op in self.OPERATIONS:
+            metrics[op].add_batch([1.0 if op == 'encap' else 2.0] * iterations)
+        return metrics
+
+    def merge_metrics(self, metrics, other):
+        for op in self.OPERATIONS:
+            metrics[op].merge(other[op])
+        return metrics
+
+    def metrics_to_dict(self, metrics):
+        return {op: metrics[op].to_dict() for op in self.OPERATIONS}
+
+    def metrics_from_dict(self, data):
+        return {op: SampleStats.from_dict(data[op]) for op in self.OPERATIONS}
+
+    def summarize(self, metrics):
+        return {'variant': self.variant, 'count': {op: metrics[op].count for op in self.OPERATIONS},
+                'mean': {op: metrics[op].mean for op in self.OPERATIONS}}
+
+    def add_energy(self, result, domains):
+        result['energy_domains'] = domains
+        return result
+
+
+def fake_factory(spec):
+    return FakeBenchmark(spec['variant'])
+
+
+SPECS = [{'kind': 'kem', 'variant': 'A'}, {'kind': 'kem', 'variant': 'B'}]
+
+
+def test_split_iterations():
+    assert split_iterations(10, 4) == [4, 4, 2]
+    assert split_iterations(8, 4) == [4, 4]
+    assert split_iterations(3, 4) == [3]
+
+
+def test_session_is_sequential_by_default(tmp_path, monkeypatch):
+    session = BenchmarkSession.create('kem', SPECS, 20, fake_factory, 10, session_dir=str(tmp_path))
+    assert session.workers == 1
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("domyślny przebieg nie może uruchamiać procesów roboczych")
+    monkeypatch.setattr('analysis.session.ProcessPoolExecutor', no_pool)
+    results = session.run()
+    assert results[0]['count'] == {'encap': 20, 'decap': 20}
+    with open(os.path.join(session.path, SESSION_FILE)) as f:
+        assert json.load(f)['workers'] == 1
+
+
+def test_session_runs_units_across_workers(tmp_path):
+    session = BenchmarkSession.create('kem', SPECS, 25, fake_factory, 10, session_dir=str(tmp_path))
+    assert len(session.pending_units()) == 6
+
+    results = session.run(workers=2)
+    assert [r['variant'] for r in results] == ['A', 'B']
+    assert results[0]['count'] == {'encap': 25, 'decap': 25}
+    assert results[1]['mean']['decap'] == pytest.approx(2.0)
+    assert session.finished
+    assert BenchmarkSession.unfinished('kem', str(tmp_path)) == []
+    # przebieg równoległy pozostaje oznaczony w stanie sesji (najwyżej tyle procesów, ile rdzeni)
+    assert 1 <= session.workers <= 2
+
+
+def test_session_resumes_only_unfinished_units(tmp_path):
+    session = BenchmarkSession.create('kem', SPECS, 30, fake_factory, 10, session_dir=str(tmp_path))
+    completed = []
+
+    def crash_after_two(variant, metrics, done):
+        completed.append((variant, done))
+        if len(completed) == 2:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        session.run(workers=1, progress=crash_after_two)
+
+    # stan z dysku, tak jak po ponownym uruchomieniu programu
+    paths = BenchmarkSession.unfinished('kem', str(tmp_path))
+    assert paths == [session.path]
+    assert BenchmarkSession.unfinished('sig', str(tmp_path)) == []
+    resumed = BenchmarkSession.load(paths[0], fake_factory)
+    assert len(resumed.pending_units()) == 4
+    assert resumed.done_iterations('A') == 20
+
+    progress = []
+    results = resumed.run(workers=1, progress=lambda variant, metrics, done: progress.append((variant, done)))
+    # najpierw odtworzony postęp z punktu kontrolnego, potem tylko brakujące jednostki
+    assert progress[0] == ('A', 20)
+    assert len(progress) == 1 + 4
+    assert results[0]['count'] == {'encap': 30, 'decap': 30}
+    assert results[1]['count'] == {'encap': 30, 'decap': 30}
+
+    with open(os.path.join(resumed.path, SESSION_FILE)) as f:
+        assert json.load(f)['status'] == 'finished'
+
+
+def test_abandoned_session_is_not_offered_again(tmp_path):
+    session = BenchmarkSession.create('kem', SPECS, 10, fake_factory, 10, session_dir=str(tmp_path))
+    session.abandon()
+    assert BenchmarkSession.unfinished(session_dir=str(tmp_path)) == []
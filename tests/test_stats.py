@@ -0,0 +1,53 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+
+import numpy as np
+import pytest
+from analysis.stats import QuantileSketch, RunningStats, SampleStats, merge_all
+
+
+def test_running_stats_matches_numpy():
+    values = np.random.default_rng(0).lognormal(0, 1, size=5000)
+    stats = RunningStats()
+    for x in values[:1000]:
+        stats.add(x)
+    stats.add_batch(values[1000:])
+
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(np.mean(values))
+    assert stats.variance == pytest.approx(np.var(values, ddof=1))
+    assert stats.min == np.min(values)
+    assert stats.max == np.max(values)
+
+
+def test_sketch_quantiles_within_relative_accuracy():
+    values = np.random.default_rng(1).lognormal(0, 1, size=100000)
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    sketch.add_batch(values)
+
+    for q in (0.5, 0.99, 0.999):
+        exact = np.quantile(values, q)
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+    assert len(sketch.buckets) < 2000
+
+
+def test_merged_worker_stats_equal_global_stats():
+    values = np.random.default_rng(2).exponential(1.0, size=30000)
+    workers = []
+    for chunk in np.array_split(values, 3):
+        stats = SampleStats()
+        stats.add_batch(chunk)
+        # szkice przesyłane między procesami jako JSON, bez surowych próbek
+        workers.append(SampleStats.from_dict(json.loads(json.dumps(stats.to_dict()))))
+
+    merged = merge_all(workers)
+    single = SampleStats()
+    single.add_batch(values)
+
+    assert merged.count == single.count
+    assert merged.mean == pytest.approx(single.mean)
+    assert merged.sketch.buckets == single.sketch.buckets
+    assert merged.summary()['p99'] == single.summary()['p99']
@@ -0,0 +1,65 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from analysis.topology import CpuTopology, cache_sizes, parse_cpu_list
+
+
+def make_sysfs(root, siblings, l3_domains):
+    cpus = sorted(cpu for core in siblings for cpu in core)
+    (root / "online").write_text(f"{cpus[0]}-{cpus[-1]}\n")
+    for core in siblings:
+        for cpu in core:
+            topology = root / f"cpu{cpu}" / "topology"
+            topology.mkdir(parents=True)
+            (topology / "thread_siblings_list").write_text(",".join(map(str, core)) + "\n")
+            for level, shared in ((1, str(cpu)), (2, ",".join(map(str, core))),
+                                  (3, next(d for d in l3_domains if cpu in parse_cpu_list(d)))):
+                index = root / f"cpu{cpu}" / "cache" / f"index{level}"
+                index.mkdir(parents=True)
+                (index / "level").write_text(f"{level}\n")
+                (index / "shared_cpu_list").write_text(shared + "\n")
+    return cpus
+
+
+def test_parse_cpu_list():
+    assert parse_cpu_list("0-3,8,10-11\n") == [0, 1, 2, 3, 8, 10, 11]
+    assert parse_cpu_list("5") == [5]
+
+
+@pytest.fixture
+def topology(tmp_path):
+    # 4 rdzenie po 2 wątki SMT, dwie domeny L3 (jak w dwóch CCX)
+    siblings = [(0, 4), (1, 5), (2, 6), (3, 7)]
+    cpus = make_sysfs(tmp_path, siblings, ["0-1,4-5", "2-3,6-7"])
+    return CpuTopology(root=str(tmp_path), allowed=set(cpus))
+
+
+def test_placements(topology):
+    assert topology.cores() == [(0, 4), (1, 5), (2, 6), (3, 7)]
+    assert topology.placement(4, 'smt') == [0, 4, 1, 5]
+    assert topology.placement(2, 'l3') == [0, 1]
+    assert topology.placement(4, 'spread') == [0, 2, 1, 3]
+    # więcej procesów niż CPU w domenie L3 - zawijamy
+    assert topology.placement(3, 'l3') == [0, 1, 0]
+    with pytest.raises(ValueError):
+        topology.placement(2, 'numa')
+
+
+def test_affinity_mask_limits_topology(tmp_path):
+    make_sysfs(tmp_path, [(0, 2), (1, 3)], ["0-3"])
+    topology = CpuTopology(root=str(tmp_path), allowed={0, 1})
+    assert topology.cores() == [(0,), (1,)]
+    assert topology.placement(2, 'smt') == [0, 1]
+
+
+def test_cache_sizes(tmp_path):
+    for index, (level, kind, size) in enumerate([(1, "Data", "48K"), (1, "Instruction", "32K"),
+                                                  (2, "Unified", "2048K"), (3, "Unified", "32M")]):
+        directory = tmp_path / "cpu0" / "cache" / f"index{index}"
+        directory.mkdir(parents=True)
+        (directory / "level").write_text(f"{level}\n")
+        (directory / "type").write_text(f"{kind}\n")
+        (directory / "size").write_text(f"{size}\n")
+    assert cache_sizes(0, root=str(tmp_path)) == {'L1d': 48 * 1024, 'L2': 2 * 1024 ** 2, 'L3': 32 * 1024 ** 2}
@@ -0,0 +1,61 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from analysis.working_set import (access_order, aligned_buffer, buffer_address, pack_records, record_layout, sweep_rows,
+                                  sweep_sizes)
+
+
+def test_sweep_sizes_log_spaced():
+    assert sweep_sizes(100000, per_decade=1) == [1, 10, 100, 1000, 10000, 100000]
+    sizes = sweep_sizes(100000, per_decade=2)
+    assert sizes[0] == 1 and sizes[-1] == 100000 and len(sizes) == 11
+
+
+def test_record_layout_aligned_to_cache_line():
+    lengths = {'public_key': 1184, 'secret_key': 2400, 'ciphertext': 1088, 'signature': 0}
+    offsets, size = record_layout('decap', lengths)
+    assert offsets == {'secret_key': 0, 'ciphertext': 2400}
+    assert size == 3520 and size % 64 == 0
+    with pytest.raises(ValueError):
+        record_layout('keygen', lengths)
+
+
+def test_pack_records_cycles_pool():
+    pool = [{'secret_key': b'\x01' * 3, 'ciphertext': b'\x02' * 2},
+            {'secret_key': b'\x03' * 3, 'ciphertext': b'\x04' * 2}]
+    offsets, size = record_layout('decap', {'secret_key': 3, 'ciphertext': 2})
+    buffer = pack_records(pool, offsets, size, 3)
+    assert len(buffer) == 3 * size
+    assert buffer[:5] == b'\x01\x01\x01\x02\x02'
+    assert buffer[size:size + 5] == b'\x03\x03\x03\x04\x04'
+    assert buffer[2 * size:2 * size + 5] == b'\x01\x01\x01\x02\x02'
+
+
+def test_pack_records_into_aligned_buffer():
+    pool = [{'secret_key': b'\x01' * 3, 'ciphertext': b'\x02' * 2},
+            {'secret_key': b'\x03' * 3, 'ciphertext': b'\x04' * 2}]
+    offsets, size = record_layout('decap', {'secret_key': 3, 'ciphertext': 2})
+    for count in (1, 5, 1000):
+        buffer, start = aligned_buffer(count * size)
+        base = buffer_address(buffer) + start
+        assert base % 64 == 0
+        assert len(buffer) - start >= count * size
+        pack_records(pool, offsets, size, count, buffer, start)
+        assert bytes(buffer[start:start + count * size]) == bytes(pack_records(pool, offsets, size, count))
+    assert buffer[start + size:start + size + 5] == b'\x03\x03\x03\x04\x04'
+
+
+def test_access_order_uses_every_key_equally():
+    order = access_order(10, 30, seed=1)
+    assert sorted(order[:10]) == list(range(10))
+    assert list(order[10:20]) == list(order[:10])
+
+
+def test_sweep_rows_relative_to_single_key():
+    results = [{'variant': 'Kyber768', 'operation': 'decap', 'points': [
+        {'keys': 1, 'working_set_bytes': 3520, 'p50_ms': 0.02, 'p99_ms': 0.03, 'mean_ms': 0.021},
+        {'keys': 1000, 'working_set_bytes': 3520000, 'p50_ms': 0.03, 'p99_ms': 0.05, 'mean_ms': 0.031}]}]
+    header, rows = sweep_rows(results)
+    assert dict(zip(header, rows[1]))['p50_vs_single'] == pytest.approx(1.5)
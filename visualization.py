@@ -7,15 +7,24 @@ from pathlib import Path
 def ensure_dir(path):
     Path(path).mkdir(parents=True, exist_ok=True)
 
-def plot_operation_times_kyber(figsize=(12, 5)):
+def is_hybrid(variant):
+    # "X25519+Kyber768" zawiera nazwę Kyber, ale nie należy do wykresów samych wariantów Kyber
+    return '+' in variant
+
+def load_kem_results():
     base_dir = "results/kem"
     ensure_dir(base_dir)
 
     json_path = os.path.join(base_dir, "kem_results.json")
     with open(json_path) as f:
-        results = json.load(f)
+        return json.load(f)
+
+
+def plot_operation_times_kyber(figsize=(12, 5), results=None):
+    if results is None:
+        results = load_kem_results()
 
-    kyber_results = [r for r in results if 'Kyber' in r['variant']]
+    kyber_results = [r for r in results if 'Kyber' in r['variant'] and not is_hybrid(r['variant'])]
     variants = [r['variant'] for r in kyber_results]
 
     times = {
@@ -48,16 +57,12 @@ def plot_operation_times_kyber(figsize=(12, 5)):
     return fig
 
 
-def plot_operation_times_bike(figsize=(12, 5)):
-    base_dir = "results/kem"
-    ensure_dir(base_dir)
-
-    json_path = os.path.join(base_dir, "kem_results.json")
-    with open(json_path) as f:
-        results = json.load(f)
+def plot_operation_times_bike(figsize=(12, 5), results=None):
+    if results is None:
+        results = load_kem_results()
 
     # Filtrujemy tylko BIKE
-    bike_results = [r for r in results if 'BIKE' in r['variant'].upper()]
+    bike_results = [r for r in results if 'BIKE' in r['variant'].upper() and not is_hybrid(r['variant'])]
     variants = [r['variant'] for r in bike_results]
 
     times = {
@@ -91,13 +96,9 @@ def plot_operation_times_bike(figsize=(12, 5)):
     return fig
 
 
-def plot_key_sizes(figsize=(12, 5)):
-    base_dir = "results/kem"
-    ensure_dir(base_dir)
-
-    json_path = os.path.join(base_dir, "kem_results.json")
-    with open(json_path) as f:
-        results = json.load(f)
+def plot_key_sizes(figsize=(12, 5), results=None):
+    if results is None:
+        results = load_kem_results()
 
     variants = [r['variant'] for r in results]
 
@@ -132,14 +133,11 @@ def plot_key_sizes(figsize=(12, 5)):
     return fig
 
 
-def plot_total_time_comparison(figsize=(12, 5)):
-    base_dir = "results/kem"
-    ensure_dir(base_dir)
-
-    json_path = os.path.join(base_dir, "kem_results.json")
-    with open(json_path) as f:
-        results = json.load(f)
+def plot_total_time_comparison(figsize=(12, 5), results=None):
+    if results is None:
+        results = load_kem_results()
 
+    results = [r for r in results if 'Kyber' in r['variant'] and not is_hybrid(r['variant'])]
     variants = [r['variant'] for r in results]
     total_times = [r['time_avg']['keygen'] + r['time_avg']['encap'] + r['time_avg']['decap'] for r in results]
 
@@ -161,6 +159,97 @@ def plot_total_time_comparison(figsize=(12, 5)):
     return fig
 
 
+def plot_energy_kem(figsize=(12, 5), results=None):
+    if results is None:
+        results = load_kem_results()
+
+    # tylko warianty zmierzone z licznikami RAPL
+    energy_results = [r for r in results if r.get('energy_avg')]
+    variants = [r['variant'] for r in energy_results]
+
+    energy = {
+        'Key Generation': [r['energy_avg']['keygen'] for r in energy_results],
+        'Encapsulation': [r['energy_avg']['encap'] for r in energy_results],
+        'Decapsulation': [r['energy_avg']['decap'] for r in energy_results]
+    }
+
+    fig, ax = plt.subplots(figsize=figsize)
+
+    x = np.arange(len(variants))
+    width = 0.2
+    multiplier = 0
+
+    for name, measurement in energy.items():
+        offset = width * multiplier
+        bars = ax.bar(x + offset, measurement, width, label=name)
+        for bar, val in zip(bars, measurement):
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2, height + height*0.01, f"{val:.1f} µJ", ha='center', va='bottom', fontsize=9)
+        multiplier += 1
+
+    ax.set_ylabel('Energy per operation (µJ)')
+    ax.set_title('KEM Energy per Operation (RAPL, idle baseline subtracted)')
+    ax.set_xticks(x + width, variants)
+    ax.legend()
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+
+    plt.tight_layout()
+    return fig
+
+
+# klasyczne odniesienie dla współczynników narzutu migracji
+KEM_BASELINE = "X25519"
+SIGNATURE_BASELINE = "Ed25519"
+
+
+def find_baseline(results, key, baseline):
+    # przy porównaniu kilku przebiegów warianty mają dopisany numer przebiegu ("X25519 #3")
+    for r in results:
+        if r[key] == baseline or r[key].startswith(baseline + " #"):
+            return r
+    return None
+
+
+def plot_factors(ax, labels, factors, unit_label):
+    x = np.arange(len(labels))
+    width = 0.8 / len(factors)
+    for i, (name, values) in enumerate(factors.items()):
+        bars = ax.bar(x + width * i, values, width, label=name)
+        for bar, val in zip(bars, values):
+            ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() * 1.05, f"×{val:.2g}", ha='center', va='bottom', fontsize=8)
+    ax.axhline(1.0, color='black', linewidth=1)
+    ax.set_yscale('log')
+    ax.set_ylabel(unit_label)
+    ax.set_xticks(x + width * (len(factors) - 1) / 2, labels)
+    ax.legend()
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+
+
+def plot_migration_overhead_kem(figsize=(12, 5), results=None, baseline=KEM_BASELINE):
+    if results is None:
+        results = load_kem_results()
+
+    base = find_baseline(results, 'variant', baseline)
+    others = [r for r in results if r is not base]
+    variants = [r['variant'] for r in others]
+
+    def transfer(r):
+        return r['size_avg']['public_key'] + r['size_avg']['ciphertext']
+
+    factors = {
+        'Key Generation': [r['time_avg']['keygen'] / base['time_avg']['keygen'] for r in others],
+        'Encapsulation': [r['time_avg']['encap'] / base['time_avg']['encap'] for r in others],
+        'Decapsulation': [r['time_avg']['decap'] / base['time_avg']['decap'] for r in others],
+        'Public key + ciphertext': [transfer(r) / transfer(base) for r in others]
+    }
+
+    fig, ax = plt.subplots(figsize=figsize)
+    plot_factors(ax, variants, factors, f"Factor vs {base['variant']} (log)")
+    ax.set_title(f"Migration overhead relative to {base['variant']}")
+
+    plt.tight_layout()
+    return fig
+
 
 # signature algorithms
 
@@ -270,3 +359,99 @@ def plot_total_times(results, message_size):
         ax.text(bar.get_x() + bar.get_width()/2, height + height*0.01, f"{time:.2f} ms", ha='center', va='bottom', fontsize=9)
 
     return fig
+
+
+def plot_energy_signature(results, message_size):
+    energy_results = [r for r in results if r.get('sign_energy_uj') is not None]
+    algorithms = [r['algorithm'] for r in energy_results]
+
+    energy = {
+        'Keygen': [r['keygen_energy_uj'] for r in energy_results],
+        'Sign': [r['sign_energy_uj'] for r in energy_results],
+        'Verify': [r['verify_energy_uj'] for r in energy_results]
+    }
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    x = np.arange(len(algorithms))
+    width = 0.25
+    for i, (name, measurement) in enumerate(energy.items()):
+        bars = ax.bar(x + width * i, measurement, width, label=name)
+        for bar, val in zip(bars, measurement):
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2, height + height*0.01, f"{val:.1f}", ha='center', va='bottom', fontsize=8)
+
+    ax.set_title(f"Energia na operację (wiadomość: {message_size} bajtów)")
+    ax.set_xlabel("Algorytm")
+    ax.set_ylabel("Energia (µJ)")
+    ax.set_xticks(x + width, algorithms)
+    ax.legend()
+
+    return fig
+
+
+def plot_migration_overhead_signature(results, message_size, baseline=SIGNATURE_BASELINE):
+    base = find_baseline(results, 'algorithm', baseline)
+    others = [r for r in results if r is not base]
+    algorithms = [r['algorithm'] for r in others]
+
+    def transfer(r):
+        return r['public_key_size'] + r['signature_size']
+
+    factors = {
+        'Keygen': [r['keygen_time_ms'] / base['keygen_time_ms'] for r in others],
+        'Sign': [r['avg_sign_time_ms'] / base['avg_sign_time_ms'] for r in others],
+        'Verify': [r['avg_verify_time_ms'] / base['avg_verify_time_ms'] for r in others],
+        'Klucz publiczny + podpis': [transfer(r) / transfer(base) for r in others]
+    }
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    plot_factors(ax, algorithms, factors, f"Krotność względem {base['algorithm']} (log)")
+    ax.set_title(f"Narzut migracji względem {base['algorithm']} (wiadomość: {message_size} bajtów)")
+    ax.set_xlabel("Algorytm")
+
+    return fig
+
+
+# rotacja kluczy
+
+def plot_working_set(results, caches=None):
+    fig, (ax_abs, ax_rel) = plt.subplots(1, 2, figsize=(14, 6))
+
+    for r in results:
+        points = r['points']
+        if not points:
+            continue
+        sizes = [p['working_set_bytes'] / 1024 for p in points]
+        p50 = [p['p50_ms'] for p in points]
+        label = f"{r['variant']} {r['operation']}"
+        line, = ax_abs.plot(sizes, p50, marker='o', label=f"{label} p50")
+        ax_abs.plot(sizes, [p['p99_ms'] for p in points], linestyle='--', color=line.get_color(), alpha=0.6,
+                    label=f"{label} p99")
+        ax_rel.plot(sizes, [v / p50[0] for v in p50], marker='o', color=line.get_color(), label=label)
+
+    # granice pamięci podręcznych - tam spodziewamy się załamań krzywej
+    for name, size in (caches or {}).items():
+        for ax in (ax_abs, ax_rel):
+            ax.axvline(size / 1024, color='gray', linestyle=':', linewidth=1)
+            ax.text(size / 1024, 1.0, f" {name}", transform=ax.get_xaxis_transform(), va='top', fontsize=8,
+                    color='gray')
+
+    ax_abs.set_xscale('log')
+    ax_abs.set_yscale('log')
+    ax_abs.set_title("Opóźnienie a rozmiar zbioru kluczy")
+    ax_abs.set_xlabel("Zbiór roboczy kluczy (KB, log)")
+    ax_abs.set_ylabel("Czas operacji (ms, log)")
+    ax_abs.legend(fontsize=8)
+    ax_abs.grid(linestyle='--', alpha=0.7)
+
+    ax_rel.axhline(1.0, color='black', linewidth=1)
+    ax_rel.set_xscale('log')
+    ax_rel.set_title("Spowolnienie p50 względem jednego klucza")
+    ax_rel.set_xlabel("Zbiór roboczy kluczy (KB, log)")
+    ax_rel.set_ylabel("Krotność")
+    ax_rel.legend(fontsize=8)
+    ax_rel.grid(linestyle='--', alpha=0.7)
+
+    plt.tight_layout()
+    return fig